@@ -4,14 +4,19 @@ Main Analyzer Module
 Coordinates all analysis components to produce complete codebase interpretations.
 """
 
+from __future__ import annotations
+
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Union
 
-from .ast_parser import ASTParser, CodeStructure
-from .symbolic_ontology import SymbolicOntology, SymbolicProfile
-from .motif_detector import MotifDetector, MotifAnalysis
-from .tension_detector import TensionDetector, TensionAnalysis
-from .narrative_synthesizer import NarrativeSynthesizer, InterpretationReport
+# The analysis components are imported when an analyzer is created, so
+# importing the CLI for --help or --version does not load them
+if TYPE_CHECKING:
+    from .ast_parser import CodeStructure
+    from .symbolic_ontology import SymbolicProfile
+    from .motif_detector import MotifAnalysis
+    from .tension_detector import TensionAnalysis
+    from .narrative_synthesizer import InterpretationReport
 
 
 class OneirocodeAnalyzer:
@@ -23,18 +28,27 @@ class OneirocodeAnalyzer:
     tension analysis, and narrative synthesis.
     """
 
-    def __init__(self, llm_enabled: bool = False):
+    def __init__(self, llm_enabled: bool = False,
+                 cache_dir: Optional[Union[str, Path]] = None):
         """
         Initialize the analyzer.
         
         Args:
             llm_enabled: Whether to enable LLM-enhanced interpretation.
                         Disabled by default; requires external API configuration.
+            cache_dir: Optional directory for the persistent parse cache.
+                        Disabled by default.
         """
+        from .ast_parser import ASTParser
+        from .symbolic_ontology import SymbolicOntology
+        from .motif_detector import MotifDetector
+        from .tension_detector import TensionDetector
+        from .narrative_synthesizer import NarrativeSynthesizer
+        
         self.llm_enabled = llm_enabled
         
         # Initialize all components
-        self.parser = ASTParser()
+        self.parser = ASTParser(cache_dir=cache_dir)
         self.ontology = SymbolicOntology()
         self.motif_detector = MotifDetector()
         self.tension_detector = TensionDetector()
@@ -128,16 +142,18 @@ class OneirocodeAnalyzer:
         return self.tensions
 
 
-def analyze_repository(repo_path: str, llm_enabled: bool = False) -> InterpretationReport:
+def analyze_repository(repo_path: str, llm_enabled: bool = False,
+                       cache_dir: Optional[Union[str, Path]] = None) -> InterpretationReport:
     """
     Convenience function to analyze a repository.
     
     Args:
         repo_path: Path to the repository to analyze.
         llm_enabled: Whether to enable LLM-enhanced interpretation.
+        cache_dir: Optional directory for the persistent parse cache.
         
     Returns:
         InterpretationReport containing the complete narrative interpretation.
     """
-    analyzer = OneirocodeAnalyzer(llm_enabled=llm_enabled)
+    analyzer = OneirocodeAnalyzer(llm_enabled=llm_enabled, cache_dir=cache_dir)
     return analyzer.analyze(repo_path)
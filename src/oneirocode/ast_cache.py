@@ -0,0 +1,158 @@
+"""
+AST Cache Module
+
+Persists per-file parse results on disk so unchanged source files are not
+re-parsed and re-walked on subsequent runs. A stat index alongside the
+entries lets files whose modification time, size and inode are unchanged skip
+reading and hashing as well.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from . import __version__
+
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'oneirocode' / 'ast'
+
+# Bump whenever the pickled result classes change shape, so entries written
+# by older code are never unpickled into the new classes.
+CACHE_FORMAT = 3
+
+# Results produced by a different interpreter, package version or cache
+# format may have been extracted with different rules, so all three are
+# folded into every key.
+_KEY_SALT = f"{sys.version_info[:3]}|{__version__}|{CACHE_FORMAT}".encode('utf-8')
+
+# File holding the path -> ((mtime_ns, size, inode), key) stat index. Entry
+# names are hex digests, so this name cannot collide with them.
+_INDEX_NAME = 'stat-index.pkl'
+
+# Entries kept in the stat index; the least recently recorded are dropped
+# first, so paths of deleted files and abandoned checkouts age out
+_INDEX_LIMIT = 50_000
+
+StatIndex = Dict[str, Tuple[Tuple[int, ...], str]]
+
+
+def cache_key(file_path: str, content: bytes) -> str:
+    """Compute the cache key for a source file.
+
+    The path is part of the key because cached patterns record the file
+    they were found in; identical sources at different paths must not
+    share an entry.
+
+    Args:
+        file_path: Path of the source file as reported in patterns.
+        content: Raw bytes of the source file.
+
+    Returns:
+        A hex SHA-256 digest identifying this file version.
+    """
+    digest = hashlib.sha256(_KEY_SALT)
+    digest.update(b'\0')
+    digest.update(file_path.encode('utf-8', 'surrogateescape'))
+    digest.update(b'\0')
+    digest.update(content)
+    return digest.hexdigest()
+
+
+def load_cached(cache_dir: Path, key: str) -> Optional[Any]:
+    """Load a cached parse result.
+
+    Args:
+        cache_dir: Directory holding cache entries.
+        key: Key returned by cache_key().
+
+    Returns:
+        The cached object, or None on a miss or an unreadable entry.
+    """
+    try:
+        with open(cache_dir / f"{key}.pkl", 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        # Corrupt entries can fail with almost any error while unpickling;
+        # the cache is only an optimization, so every failure is a miss.
+        return None
+
+
+def store_cached(cache_dir: Path, key: str, result: Any) -> None:
+    """Store a parse result in the cache.
+
+    The entry is written to a temporary file and renamed into place so
+    concurrent runs never observe a partially written entry. Failures are
+    ignored; the cache is purely an optimization.
+
+    Args:
+        cache_dir: Directory holding cache entries.
+        key: Key returned by cache_key().
+        result: Picklable parse result to store.
+    """
+    _store(cache_dir, f"{key}.pkl", result)
+
+
+def load_index(cache_dir: Path) -> StatIndex:
+    """Load the stat index mapping source paths to their cache keys.
+
+    Args:
+        cache_dir: Directory holding cache entries.
+
+    Returns:
+        The stored index, or an empty one when it is missing, unreadable
+        or was written by a different interpreter, package version or
+        cache format (its keys would then name entries of that format).
+    """
+    try:
+        with open(cache_dir / _INDEX_NAME, 'rb') as f:
+            salt, index = pickle.load(f)
+    except Exception:
+        return {}
+    if salt != _KEY_SALT or not isinstance(index, dict):
+        return {}
+    return index
+
+
+def store_index(cache_dir: Path, index: StatIndex) -> None:
+    """Store the stat index, replacing any previous one atomically.
+
+    Only the most recently inserted entries are kept once the index
+    outgrows its size limit.
+
+    Args:
+        cache_dir: Directory holding cache entries.
+        index: Mapping of absolute source path to ((mtime_ns, size, inode),
+            cache key), oldest entries first.
+    """
+    if len(index) > _INDEX_LIMIT:
+        index = dict(islice(index.items(), len(index) - _INDEX_LIMIT, None))
+    _store(cache_dir, _INDEX_NAME, (_KEY_SALT, index))
+
+
+def _store(cache_dir: Path, name: str, obj: Any) -> None:
+    """Pickle an object into the cache directory via a temporary file.
+
+    Failures are ignored; the cache is purely an optimization.
+
+    Args:
+        cache_dir: Directory holding cache entries.
+        name: File name of the entry inside cache_dir.
+        obj: Picklable object to store.
+    """
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_dir / name)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, pickle.PicklingError):
+        pass
@@ -6,12 +6,89 @@ Parses Python source files and extracts structural patterns for symbolic analysi
 
 import ast
 import os
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
+from functools import partial
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Deque, Iterable, Iterator, Optional, Tuple, Union
 
+from . import ast_cache
 
-@dataclass
+
+_UNPARSE = ast.unparse
+
+# Categorical values shared by every pattern record. Records reference these
+# objects instead of carrying their own copies.
+CATEGORY_FUNCTION = 'function'
+CATEGORY_CLASS = 'class'
+CATEGORY_CONSTANT = 'constant'
+
+ACTION_RETURN = 'return'
+ACTION_RAISE = 'raise'
+
+HANDLER_SUPPRESS = 'suppress'
+HANDLER_RERAISE = 'reraise'
+HANDLER_TRANSFORM = 'transform'
+HANDLER_LOG = 'log'
+HANDLER_HANDLE = 'handle'
+
+PATTERN_NULL_CHECK = 'null_check'
+PATTERN_TYPE_CHECK = 'type_check'
+PATTERN_ASSERTION = 'assertion'
+
+# Common non-source directories that are never descended into
+EXCLUDED_DIRS = frozenset({
+    'venv', '.venv', 'env', '.env', 'node_modules', '__pycache__', '.git',
+    '.tox', 'dist', 'build', 'egg-info', '.eggs',
+})
+
+# Byte sequences without which a file cannot yield any pattern: every
+# extracted construct needs a def, class, try, assert, if, assignment or
+# annotation (the colon of a value-less annotated assignment)
+_STRUCTURE_MARKERS = (b'def', b'class', b'try', b'assert', b'if', b'=', b':')
+
+# Node types checked with type(node) in ...; none of these are subclassed
+_NESTING_TYPES = frozenset({ast.If, ast.For, ast.While, ast.With, ast.Try})
+_FUNCTION_TYPES = frozenset({ast.FunctionDef, ast.AsyncFunctionDef})
+_DEFINITION_TYPES = _FUNCTION_TYPES | {ast.ClassDef}
+
+# Fields that hold nested statements. Control-flow blocks and returns are
+# statements, and expressions never contain statements, so traversals that
+# look for them only need to follow these fields.
+_STATEMENT_FIELDS = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+
+# Node type -> its statement fields in _fields order, filled on first use
+_CHILD_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+# Logger method names whose call marks an exception handler as logging
+_LOG_METHODS = frozenset({'error', 'warning', 'exception', 'info', 'debug'})
+
+# Recognized naming affixes, in priority order: when several apply, the
+# first listed one wins
+NAMING_PREFIXES = (
+    'get_', 'set_', 'is_', 'has_', 'can_', 'do_', 'make_', 'create_',
+    'build_', 'init_', 'validate_', 'check_', 'process_', 'handle_', '_',
+)
+NAMING_SUFFIXES = (
+    '_handler', '_manager', '_factory', '_builder', '_validator',
+    '_processor', '_helper', '_util', '_service', '_controller', '_impl',
+    '_base', '_mixin', '_error', '_exception',
+)
+
+# Every prefix ends at its only underscore and every suffix starts at its
+# only underscore, so a name can match at most one of each: the text up to
+# its first underscore, or from its last one. Looking that slice up in a
+# table replaces trying each affix in turn and returns the shared constant.
+_PREFIX_LOOKUP = {prefix: prefix for prefix in NAMING_PREFIXES}
+_SUFFIX_LOOKUP = {suffix: suffix for suffix in NAMING_SUFFIXES}
+
+
+@dataclass(slots=True, frozen=True)
 class NamingPattern:
     """Represents a naming pattern found in code."""
     name: str
@@ -22,7 +99,7 @@ class NamingPattern:
     suffix: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GuardClause:
     """Represents a guard clause (early return/raise pattern)."""
     file_path: str
@@ -32,7 +109,7 @@ class GuardClause:
     function_name: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ErrorHandler:
     """Represents an error handling block."""
     file_path: str
@@ -40,9 +117,19 @@ class ErrorHandler:
     exception_types: List[str]
     handler_action: str  # 'suppress', 'reraise', 'transform', 'log'
     function_name: str
+    is_broad: bool = field(init=False, repr=False, compare=False)  # catches Exception or BaseException
+    is_suppressing: bool = field(init=False, repr=False, compare=False)  # handler_action is 'suppress'
+
+    def __post_init__(self) -> None:
+        """Derive the precomputed flags from the handler's fields."""
+        object.__setattr__(
+            self, 'is_broad',
+            'Exception' in self.exception_types or 'BaseException' in self.exception_types
+        )
+        object.__setattr__(self, 'is_suppressing', self.handler_action == HANDLER_SUPPRESS)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DefensivePattern:
     """Represents defensive programming patterns."""
     file_path: str
@@ -51,7 +138,7 @@ class DefensivePattern:
     context: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeStructure:
     """Aggregated structural information from a codebase."""
     naming_patterns: List[NamingPattern] = field(default_factory=list)
@@ -66,6 +153,47 @@ class CodeStructure:
     repetition_motifs: Dict[str, int] = field(default_factory=dict)
 
 
+@dataclass(slots=True)
+class ParseResult:
+    """Patterns extracted from a single file, detached from the AST.
+
+    Mirrors the result attributes of ASTVisitor so it can stand in for a
+    visitor during aggregation, and pickles cleanly for the on-disk cache.
+    """
+    naming_patterns: List[NamingPattern] = field(default_factory=list)
+    guard_clauses: List[GuardClause] = field(default_factory=list)
+    error_handlers: List[ErrorHandler] = field(default_factory=list)
+    defensive_patterns: List[DefensivePattern] = field(default_factory=list)
+    function_count: int = 0
+    class_count: int = 0
+    max_nesting_depths: List[int] = field(default_factory=list)
+    structure_signatures: List[str] = field(default_factory=list)
+    line_count: int = 0
+
+    @classmethod
+    def from_visitor(cls, visitor: 'ASTVisitor', line_count: int = 0) -> 'ParseResult':
+        """Capture the extracted patterns of a visitor.
+
+        Args:
+            visitor: An ASTVisitor that has already visited a tree.
+            line_count: Number of lines in the visited source file.
+
+        Returns:
+            A ParseResult holding the visitor's extracted patterns.
+        """
+        return cls(
+            naming_patterns=visitor.naming_patterns,
+            guard_clauses=visitor.guard_clauses,
+            error_handlers=visitor.error_handlers,
+            defensive_patterns=visitor.defensive_patterns,
+            function_count=visitor.function_count,
+            class_count=visitor.class_count,
+            max_nesting_depths=visitor.max_nesting_depths,
+            structure_signatures=visitor.structure_signatures,
+            line_count=line_count,
+        )
+
+
 class ASTVisitor(ast.NodeVisitor):
     """Custom AST visitor for extracting code patterns."""
 
@@ -75,7 +203,8 @@ class ASTVisitor(ast.NodeVisitor):
         Args:
             file_path: Path to the file being visited.
         """
-        self.file_path = file_path
+        # Shared by every record from this file
+        self.file_path = sys.intern(file_path)
         self.naming_patterns: List[NamingPattern] = []
         self.guard_clauses: List[GuardClause] = []
         self.error_handlers: List[ErrorHandler] = []
@@ -86,6 +215,22 @@ class ASTVisitor(ast.NodeVisitor):
         self.nesting_depth = 0
         self.max_nesting_depths: List[int] = []
         self.structure_signatures: List[str] = []
+        self._unparse_cache: Dict[ast.AST, str] = {}
+
+    def _unparse(self, node: ast.AST) -> str:
+        """Unparse a node to source text, memoized per node.
+
+        Args:
+            node: The AST node to render.
+
+        Returns:
+            The source representation of the node.
+        """
+        text = self._unparse_cache.get(node)
+        if text is None:
+            text = _UNPARSE(node)
+            self._unparse_cache[node] = text
+        return text
 
     def _extract_prefix_suffix(self, name: str) -> tuple:
         """Extract common prefixes and suffixes from names.
@@ -97,28 +242,60 @@ class ASTVisitor(ast.NodeVisitor):
             A tuple of (prefix, suffix) where each is either a matched
             string or None if no common prefix/suffix was found.
         """
-        prefixes = ['get_', 'set_', 'is_', 'has_', 'can_', 'do_', 'make_', 
-                    'create_', 'build_', 'init_', 'validate_', 'check_', 
-                    'process_', 'handle_', '_']
-        suffixes = ['_handler', '_manager', '_factory', '_builder', '_validator',
-                    '_processor', '_helper', '_util', '_service', '_controller',
-                    '_impl', '_base', '_mixin', '_error', '_exception']
-        
-        found_prefix = None
-        found_suffix = None
-        
-        for prefix in prefixes:
-            if name.startswith(prefix):
-                found_prefix = prefix
-                break
-        
-        for suffix in suffixes:
-            if name.endswith(suffix):
-                found_suffix = suffix
-                break
+        # Without an underscore the slices are '' and the last character,
+        # neither of which is a known affix
+        found_prefix = _PREFIX_LOOKUP.get(name[:name.find('_') + 1])
+        found_suffix = _SUFFIX_LOOKUP.get(name[name.rfind('_'):])
         
         return found_prefix, found_suffix
 
+    def generic_visit(self, node: ast.AST) -> None:
+        """Visit the children of a node.
+
+        Replaces NodeVisitor's name-based dispatch (a string concatenation
+        and getattr per node) with identity checks on the node type for the
+        handful of node types this visitor cares about. All other nodes are
+        traversed without a method lookup.
+
+        Every visited node type is a statement, and expressions never
+        contain statements, so only the statement fields are followed, in
+        their _fields order; expression subtrees are never entered.
+
+        Args:
+            node: The AST node whose children should be visited.
+        """
+        t = type(node)
+        fields = _CHILD_FIELDS.get(t)
+        if fields is None:
+            fields = _CHILD_FIELDS[t] = tuple(f for f in t._fields if f in _STATEMENT_FIELDS)
+        for name in fields:
+            self._visit_statements(getattr(node, name))
+
+    def _visit_statements(self, children: List[ast.AST]) -> None:
+        """Dispatch each node of a statement list to its visit method.
+
+        Args:
+            children: Nodes of one statement field, in source order.
+        """
+        for child in children:
+            t = type(child)
+            if t is ast.FunctionDef or t is ast.AsyncFunctionDef:
+                self.visit_FunctionDef(child)  # type: ignore
+            elif t is ast.If:
+                self.visit_If(child)  # type: ignore[arg-type]
+            elif t is ast.Assign:
+                self.visit_Assign(child)  # type: ignore[arg-type]
+            elif t is ast.AnnAssign:
+                self.visit_AnnAssign(child)  # type: ignore[arg-type]
+            elif t is ast.Try:
+                self.visit_Try(child)  # type: ignore[arg-type]
+            elif t is ast.ClassDef:
+                self.visit_ClassDef(child)  # type: ignore[arg-type]
+            elif t is ast.Assert:
+                self.visit_Assert(child)  # type: ignore[arg-type]
+            else:
+                self.generic_visit(child)
+
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """Visit a function definition node.
 
@@ -132,7 +309,7 @@ class ASTVisitor(ast.NodeVisitor):
         prefix, suffix = self._extract_prefix_suffix(node.name)
         self.naming_patterns.append(NamingPattern(
             name=node.name,
-            category='function',
+            category=CATEGORY_FUNCTION,
             file_path=self.file_path,
             line_number=node.lineno,
             prefix=prefix,
@@ -174,7 +351,7 @@ class ASTVisitor(ast.NodeVisitor):
         prefix, suffix = self._extract_prefix_suffix(node.name)
         self.naming_patterns.append(NamingPattern(
             name=node.name,
-            category='class',
+            category=CATEGORY_CLASS,
             file_path=self.file_path,
             line_number=node.lineno,
             prefix=prefix,
@@ -182,22 +359,48 @@ class ASTVisitor(ast.NodeVisitor):
         ))
         self.generic_visit(node)
 
-    def visit_Name(self, node: ast.Name) -> None:
-        """Visit a name node to track constant naming patterns.
+    def visit_Assign(self, node: ast.Assign) -> None:
+        """Visit an assignment to track constant naming patterns.
 
         Args:
-            node: The Name AST node to process.
+            node: The Assign AST node to process.
         """
-        # Track variable naming patterns (constants)
-        if node.id.isupper() and len(node.id) > 1:
-            self.naming_patterns.append(NamingPattern(
-                name=node.id,
-                category='constant',
-                file_path=self.file_path,
-                line_number=node.lineno
-            ))
+        for target in node.targets:
+            self._record_constants(target)
         self.generic_visit(node)
 
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+        """Visit an annotated assignment to track constant naming patterns.
+
+        Args:
+            node: The AnnAssign AST node to process.
+        """
+        self._record_constants(node.target)
+        self.generic_visit(node)
+
+    def _record_constants(self, target: ast.expr) -> None:
+        """Record UPPER_CASE names bound by an assignment target.
+
+        Only definitions are recorded, not every later reference, so each
+        constant assignment yields a single pattern.
+
+        Args:
+            target: The assignment target, possibly a tuple or list.
+        """
+        if isinstance(target, ast.Name):
+            if target.id.isupper() and len(target.id) > 1:
+                self.naming_patterns.append(NamingPattern(
+                    name=target.id,
+                    category=CATEGORY_CONSTANT,
+                    file_path=self.file_path,
+                    line_number=target.lineno
+                ))
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            for elt in target.elts:
+                self._record_constants(elt)
+        elif isinstance(target, ast.Starred):
+            self._record_constants(target.value)
+
     def visit_Try(self, node: ast.Try) -> None:
         """Visit a try/except block to extract error handling patterns.
 
@@ -247,8 +450,8 @@ class ASTVisitor(ast.NodeVisitor):
         self.defensive_patterns.append(DefensivePattern(
             file_path=self.file_path,
             line_number=node.lineno,
-            pattern_type='assertion',
-            context=ast.unparse(node.test) if hasattr(ast, 'unparse') else 'assertion'
+            pattern_type=PATTERN_ASSERTION,
+            context=self._unparse(node.test)
         ))
         self.generic_visit(node)
 
@@ -261,28 +464,26 @@ class ASTVisitor(ast.NodeVisitor):
         Args:
             node: The FunctionDef AST node to analyze.
         """
-        for i, stmt in enumerate(node.body[:3]):  # Check first 3 statements
-            if isinstance(stmt, ast.If):
-                # Check if the if body contains early exit
-                for body_stmt in stmt.body:
-                    if isinstance(body_stmt, ast.Return):
-                        condition = ast.unparse(stmt.test) if hasattr(ast, 'unparse') else 'condition'
-                        self.guard_clauses.append(GuardClause(
-                            file_path=self.file_path,
-                            line_number=stmt.lineno,
-                            condition=condition,
-                            action='return',
-                            function_name=node.name
-                        ))
-                    elif isinstance(body_stmt, ast.Raise):
-                        condition = ast.unparse(stmt.test) if hasattr(ast, 'unparse') else 'condition'
-                        self.guard_clauses.append(GuardClause(
-                            file_path=self.file_path,
-                            line_number=stmt.lineno,
-                            condition=condition,
-                            action='raise',
-                            function_name=node.name
-                        ))
+        for stmt in node.body[:3]:  # Check first 3 statements
+            if type(stmt) is not ast.If:
+                continue
+            # Check if the if body contains early exit; one guard per if
+            for body_stmt in stmt.body:
+                t = type(body_stmt)
+                if t is ast.Return:
+                    action = ACTION_RETURN
+                elif t is ast.Raise:
+                    action = ACTION_RAISE
+                else:
+                    continue
+                self.guard_clauses.append(GuardClause(
+                    file_path=self.file_path,
+                    line_number=stmt.lineno,
+                    condition=self._unparse(stmt.test),
+                    action=action,
+                    function_name=node.name
+                ))
+                break
 
     def _check_defensive_patterns(self, node: ast.If) -> None:
         """Identify defensive programming patterns in if statements.
@@ -295,27 +496,28 @@ class ASTVisitor(ast.NodeVisitor):
         """
         condition = node.test
         
-        # Null checks: if x is None, if x is not None, if not x
-        if isinstance(condition, ast.Compare):
-            for op in condition.ops:
-                if isinstance(op, (ast.Is, ast.IsNot)):
-                    for comparator in condition.comparators:
-                        if isinstance(comparator, ast.Constant) and comparator.value is None:
-                            self.defensive_patterns.append(DefensivePattern(
-                                file_path=self.file_path,
-                                line_number=node.lineno,
-                                pattern_type='null_check',
-                                context=ast.unparse(condition) if hasattr(ast, 'unparse') else 'null check'
-                            ))
-        
-        # Type checks: isinstance(x, type)
-        if isinstance(condition, ast.Call):
-            if isinstance(condition.func, ast.Name) and condition.func.id == 'isinstance':
+        if type(condition) is ast.Compare:
+            # Null checks: if x is None, if x is not None
+            for op, comparator in zip(condition.ops, condition.comparators):
+                if (type(op) in (ast.Is, ast.IsNot)
+                        and type(comparator) is ast.Constant
+                        and comparator.value is None):
+                    self.defensive_patterns.append(DefensivePattern(
+                        file_path=self.file_path,
+                        line_number=node.lineno,
+                        pattern_type=PATTERN_NULL_CHECK,
+                        context=self._unparse(condition)
+                    ))
+                    break
+        elif type(condition) is ast.Call:
+            # Type checks: isinstance(x, type)
+            func = condition.func
+            if type(func) is ast.Name and func.id == 'isinstance':
                 self.defensive_patterns.append(DefensivePattern(
                     file_path=self.file_path,
                     line_number=node.lineno,
-                    pattern_type='type_check',
-                    context=ast.unparse(condition) if hasattr(ast, 'unparse') else 'type check'
+                    pattern_type=PATTERN_TYPE_CHECK,
+                    context=self._unparse(condition)
                 ))
 
     def _determine_handler_action(self, handler: ast.ExceptHandler) -> str:
@@ -328,62 +530,58 @@ class ASTVisitor(ast.NodeVisitor):
             A string describing the handler action: 'suppress', 'reraise',
             'transform', 'log', or 'handle'.
         """
-        if not handler.body:
-            return 'suppress'
+        body = handler.body
+        if not body:
+            return HANDLER_SUPPRESS
         
-        for stmt in handler.body:
-            if isinstance(stmt, ast.Raise):
-                if stmt.exc is None:
-                    return 'reraise'
-                return 'transform'
-            if isinstance(stmt, ast.Expr):
-                if isinstance(stmt.value, ast.Call):
-                    if isinstance(stmt.value.func, ast.Attribute):
-                        if stmt.value.func.attr in ('error', 'warning', 'exception', 'info', 'debug'):
-                            return 'log'
+        for stmt in body:
+            if type(stmt) is ast.Raise:
+                return HANDLER_RERAISE if stmt.exc is None else HANDLER_TRANSFORM
+            if type(stmt) is ast.Expr:
+                call = stmt.value
+                if type(call) is ast.Call:
+                    func = call.func
+                    if type(func) is ast.Attribute and func.attr in _LOG_METHODS:
+                        return HANDLER_LOG
         
-        if len(handler.body) == 1 and isinstance(handler.body[0], ast.Pass):
-            return 'suppress'
+        if len(body) == 1 and type(body[0]) is ast.Pass:
+            return HANDLER_SUPPRESS
         
-        return 'handle'
+        return HANDLER_HANDLE
 
-    def _calculate_max_nesting(self, node: ast.AST) -> int:
+    def _calculate_max_nesting(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> int:
         """Calculate maximum nesting depth within a node.
 
+        Walks the subtree once, threading the depth down to each child. The
+        depth of a control-flow block is the number of enclosing blocks and
+        function definitions, counting the root function itself.
+
         Args:
             node: The AST node to analyze for nesting depth.
 
         Returns:
-            The maximum nesting depth found within the node.
+            The maximum nesting depth found within the node, or 0 if it
+            contains no control-flow blocks.
         """
         max_depth = 0
+        stack = [(child, 1) for child in node.body]
         
-        for child in ast.walk(node):
-            if isinstance(child, (ast.If, ast.For, ast.While, ast.With, ast.Try)):
-                depth = self._get_node_depth(child, node)
-                max_depth = max(max_depth, depth)
+        while stack:
+            current, depth = stack.pop()
+            t = type(current)
+            if t in _NESTING_TYPES:
+                if depth > max_depth:
+                    max_depth = depth
+                depth += 1
+            elif t in _FUNCTION_TYPES:
+                depth += 1
+            for name in _STATEMENT_FIELDS:
+                children = getattr(current, name, None)
+                if children:
+                    stack.extend([(child, depth) for child in children])
         
         return max_depth
 
-    def _get_node_depth(self, target: ast.AST, root: ast.AST) -> int:
-        """Get the nesting depth of a node relative to root.
-
-        Args:
-            target: The AST node to find the depth of.
-            root: The root AST node to measure depth from.
-
-        Returns:
-            The nesting depth of target relative to root.
-        """
-        depth = 0
-        for node in ast.walk(root):
-            if node is target:
-                return depth
-            if isinstance(node, (ast.If, ast.For, ast.While, ast.With, ast.Try, 
-                                 ast.FunctionDef, ast.AsyncFunctionDef)):
-                depth += 1
-        return depth
-
     def _create_structure_signature(self, node: ast.FunctionDef) -> str:
         """Create a structural signature for pattern matching.
 
@@ -412,53 +610,322 @@ class ASTVisitor(ast.NodeVisitor):
         parts.append(f"body:{'-'.join(body_types)}")
         
         # Has return
-        has_return = any(isinstance(n, ast.Return) for n in ast.walk(node))
+        has_return = self._contains_return(node)
         parts.append(f"ret:{has_return}")
         
         return '|'.join(parts)
 
+    def _contains_return(self, node: ast.FunctionDef) -> bool:
+        """Check whether a function body contains a return statement.
+
+        Stops at the first return found and does not descend into nested
+        functions or lambdas, whose returns belong to them.
+
+        Args:
+            node: The FunctionDef AST node to scan.
+
+        Returns:
+            True if the function itself returns explicitly.
+        """
+        stack = list(node.body)
+        while stack:
+            current = stack.pop()
+            t = type(current)
+            if t is ast.Return:
+                return True
+            if t in _DEFINITION_TYPES:
+                continue
+            for name in _STATEMENT_FIELDS:
+                children = getattr(current, name, None)
+                if children:
+                    stack.extend(children)
+        return False
+
+
+def _quick_scan(content: bytes) -> bool:
+    """Check whether a source file could contain any extractable pattern.
+
+    A conservative substring test: False only when none of the markers
+    occur anywhere, e.g. for empty or import-only __init__.py files.
+
+    Args:
+        content: Raw bytes of the source file.
+
+    Returns:
+        True if the file needs a full parse.
+    """
+    return any(marker in content for marker in _STRUCTURE_MARKERS)
+
+
+def _count_lines(content: bytes) -> int:
+    """Count lines the way readlines() would.
+
+    Args:
+        content: Raw bytes of the source file.
+
+    Returns:
+        The number of lines, including an unterminated last line.
+    """
+    line_count = content.count(b'\n')
+    if content and not content.endswith(b'\n'):
+        line_count += 1
+    return line_count
+
+
+def _iter_python_files(root: Path) -> Iterator[Path]:
+    """Yield Python files under a directory, pruning excluded directories.
+
+    Excluded directories are skipped before they are read, so large trees
+    such as node_modules cost a single directory entry. Symlinked
+    directories are not followed, and unreadable directories are skipped.
+
+    Args:
+        root: Directory to search.
+
+    Yields:
+        Paths of the .py files found.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in EXCLUDED_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.py') and entry.is_file():
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+
+def _parse_batch_worker(cache_dir: Optional[Path],
+                        files: List[Path]) -> Tuple[List[Optional[ParseResult]], ast_cache.StatIndex]:
+    """Parse a batch of files in a worker process.
+
+    Defined at module level so it can be pickled by ProcessPoolExecutor.
+
+    Args:
+        cache_dir: Cache directory of the dispatching parser, if any.
+        files: Paths of the Python files to parse.
+
+    Returns:
+        One ParseResult (or None for unparseable files) per input file, and
+        the stat index entries recorded for them, for the dispatching
+        parser to merge into its own index.
+    """
+    parser = ASTParser(cache_dir=cache_dir)
+    # The dispatching parser already checked its index for these files
+    parser._stat_index = {}
+    return [parser.parse_file(f) for f in files], parser._index_updates
+
+
+# Files modified this recently may change again within the filesystem's
+# timestamp granularity without changing size, so they are not indexed
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _stat_key(st: os.stat_result) -> Tuple[int, int, int]:
+    """Return the part of a file's stat that the stat index compares."""
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
 
 class ASTParser:
     """Main parser for analyzing Python codebases."""
 
-    def __init__(self):
-        """Initialize the AST parser with an empty code structure."""
+    # Below this many files, process pool startup costs more than it saves
+    PARALLEL_THRESHOLD = 32
+    PARALLEL_CHUNKSIZE = 16
+    # Batches submitted ahead of the consumer, per worker
+    PARALLEL_PREFETCH = 2
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None,
+                 max_workers: Optional[int] = None):
+        """Initialize the AST parser with an empty code structure.
+
+        Args:
+            cache_dir: Optional directory for the persistent parse cache.
+                When set, patterns extracted from each file are stored there
+                keyed on the file's content hash, and unchanged files are
+                loaded from it instead of being parsed again. A stat index
+                kept in the same directory lets files whose modification
+                time, size and inode are unchanged since an earlier run be
+                looked up without being read or hashed.
+            max_workers: Number of worker processes used for large
+                repositories. Defaults to the CPU count; 1 disables
+                parallel parsing.
+        """
         self.structure = CodeStructure()
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        # Absolute path -> ((mtime_ns, size, inode), cache key) of files
+        # already in the cache; loaded from cache_dir on first use
+        self._stat_index: Optional[ast_cache.StatIndex] = None
+        # Entries recorded since the index was last saved
+        self._index_updates: ast_cache.StatIndex = {}
+
+    def parse_source(self, source: bytes, file_path: str) -> Optional[ParseResult]:
+        """Parse Python source that is already in memory.
+
+        The persistent cache is not consulted; parse_file layers it on top
+        of this method.
+
+        Args:
+            source: Raw bytes of the source. The parser decodes them itself,
+                honoring BOMs and coding cookies.
+            file_path: Path reported in the extracted patterns.
+
+        Returns:
+            A ParseResult containing extracted patterns, or None if the
+            source could not be parsed due to syntax or encoding errors.
+        """
+        if not _quick_scan(source):
+            return ParseResult(line_count=_count_lines(source))
 
-    def parse_file(self, file_path: Path) -> Optional[ASTVisitor]:
+        try:
+            tree = ast.parse(source, filename=file_path, type_comments=False)
+        except (SyntaxError, UnicodeDecodeError, ValueError):
+            # Skip sources that can't be parsed
+            return None
+
+        visitor = ASTVisitor(file_path)
+        visitor.visit(tree)
+        # Count on the bytes already in memory
+        return ParseResult.from_visitor(visitor, _count_lines(source))
+
+    def parse_file(self, file_path: Path) -> Optional[ParseResult]:
         """Parse a single Python file.
 
         Args:
             file_path: Path to the Python file to parse.
 
         Returns:
-            An ASTVisitor containing extracted patterns, or None if the
+            A ParseResult containing extracted patterns, or None if the
             file could not be parsed due to syntax or encoding errors.
         """
+        path = str(file_path)
+        index_path = os.path.abspath(path)
+        stat_key = None
+        if self.cache_dir is not None:
+            # Fast path: an unchanged stat reuses the known key
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                return None
+            stat_key = _stat_key(st)
+            cached = self._load_indexed(index_path, stat_key)
+            if cached is not None:
+                return cached
+
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            tree = ast.parse(content, filename=str(file_path))
-            visitor = ASTVisitor(str(file_path))
-            visitor.visit(tree)
-            
-            return visitor
-        except (SyntaxError, UnicodeDecodeError) as e:
-            # Skip files that can't be parsed
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+        except OSError:
             return None
 
-    def parse_repository(self, repo_path: str) -> CodeStructure:
-        """Parse all Python files in a repository.
+        # Sources without any pattern marker are cheaper to scan than to cache
+        if self.cache_dir is None or stat_key is None or not _quick_scan(raw):
+            return self.parse_source(raw, path)
 
-        Recursively finds and parses all Python files, excluding common
-        non-source directories like venv, node_modules, __pycache__, etc.
+        key = ast_cache.cache_key(path, raw)
+        cached = ast_cache.load_cached(self.cache_dir, key)
+        if isinstance(cached, ParseResult):
+            self._record_indexed(index_path, stat_key, key)
+            return cached
+
+        result = self.parse_source(raw, path)
+        if result is not None:
+            ast_cache.store_cached(self.cache_dir, key, result)
+            self._record_indexed(index_path, stat_key, key)
+
+        return result
+
+    def save_index(self) -> None:
+        """Write newly recorded stat index entries back to the cache.
+
+        Entries written meanwhile by other runs sharing the cache directory
+        are kept. The recorded entries become the newest ones, so the
+        index's size limit drops files no run has seen for longest.
+        Repository parses call this when they finish; callers driving
+        parse_file directly may call it themselves.
+        """
+        if self.cache_dir is None or not self._index_updates:
+            return
+        index = ast_cache.load_index(self.cache_dir)
+        for path, entry in self._index_updates.items():
+            index.pop(path, None)
+            index[path] = entry
+        ast_cache.store_index(self.cache_dir, index)
+        self._index_updates = {}
+
+    def _load_indexed(self, path: str, stat_key: Tuple[int, ...]) -> Optional[ParseResult]:
+        """Load a cached result through the stat index.
+
+        Args:
+            path: Absolute path of the source file.
+            stat_key: The file's current (mtime_ns, size, inode).
+
+        Returns:
+            The cached ParseResult when the file is indexed with the same
+            modification time, size and inode and its entry is readable,
+            else None.
+        """
+        if self.cache_dir is None:
+            return None
+        if self._stat_index is None:
+            self._stat_index = ast_cache.load_index(self.cache_dir)
+        indexed = self._stat_index.get(path)
+        if indexed is None or indexed[0] != stat_key:
+            return None
+        cached = ast_cache.load_cached(self.cache_dir, indexed[1])
+        return cached if isinstance(cached, ParseResult) else None
+
+    def _lookup_indexed(self, file_path: Path) -> Optional[ParseResult]:
+        """Stat a file and load its cached result through the stat index.
+
+        Args:
+            file_path: Path to the Python file.
+
+        Returns:
+            The cached ParseResult, or None when the file must be parsed.
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return self._load_indexed(os.path.abspath(file_path), _stat_key(st))
+
+    def _record_indexed(self, path: str, stat_key: Tuple[int, ...], key: str) -> None:
+        """Remember the cache key of a file with the given stat.
+
+        Args:
+            path: Absolute path of the source file.
+            stat_key: The file's (mtime_ns, size, inode) when it was read.
+            key: Cache key of its entry.
+        """
+        if time.time_ns() - stat_key[0] < _RACY_WINDOW_NS:
+            return
+        if self._stat_index is None:
+            self._stat_index = {}
+        self._stat_index[path] = (stat_key, key)
+        self._index_updates[path] = (stat_key, key)
+
+    def iter_repository(self, repo_path: str) -> Iterator[Tuple[Path, Optional[ParseResult]]]:
+        """Parse all Python files in a repository, one file at a time.
+
+        Unlike parse_repository, nothing is aggregated: each file's result
+        is handed to the caller as soon as it is available. Files are
+        discovered lazily and, for large repositories, only a few batches
+        per worker are parsed ahead of the caller, so callers that fold
+        results into their own summaries keep peak memory bounded by a
+        handful of files rather than the whole repository.
 
         Args:
             repo_path: Path to the repository root directory.
 
         Returns:
-            A CodeStructure containing aggregated patterns from all files.
+            An iterator of (file path, ParseResult) pairs in discovery
+            order; the result is None for files that could not be parsed.
 
         Raises:
             FileNotFoundError: If the repository path does not exist.
@@ -468,44 +935,122 @@ class ASTParser:
         if not repo.exists():
             raise FileNotFoundError(f"Repository path not found: {repo_path}")
         
-        python_files = list(repo.rglob("*.py"))
-        
-        # Filter out common non-source directories
-        excluded_dirs = {'venv', '.venv', 'env', '.env', 'node_modules', 
-                        '__pycache__', '.git', '.tox', 'dist', 'build', 
-                        'egg-info', '.eggs'}
-        
-        filtered_files = []
-        for f in python_files:
-            parts = set(f.parts)
-            if not parts.intersection(excluded_dirs):
-                filtered_files.append(f)
+        return self._parse_files(_iter_python_files(repo))
+
+    def parse_repository(self, repo_path: str) -> CodeStructure:
+        """Parse all Python files in a repository.
+
+        Recursively finds and parses all Python files, excluding common
+        non-source directories like venv, node_modules, __pycache__, etc.
+
+        Args:
+            repo_path: Path to the repository root directory.
+
+        Returns:
+            A CodeStructure containing aggregated patterns from all files.
+
+        Raises:
+            FileNotFoundError: If the repository path does not exist.
+        """
+        results = self.iter_repository(repo_path)
         
         self.structure = CodeStructure()
-        all_signatures: List[str] = []
+        repetition_motifs: Counter = Counter()
         
-        for file_path in filtered_files:
-            visitor = self.parse_file(file_path)
-            if visitor:
-                self.structure.naming_patterns.extend(visitor.naming_patterns)
-                self.structure.guard_clauses.extend(visitor.guard_clauses)
-                self.structure.error_handlers.extend(visitor.error_handlers)
-                self.structure.defensive_patterns.extend(visitor.defensive_patterns)
-                self.structure.function_count += visitor.function_count
-                self.structure.class_count += visitor.class_count
-                self.structure.nesting_depths.extend(visitor.max_nesting_depths)
-                all_signatures.extend(visitor.structure_signatures)
-                
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        self.structure.total_lines += len(f.readlines())
-                except:
-                    pass
+        for _, result in results:
+            self.structure.file_count += 1
+            if result:
+                self.structure.naming_patterns.extend(result.naming_patterns)
+                self.structure.guard_clauses.extend(result.guard_clauses)
+                self.structure.error_handlers.extend(result.error_handlers)
+                self.structure.defensive_patterns.extend(result.defensive_patterns)
+                self.structure.function_count += result.function_count
+                self.structure.class_count += result.class_count
+                self.structure.nesting_depths.extend(result.max_nesting_depths)
+                repetition_motifs.update(result.structure_signatures)
+                self.structure.total_lines += result.line_count
         
-        self.structure.file_count = len(filtered_files)
-        
-        # Calculate repetition motifs
-        for sig in all_signatures:
-            self.structure.repetition_motifs[sig] = self.structure.repetition_motifs.get(sig, 0) + 1
+        self.structure.repetition_motifs = repetition_motifs
         
         return self.structure
+
+    def _parse_files(self, files: Iterable[Path]) -> Iterator[Tuple[Path, Optional[ParseResult]]]:
+        """Parse files, fanning out to worker processes for large inputs.
+
+        Files are sent to the pool in batches of PARALLEL_CHUNKSIZE, with
+        at most PARALLEL_PREFETCH batches per worker in flight, so results
+        never pile up faster than the caller consumes them. Files found
+        through the stat index are loaded here and never sent to a worker.
+        Results are yielded in input order so aggregation is identical to
+        a serial run. If a process pool cannot be started (e.g. in a
+        restricted sandbox) or breaks part-way, the remaining files are
+        parsed in the current process. The stat index is saved once the
+        files have been processed.
+
+        Args:
+            files: Python files to parse.
+
+        Yields:
+            (file path, ParseResult) pairs; the result is None for
+            unparseable files.
+        """
+        try:
+            yield from self._parse_files_unsaved(files)
+        finally:
+            self.save_index()
+
+    def _parse_files_unsaved(self, files: Iterable[Path]) -> Iterator[Tuple[Path, Optional[ParseResult]]]:
+        """Parse files as described in _parse_files, without saving the index.
+
+        Args:
+            files: Python files to parse.
+
+        Yields:
+            (file path, ParseResult) pairs in input order.
+        """
+        files = iter(files)
+        head = list(islice(files, self.PARALLEL_THRESHOLD + 1))
+        pending: Deque[List[Path]] = deque()
+        
+        if self.max_workers > 1 and len(head) > self.PARALLEL_THRESHOLD:
+            files = chain(head, files)
+            head = []
+            worker = partial(_parse_batch_worker, self.cache_dir)
+            # Per pending batch: results found in the index (None for files
+            # left to the worker) and the worker's future, if any
+            in_flight: Deque[Tuple[List[Optional[ParseResult]], Optional[Future]]] = deque()
+            limit = self.max_workers * self.PARALLEL_PREFETCH
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                    while True:
+                        while len(pending) < limit:
+                            batch = list(islice(files, self.PARALLEL_CHUNKSIZE))
+                            if not batch:
+                                break
+                            if self.cache_dir is None:
+                                known: List[Optional[ParseResult]] = [None] * len(batch)
+                            else:
+                                known = [self._lookup_indexed(f) for f in batch]
+                            misses = [f for f, r in zip(batch, known) if r is None]
+                            pending.append(batch)
+                            in_flight.append((known, executor.submit(worker, misses) if misses else None))
+                        if not pending:
+                            return
+                        known, future = in_flight[0]
+                        if future is not None:
+                            parsed, entries = future.result()
+                            if entries:
+                                if self._stat_index is None:
+                                    self._stat_index = {}
+                                self._stat_index.update(entries)
+                                self._index_updates.update(entries)
+                            fresh = iter(parsed)
+                            known = [r if r is not None else next(fresh) for r in known]
+                        batch = pending.popleft()
+                        in_flight.popleft()
+                        yield from zip(batch, known)
+            except (OSError, NotImplementedError, BrokenProcessPool):
+                pass
+        
+        for f in chain(head, *pending, files):
+            yield f, self.parse_file(f)
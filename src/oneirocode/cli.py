@@ -11,6 +11,7 @@ from pathlib import Path
 
 from . import __version__
 from .analyzer import OneirocodeAnalyzer
+from .ast_cache import DEFAULT_CACHE_DIR
 
 
 def _ensure_utf8_stdout():
@@ -79,6 +80,21 @@ def create_parser() -> argparse.ArgumentParser:
         help='Enable LLM-enhanced interpretation (requires API configuration)'
     )
     
+    analyze_parser.add_argument(
+        '--cache',
+        action='store_true',
+        default=False,
+        help=f'Cache parse results between runs in {DEFAULT_CACHE_DIR}'
+    )
+    
+    analyze_parser.add_argument(
+        '--cache-dir',
+        type=str,
+        default=None,
+        metavar='DIR',
+        help='Cache parse results between runs in DIR (implies --cache)'
+    )
+    
     analyze_parser.add_argument(
         '--quiet',
         action='store_true',
@@ -101,6 +117,8 @@ def run_analyze(args: argparse.Namespace) -> int:
             - output: Optional output file path (None for stdout).
             - llm: Whether to enable LLM-enhanced interpretation.
             - quiet: Whether to suppress progress messages.
+            - cache: Whether to cache parse results in the default location.
+            - cache_dir: Optional parse cache directory; overrides cache.
 
     Returns:
         int: Exit code (0 for success, 1 for error).
@@ -109,6 +127,9 @@ def run_analyze(args: argparse.Namespace) -> int:
     output_path = args.output
     llm_enabled = args.llm
     quiet = args.quiet
+    cache_dir = getattr(args, 'cache_dir', None)
+    if cache_dir is None and getattr(args, 'cache', False):
+        cache_dir = str(DEFAULT_CACHE_DIR)
     
     # Validate repository path
     path = Path(repo_path)
@@ -127,7 +148,7 @@ def run_analyze(args: argparse.Namespace) -> int:
             print(f"📂 Analyzing: {repo_path}", file=sys.stderr)
             print("", file=sys.stderr)
         
-        analyzer = OneirocodeAnalyzer(llm_enabled=llm_enabled)
+        analyzer = OneirocodeAnalyzer(llm_enabled=llm_enabled, cache_dir=cache_dir)
         
         if not quiet:
             print("🔍 Parsing codebase...", file=sys.stderr)
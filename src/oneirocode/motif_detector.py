@@ -5,14 +5,116 @@ Identifies recurring structural and naming patterns across a codebase,
 assigning symbolic meaning to repetition and rhythm.
 """
 
+import heapq
 from dataclasses import dataclass, field
 from typing import List, Dict, Set, Tuple, Optional
 from collections import Counter
-
-from .ast_parser import CodeStructure, NamingPattern
+from itertools import islice
+from operator import attrgetter
+
+from .ast_parser import CodeStructure
+
+
+# Symbolic meanings for naming patterns
+_NAMING_SYMBOLISM = {
+    # Prefixes
+    'get_': ("Retrieval", "A reaching out to acquire, to bring back what is needed. The code seeks external resources."),
+    'set_': ("Assignment", "An act of establishment, placing value with intention. The code asserts state."),
+    'is_': ("Inquiry", "A question about identity, seeking truth about nature. The code probes existence."),
+    'has_': ("Possession", "A check for ownership, for containing multitudes. The code asks about abundance."),
+    'can_': ("Capability", "A question of potential, of what might be. The code explores possibility."),
+    'do_': ("Action", "A call to motion, to making things happen. The code commands change."),
+    'make_': ("Creation", "The primal act of bringing forth. The code generates new existence."),
+    'create_': ("Genesis", "Deliberate creation, the beginning of something new. The code initiates."),
+    'build_': ("Construction", "Piece by piece assembly with purpose. The code erects structures."),
+    'init_': ("Awakening", "The first breath, the initialization of being. The code brings to consciousness."),
+    'validate_': ("Judgment", "The testing of worth, the examination of validity. The code pronounces verdict."),
+    'check_': ("Vigilance", "The watchful eye, ever-scanning for truth. The code maintains awareness."),
+    'process_': ("Transformation", "The journey through change. The code shepherds data through metamorphosis."),
+    'handle_': ("Stewardship", "The careful management of responsibility. The code accepts duty."),
+    '_': ("Privacy", "The hidden, the internal, the protected from outside gaze. The code guards secrets."),
+    
+    # Suffixes
+    '_handler': ("Responsibility", "One who handles, who takes charge. This pattern accepts the burden of action."),
+    '_manager': ("Authority", "One who manages, who directs. This pattern claims control."),
+    '_factory': ("Production", "A place of making, of systematic creation. This pattern produces."),
+    '_builder': ("Craftsmanship", "One who builds with care and intention. This pattern constructs."),
+    '_validator': ("Judgment", "One who validates, who determines worth. This pattern evaluates."),
+    '_processor': ("Alchemy", "One who transforms through process. This pattern transmutes."),
+    '_helper': ("Service", "One who assists, who supports. This pattern aids."),
+    '_util': ("Utility", "The practical, the useful. This pattern serves function."),
+    '_service': ("Devotion", "One who serves, who provides. This pattern fulfills requests."),
+    '_controller': ("Direction", "One who controls, who guides. This pattern steers."),
+    '_impl': ("Manifestation", "The implementation, the concrete reality. This pattern realizes."),
+    '_base': ("Foundation", "The base upon which others stand. This pattern supports."),
+    '_mixin': ("Blending", "That which blends into others. This pattern shares essence."),
+    '_error': ("Failure", "The acknowledgment of what went wrong. This pattern names problems."),
+    '_exception': ("Interruption", "The breaking of normal flow. This pattern signals disruption."),
+}
+
+# Structural pattern symbolism
+_STRUCTURAL_SYMBOLISM = {
+    'guard_heavy': ("Fortress", "The code has built walls, checking repeatedly before allowing passage."),
+    'try_heavy': ("Anxiety", "The code wraps itself in try blocks, anticipating failure at every turn."),
+    'nested_deep': ("Labyrinth", "The code burrows deep, creating passages within passages."),
+    'flat_simple': ("Prairie", "The code spreads flat and open, simple to traverse."),
+    'function_many': ("Fragmentation", "The code is divided into many small pieces, each with singular purpose."),
+    'function_few': ("Monolith", "The code concentrates power in few large functions."),
+    'class_heavy': ("Society", "The code organizes into classes, creating hierarchies and relationships."),
+    'class_sparse': ("Individualism", "The code favors functions over classes, preferring action to structure."),
+}
+
+
+# Error handling behavior symbolism, keyed by handler action
+_ACTION_MEANINGS = {
+    'suppress': ("The Silencing", "Errors are caught and silenced, their voices muffled. The code prefers peace to truth."),
+    'reraise': ("The Amplification", "Errors are caught and thrown again, their message preserved. The code believes in transparency."),
+    'transform': ("The Translation", "Errors are caught and transformed, their meaning reinterpreted. The code shapes the narrative."),
+    'log': ("The Recording", "Errors are caught and documented, their occurrence noted. The code maintains the record."),
+    'handle': ("The Resolution", "Errors are caught and addressed, their challenge met. The code takes responsibility."),
+}
+
+# Defensive behavior symbolism, keyed by defensive pattern type
+_DEFENSIVE_MEANINGS = {
+    'null_check': ("The Void Watch", "The code vigilantly guards against nothingness, checking for None at every turn."),
+    'type_check': ("The Identity Verification", "The code demands proof of type, questioning the nature of all that enters."),
+    'bounds_check': ("The Boundary Patrol", "The code watches the edges, ensuring nothing exceeds its proper limits."),
+    'assertion': ("The Truth Demand", "The code asserts what must be true, crashing if reality disagrees."),
+}
+
+# Rhythm meanings keyed by (organization, form)
+_RHYTHM_MEANINGS = {
+    ("function-heavy", "short-form"): "The code moves in quick, staccato bursts—many small functions, each a brief note in a rapid melody.",
+    ("function-heavy", "long-form"): "The code flows in long procedural movements, each function a complete movement unto itself.",
+    ("class-heavy", "short-form"): "The code organizes into many small classes with brief methods, a society of specialists.",
+    ("class-heavy", "long-form"): "The code builds large, comprehensive classes, each a world unto itself.",
+    ("balanced", "medium-form"): "The code strikes a balance, mixing classes and functions in measured proportion.",
+    ("procedural", "short-form"): "The code tells its story through many brief functions, eschewing class structure entirely.",
+    ("procedural", "long-form"): "The code moves in long procedural waves, each function a substantial narrative.",
+}
+
+# One bit per motif pattern type, for counting the distinct types present
+_PATTERN_TYPE_BITS = {'structural': 1, 'naming': 2, 'behavioral': 4, 'rhythmic': 8}
+
+
+# Extracts the (file_path, line_number) example location of a pattern
+_location = attrgetter('file_path', 'line_number')
+
+
+def _intensity(value: float, saturation: float) -> float:
+    """Scale a value to an intensity between 0.0 and 1.0.
+
+    Args:
+        value: The non-negative quantity being measured.
+        saturation: The value at which intensity reaches 1.0.
+
+    Returns:
+        value / saturation, capped at 1.0.
+    """
+    return 1.0 if value >= saturation else value / saturation
 
 
-@dataclass
+@dataclass(slots=True)
 class Motif:
     """Represents a detected recurring pattern."""
     name: str
@@ -23,7 +125,7 @@ class Motif:
     intensity: float  # 0.0 to 1.0, based on frequency
 
 
-@dataclass
+@dataclass(slots=True)
 class MotifAnalysis:
     """Complete motif analysis results."""
     motifs: List[Motif] = field(default_factory=list)
@@ -32,6 +134,49 @@ class MotifAnalysis:
     pattern_diversity: float = 0.0
 
 
+@dataclass
+class _StructureStats:
+    """Aggregate statistics of a CodeStructure, gathered in one pass."""
+    guard_count: int = 0
+    error_count: int = 0
+    depth_count: int = 0
+    depth_sum: int = 0
+    deep_count: int = 0  # functions nested deeper than 3
+    action_counts: Counter = field(default_factory=Counter)
+    action_examples: Dict[str, List[Tuple[str, int]]] = field(default_factory=dict)
+
+    @classmethod
+    def from_structure(cls, structure: CodeStructure) -> '_StructureStats':
+        """Collect statistics from a code structure.
+
+        Args:
+            structure: The parsed code structure to summarize.
+
+        Returns:
+            The collected statistics, with up to 5 example locations per
+            error handler action.
+        """
+        stats = cls(
+            guard_count=len(structure.guard_clauses),
+            error_count=len(structure.error_handlers),
+            depth_count=len(structure.nesting_depths),
+        )
+        
+        for depth in structure.nesting_depths:
+            stats.depth_sum += depth
+            if depth > 3:
+                stats.deep_count += 1
+        
+        for handler in structure.error_handlers:
+            action = handler.handler_action
+            stats.action_counts[action] += 1
+            examples = stats.action_examples.setdefault(action, [])
+            if len(examples) < 5:
+                examples.append(_location(handler))
+        
+        return stats
+
+
 class MotifDetector:
     """
     Detects and interprets recurring patterns in code.
@@ -41,60 +186,20 @@ class MotifDetector:
     habits and beliefs of the codebase's creators.
     """
 
-    # Symbolic meanings for naming patterns
-    NAMING_SYMBOLISM = {
-        # Prefixes
-        'get_': ("Retrieval", "A reaching out to acquire, to bring back what is needed. The code seeks external resources."),
-        'set_': ("Assignment", "An act of establishment, placing value with intention. The code asserts state."),
-        'is_': ("Inquiry", "A question about identity, seeking truth about nature. The code probes existence."),
-        'has_': ("Possession", "A check for ownership, for containing multitudes. The code asks about abundance."),
-        'can_': ("Capability", "A question of potential, of what might be. The code explores possibility."),
-        'do_': ("Action", "A call to motion, to making things happen. The code commands change."),
-        'make_': ("Creation", "The primal act of bringing forth. The code generates new existence."),
-        'create_': ("Genesis", "Deliberate creation, the beginning of something new. The code initiates."),
-        'build_': ("Construction", "Piece by piece assembly with purpose. The code erects structures."),
-        'init_': ("Awakening", "The first breath, the initialization of being. The code brings to consciousness."),
-        'validate_': ("Judgment", "The testing of worth, the examination of validity. The code pronounces verdict."),
-        'check_': ("Vigilance", "The watchful eye, ever-scanning for truth. The code maintains awareness."),
-        'process_': ("Transformation", "The journey through change. The code shepherds data through metamorphosis."),
-        'handle_': ("Stewardship", "The careful management of responsibility. The code accepts duty."),
-        '_': ("Privacy", "The hidden, the internal, the protected from outside gaze. The code guards secrets."),
-        
-        # Suffixes
-        '_handler': ("Responsibility", "One who handles, who takes charge. This pattern accepts the burden of action."),
-        '_manager': ("Authority", "One who manages, who directs. This pattern claims control."),
-        '_factory': ("Production", "A place of making, of systematic creation. This pattern produces."),
-        '_builder': ("Craftsmanship", "One who builds with care and intention. This pattern constructs."),
-        '_validator': ("Judgment", "One who validates, who determines worth. This pattern evaluates."),
-        '_processor': ("Alchemy", "One who transforms through process. This pattern transmutes."),
-        '_helper': ("Service", "One who assists, who supports. This pattern aids."),
-        '_util': ("Utility", "The practical, the useful. This pattern serves function."),
-        '_service': ("Devotion", "One who serves, who provides. This pattern fulfills requests."),
-        '_controller': ("Direction", "One who controls, who guides. This pattern steers."),
-        '_impl': ("Manifestation", "The implementation, the concrete reality. This pattern realizes."),
-        '_base': ("Foundation", "The base upon which others stand. This pattern supports."),
-        '_mixin': ("Blending", "That which blends into others. This pattern shares essence."),
-        '_error': ("Failure", "The acknowledgment of what went wrong. This pattern names problems."),
-        '_exception': ("Interruption", "The breaking of normal flow. This pattern signals disruption."),
-    }
-
-    # Structural pattern symbolism
-    STRUCTURAL_SYMBOLISM = {
-        'guard_heavy': ("Fortress", "The code has built walls, checking repeatedly before allowing passage."),
-        'try_heavy': ("Anxiety", "The code wraps itself in try blocks, anticipating failure at every turn."),
-        'nested_deep': ("Labyrinth", "The code burrows deep, creating passages within passages."),
-        'flat_simple': ("Prairie", "The code spreads flat and open, simple to traverse."),
-        'function_many': ("Fragmentation", "The code is divided into many small pieces, each with singular purpose."),
-        'function_few': ("Monolith", "The code concentrates power in few large functions."),
-        'class_heavy': ("Society", "The code organizes into classes, creating hierarchies and relationships."),
-        'class_sparse': ("Individualism", "The code favors functions over classes, preferring action to structure."),
-    }
-
-    def __init__(self):
-        """Initialize the MotifDetector with an empty analysis."""
+    # Symbolism tables; aliases of the module-level constants
+    NAMING_SYMBOLISM = _NAMING_SYMBOLISM
+    STRUCTURAL_SYMBOLISM = _STRUCTURAL_SYMBOLISM
+
+    def __init__(self) -> None:
+        """Initialize the MotifDetector with an empty analysis.
+
+        The analysis attribute holds the result of the most recent detect()
+        call and is not read by detection itself.
+        """
         self.analysis = MotifAnalysis()
 
-    def detect(self, structure: CodeStructure) -> MotifAnalysis:
+    def detect(self, structure: CodeStructure,
+               top_k: Optional[int] = None) -> MotifAnalysis:
         """Perform complete motif detection on code structure.
 
         Analyzes the given code structure to identify naming, structural,
@@ -103,21 +208,35 @@ class MotifDetector:
         Args:
             structure: The parsed code structure containing functions, classes,
                 naming patterns, and other structural elements to analyze.
+            top_k: Keep only this many of the most intense motifs; all motifs
+                are kept when None. Pattern diversity still reflects every
+                detected motif.
 
         Returns:
             A MotifAnalysis object containing all detected motifs, the rhythm
             signature, dominant pattern, and pattern diversity score.
         """
-        self.analysis = MotifAnalysis()
+        if not (structure.function_count or structure.naming_patterns
+                or structure.guard_clauses or structure.error_handlers
+                or structure.defensive_patterns or structure.nesting_depths
+                or structure.repetition_motifs):
+            # Nothing for the sub-detectors to find; only the rhythm
+            # signature depends on the remaining counts
+            _, rhythm_sig = self._detect_rhythmic_patterns(structure)
+            analysis = MotifAnalysis(rhythm_signature=rhythm_sig)
+            self.analysis = analysis
+            return analysis
+        
+        stats = _StructureStats.from_structure(structure)
         
         # Detect naming motifs
         naming_motifs = self._detect_naming_motifs(structure)
         
         # Detect structural motifs
-        structural_motifs = self._detect_structural_motifs(structure)
+        structural_motifs = self._detect_structural_motifs(structure, stats)
         
         # Detect behavioral motifs
-        behavioral_motifs = self._detect_behavioral_motifs(structure)
+        behavioral_motifs = self._detect_behavioral_motifs(structure, stats)
         
         # Detect rhythmic patterns
         rhythmic_motifs, rhythm_sig = self._detect_rhythmic_patterns(structure)
@@ -125,21 +244,27 @@ class MotifDetector:
         # Combine all motifs
         all_motifs = naming_motifs + structural_motifs + behavioral_motifs + rhythmic_motifs
         
-        # Sort by intensity
-        all_motifs.sort(key=lambda m: m.intensity, reverse=True)
-        
-        self.analysis.motifs = all_motifs
-        self.analysis.rhythm_signature = rhythm_sig
-        
-        # Determine dominant pattern
-        if all_motifs:
-            self.analysis.dominant_pattern = all_motifs[0].name
+        # Rank by intensity; a bounded heap avoids sorting every motif when
+        # only the strongest few are wanted
+        if top_k is None:
+            ranked = sorted(all_motifs, key=attrgetter('intensity'), reverse=True)
+        else:
+            ranked = heapq.nlargest(top_k, all_motifs, key=attrgetter('intensity'))
         
         # Calculate diversity
-        pattern_types = set(m.pattern_type for m in all_motifs)
-        self.analysis.pattern_diversity = len(pattern_types) / 4.0  # 4 possible types
+        type_mask = 0
+        for motif in all_motifs:
+            type_mask |= _PATTERN_TYPE_BITS[motif.pattern_type]
+        
+        analysis = MotifAnalysis(
+            motifs=ranked,
+            rhythm_signature=rhythm_sig,
+            dominant_pattern=ranked[0].name if ranked else None,
+            pattern_diversity=type_mask.bit_count() / len(_PATTERN_TYPE_BITS),
+        )
         
-        return self.analysis
+        self.analysis = analysis
+        return analysis
 
     def _detect_naming_motifs(self, structure: CodeStructure) -> List[Motif]:
         """Detect recurring naming patterns in the code structure.
@@ -156,62 +281,69 @@ class MotifDetector:
             (those occurring 3 or more times).
         """
         motifs = []
-        
-        # Count prefix occurrences
-        prefix_counts: Dict[str, List[NamingPattern]] = {}
-        suffix_counts: Dict[str, List[NamingPattern]] = {}
-        
-        for pattern in structure.naming_patterns:
-            if pattern.prefix:
-                if pattern.prefix not in prefix_counts:
-                    prefix_counts[pattern.prefix] = []
-                prefix_counts[pattern.prefix].append(pattern)
-            
-            if pattern.suffix:
-                if pattern.suffix not in suffix_counts:
-                    suffix_counts[pattern.suffix] = []
-                suffix_counts[pattern.suffix].append(pattern)
+        patterns = structure.naming_patterns
+        
+        # Count prefix and suffix occurrences in one pass; examples are
+        # gathered only for the affixes that become motifs
+        prefix_counts: Counter = Counter()
+        suffix_counts: Counter = Counter()
+        for pattern in patterns:
+            prefix = pattern.prefix
+            suffix = pattern.suffix
+            if prefix:
+                prefix_counts[prefix] += 1
+            if suffix:
+                suffix_counts[suffix] += 1
+        
+        # Local bindings for the loops below
+        lookup = _NAMING_SYMBOLISM.get
+        motif_cls = Motif
         
         # Create motifs for significant patterns (3+ occurrences)
-        for prefix, patterns in prefix_counts.items():
-            if len(patterns) >= 3:
-                name, meaning = self.NAMING_SYMBOLISM.get(
-                    prefix, 
-                    (prefix.strip('_').capitalize(), f"A recurring invocation of '{prefix}'")
-                )
+        for prefix, count in prefix_counts.items():
+            if count >= 3:
+                symbolism = lookup(prefix)
+                if symbolism is None:
+                    symbolism = (prefix.strip('_').capitalize(), f"A recurring invocation of '{prefix}'")
+                name, meaning = symbolism
                 
-                intensity = min(1.0, len(patterns) / 20.0)
+                intensity = _intensity(count, 20)
                 
-                motifs.append(Motif(
+                motifs.append(motif_cls(
                     name=f"The {name} Pattern",
                     pattern_type='naming',
-                    occurrences=len(patterns),
+                    occurrences=count,
                     symbolic_meaning=meaning,
-                    examples=[(p.file_path, p.line_number) for p in patterns[:5]],
+                    examples=list(islice(
+                        (_location(p) for p in patterns if p.prefix == prefix), 5
+                    )),
                     intensity=intensity
                 ))
         
-        for suffix, patterns in suffix_counts.items():
-            if len(patterns) >= 3:
-                name, meaning = self.NAMING_SYMBOLISM.get(
-                    suffix,
-                    (suffix.strip('_').capitalize(), f"A recurring manifestation of '{suffix}'")
-                )
+        for suffix, count in suffix_counts.items():
+            if count >= 3:
+                symbolism = lookup(suffix)
+                if symbolism is None:
+                    symbolism = (suffix.strip('_').capitalize(), f"A recurring manifestation of '{suffix}'")
+                name, meaning = symbolism
                 
-                intensity = min(1.0, len(patterns) / 20.0)
+                intensity = _intensity(count, 20)
                 
-                motifs.append(Motif(
+                motifs.append(motif_cls(
                     name=f"The {name} Pattern",
                     pattern_type='naming',
-                    occurrences=len(patterns),
+                    occurrences=count,
                     symbolic_meaning=meaning,
-                    examples=[(p.file_path, p.line_number) for p in patterns[:5]],
+                    examples=list(islice(
+                        (_location(p) for p in patterns if p.suffix == suffix), 5
+                    )),
                     intensity=intensity
                 ))
         
         return motifs
 
-    def _detect_structural_motifs(self, structure: CodeStructure) -> List[Motif]:
+    def _detect_structural_motifs(self, structure: CodeStructure,
+                                  stats: Optional[_StructureStats] = None) -> List[Motif]:
         """Detect recurring structural patterns in the code.
 
         Analyzes repetition motifs, guard clauses, error handlers, and
@@ -221,11 +353,15 @@ class MotifDetector:
         Args:
             structure: The parsed code structure containing guard clauses,
                 error handlers, nesting depths, and repetition information.
+            stats: Precomputed statistics for the structure; computed here
+                when not given.
 
         Returns:
             A list of Motif objects representing significant structural
             patterns found in the code.
         """
+        if stats is None:
+            stats = _StructureStats.from_structure(structure)
         motifs = []
         
         # Analyze repetition motifs
@@ -242,52 +378,52 @@ class MotifDetector:
                 occurrences=total_repetitions,
                 symbolic_meaning="The code returns to familiar forms, finding comfort in known structures. Like a dreamer revisiting the same landscape, these patterns reveal unconscious preferences.",
                 examples=[],
-                intensity=min(1.0, len(significant_repetitions) / 10.0)
+                intensity=_intensity(len(significant_repetitions), 10)
             ))
         
         # Check for guard-heavy pattern
         if structure.function_count > 0:
-            guard_ratio = len(structure.guard_clauses) / structure.function_count
+            guard_ratio = stats.guard_count / structure.function_count
             if guard_ratio > 0.3:
-                name, meaning = self.STRUCTURAL_SYMBOLISM['guard_heavy']
+                name, meaning = _STRUCTURAL_SYMBOLISM['guard_heavy']
                 motifs.append(Motif(
                     name=f"The {name}",
                     pattern_type='structural',
-                    occurrences=len(structure.guard_clauses),
+                    occurrences=stats.guard_count,
                     symbolic_meaning=meaning,
-                    examples=[(g.file_path, g.line_number) for g in structure.guard_clauses[:5]],
-                    intensity=min(1.0, guard_ratio * 2)
+                    examples=list(map(_location, structure.guard_clauses[:5])),
+                    intensity=_intensity(guard_ratio, 0.5)
                 ))
         
         # Check for try-heavy pattern
         if structure.function_count > 0:
-            try_ratio = len(structure.error_handlers) / structure.function_count
+            try_ratio = stats.error_count / structure.function_count
             if try_ratio > 0.3:
-                name, meaning = self.STRUCTURAL_SYMBOLISM['try_heavy']
+                name, meaning = _STRUCTURAL_SYMBOLISM['try_heavy']
                 motifs.append(Motif(
                     name=f"The {name}",
                     pattern_type='structural',
-                    occurrences=len(structure.error_handlers),
+                    occurrences=stats.error_count,
                     symbolic_meaning=meaning,
-                    examples=[(e.file_path, e.line_number) for e in structure.error_handlers[:5]],
-                    intensity=min(1.0, try_ratio * 2)
+                    examples=list(map(_location, structure.error_handlers[:5])),
+                    intensity=_intensity(try_ratio, 0.5)
                 ))
         
         # Check nesting depth patterns
-        if structure.nesting_depths:
-            avg_depth = sum(structure.nesting_depths) / len(structure.nesting_depths)
+        if stats.depth_count:
+            avg_depth = stats.depth_sum / stats.depth_count
             if avg_depth > 3:
-                name, meaning = self.STRUCTURAL_SYMBOLISM['nested_deep']
+                name, meaning = _STRUCTURAL_SYMBOLISM['nested_deep']
                 motifs.append(Motif(
                     name=f"The {name}",
                     pattern_type='structural',
-                    occurrences=len([d for d in structure.nesting_depths if d > 3]),
+                    occurrences=stats.deep_count,
                     symbolic_meaning=meaning,
                     examples=[],
-                    intensity=min(1.0, avg_depth / 5)
+                    intensity=_intensity(avg_depth, 5)
                 ))
             elif avg_depth < 2 and structure.function_count > 5:
-                name, meaning = self.STRUCTURAL_SYMBOLISM['flat_simple']
+                name, meaning = _STRUCTURAL_SYMBOLISM['flat_simple']
                 motifs.append(Motif(
                     name=f"The {name}",
                     pattern_type='structural',
@@ -299,7 +435,8 @@ class MotifDetector:
         
         return motifs
 
-    def _detect_behavioral_motifs(self, structure: CodeStructure) -> List[Motif]:
+    def _detect_behavioral_motifs(self, structure: CodeStructure,
+                                  stats: Optional[_StructureStats] = None) -> List[Motif]:
         """Detect recurring behavioral patterns in error handling and defense.
 
         Analyzes how the code handles errors (suppress, reraise, transform,
@@ -309,68 +446,65 @@ class MotifDetector:
         Args:
             structure: The parsed code structure containing error handlers
                 and defensive patterns to analyze for behavioral trends.
+            stats: Precomputed statistics for the structure; computed here
+                when not given.
 
         Returns:
             A list of Motif objects representing significant behavioral
             patterns (those occurring 3 or more times).
         """
+        if stats is None:
+            stats = _StructureStats.from_structure(structure)
         motifs = []
         
         # Error handling behavior patterns
-        if structure.error_handlers:
-            action_counts = Counter(h.handler_action for h in structure.error_handlers)
+        if stats.error_count:
+            action_counts = stats.action_counts
             
             dominant_action = action_counts.most_common(1)[0] if action_counts else None
             if dominant_action and dominant_action[1] >= 3:
                 action, count = dominant_action
                 
-                action_meanings = {
-                    'suppress': ("The Silencing", "Errors are caught and silenced, their voices muffled. The code prefers peace to truth."),
-                    'reraise': ("The Amplification", "Errors are caught and thrown again, their message preserved. The code believes in transparency."),
-                    'transform': ("The Translation", "Errors are caught and transformed, their meaning reinterpreted. The code shapes the narrative."),
-                    'log': ("The Recording", "Errors are caught and documented, their occurrence noted. The code maintains the record."),
-                    'handle': ("The Resolution", "Errors are caught and addressed, their challenge met. The code takes responsibility."),
-                }
-                
-                name, meaning = action_meanings.get(action, (action.capitalize(), f"A pattern of {action}"))
+                symbolism = _ACTION_MEANINGS.get(action)
+                if symbolism is None:
+                    symbolism = (action.capitalize(), f"A pattern of {action}")
+                name, meaning = symbolism
                 
                 motifs.append(Motif(
                     name=name,
                     pattern_type='behavioral',
                     occurrences=count,
                     symbolic_meaning=meaning,
-                    examples=[(h.file_path, h.line_number) for h in structure.error_handlers 
-                             if h.handler_action == action][:5],
-                    intensity=min(1.0, count / 10)
+                    examples=list(stats.action_examples[action]),
+                    intensity=_intensity(count, 10)
                 ))
         
         # Defensive pattern behavior
         if structure.defensive_patterns:
-            pattern_counts = Counter(p.pattern_type for p in structure.defensive_patterns)
+            pattern_counts = Counter(map(attrgetter('pattern_type'), structure.defensive_patterns))
             
+            # Counts arrive in descending order, so the first rare type ends
+            # the scan
             for pattern_type, count in pattern_counts.most_common():
-                if count >= 3:
-                    pattern_meanings = {
-                        'null_check': ("The Void Watch", "The code vigilantly guards against nothingness, checking for None at every turn."),
-                        'type_check': ("The Identity Verification", "The code demands proof of type, questioning the nature of all that enters."),
-                        'bounds_check': ("The Boundary Patrol", "The code watches the edges, ensuring nothing exceeds its proper limits."),
-                        'assertion': ("The Truth Demand", "The code asserts what must be true, crashing if reality disagrees."),
-                    }
-                    
-                    name, meaning = pattern_meanings.get(
-                        pattern_type, 
-                        (pattern_type.replace('_', ' ').title(), f"A pattern of {pattern_type}")
-                    )
-                    
-                    motifs.append(Motif(
-                        name=name,
-                        pattern_type='behavioral',
-                        occurrences=count,
-                        symbolic_meaning=meaning,
-                        examples=[(p.file_path, p.line_number) for p in structure.defensive_patterns
-                                 if p.pattern_type == pattern_type][:5],
-                        intensity=min(1.0, count / 15)
-                    ))
+                if count < 3:
+                    break
+                
+                symbolism = _DEFENSIVE_MEANINGS.get(pattern_type)
+                if symbolism is None:
+                    symbolism = (pattern_type.replace('_', ' ').title(), f"A pattern of {pattern_type}")
+                name, meaning = symbolism
+                
+                motifs.append(Motif(
+                    name=name,
+                    pattern_type='behavioral',
+                    occurrences=count,
+                    symbolic_meaning=meaning,
+                    examples=list(islice(
+                        (_location(p) for p in structure.defensive_patterns
+                         if p.pattern_type == pattern_type), 5
+                    )),
+                    intensity=_intensity(count, 15)
+                ))
         
         return motifs
 
@@ -391,58 +525,48 @@ class MotifDetector:
                 - A string signature describing the rhythm pattern
                   (e.g., "function-heavy-short-form")
         """
-        motifs = []
-        rhythm_parts = []
+        motifs: List[Motif] = []
         
         # Analyze function-to-class ratio
         if structure.class_count > 0:
             func_class_ratio = structure.function_count / structure.class_count
             if func_class_ratio > 10:
-                rhythm_parts.append("function-heavy")
+                organization = "function-heavy"
             elif func_class_ratio < 3:
-                rhythm_parts.append("class-heavy")
+                organization = "class-heavy"
             else:
-                rhythm_parts.append("balanced")
+                organization = "balanced"
         else:
-            rhythm_parts.append("procedural")
-        
-        # Analyze lines-to-function ratio (average function size)
-        if structure.function_count > 0:
-            avg_function_size = structure.total_lines / structure.function_count
-            if avg_function_size > 50:
-                rhythm_parts.append("long-form")
-            elif avg_function_size < 15:
-                rhythm_parts.append("short-form")
-            else:
-                rhythm_parts.append("medium-form")
+            organization = "procedural"
+        
+        # Analyze lines-to-function ratio (average function size); without
+        # functions the signature is the organization alone
+        if structure.function_count == 0:
+            return motifs, organization
+        
+        avg_function_size = structure.total_lines / structure.function_count
+        if avg_function_size > 50:
+            form = "long-form"
+        elif avg_function_size < 15:
+            form = "short-form"
+        else:
+            form = "medium-form"
         
         # Create rhythm signature
-        rhythm_signature = "-".join(rhythm_parts)
+        rhythm_signature = f"{organization}-{form}"
         
         # Create rhythm motif
-        rhythm_meanings = {
-            "function-heavy-short-form": "The code moves in quick, staccato bursts—many small functions, each a brief note in a rapid melody.",
-            "function-heavy-long-form": "The code flows in long procedural movements, each function a complete movement unto itself.",
-            "class-heavy-short-form": "The code organizes into many small classes with brief methods, a society of specialists.",
-            "class-heavy-long-form": "The code builds large, comprehensive classes, each a world unto itself.",
-            "balanced-medium-form": "The code strikes a balance, mixing classes and functions in measured proportion.",
-            "procedural-short-form": "The code tells its story through many brief functions, eschewing class structure entirely.",
-            "procedural-long-form": "The code moves in long procedural waves, each function a substantial narrative.",
-        }
-        
-        meaning = rhythm_meanings.get(
-            rhythm_signature,
-            f"The code follows a {rhythm_signature} rhythm, its own unique meter."
-        )
-        
-        if structure.function_count > 0:
-            motifs.append(Motif(
-                name="The Rhythm of Structure",
-                pattern_type='rhythmic',
-                occurrences=structure.function_count + structure.class_count,
-                symbolic_meaning=meaning,
-                examples=[],
-                intensity=0.6
-            ))
+        meaning = _RHYTHM_MEANINGS.get((organization, form))
+        if meaning is None:
+            meaning = f"The code follows a {rhythm_signature} rhythm, its own unique meter."
+        
+        motifs.append(Motif(
+            name="The Rhythm of Structure",
+            pattern_type='rhythmic',
+            occurrences=structure.function_count + structure.class_count,
+            symbolic_meaning=meaning,
+            examples=[],
+            intensity=0.6
+        ))
         
         return motifs, rhythm_signature
@@ -320,7 +320,7 @@ What follows is not a technical review but a *symbolic interpretation* — treat
                 profile_text += "**Boundary Orientation:** The code maintains modest boundaries, allowing relatively free passage. "
         
         if structure.error_handlers:
-            suppress_ratio = sum(1 for h in structure.error_handlers if h.handler_action == 'suppress') / len(structure.error_handlers)
+            suppress_ratio = sum(h.is_suppressing for h in structure.error_handlers) / len(structure.error_handlers)
             if suppress_ratio > 0.3:
                 profile_text += "Its relationship with failure is avoidant—preferring not to acknowledge what goes wrong.\n\n"
             else:
@@ -5,11 +5,18 @@ Defines the mapping between code patterns and symbolic archetypes.
 This is the core interpretive framework of Oneirocode.
 """
 
+import heapq
 from dataclasses import dataclass, field
-from typing import List, Dict, Set, Tuple
+from collections import Counter, defaultdict
+from typing import List, Dict, DefaultDict, Optional, Set, Tuple
 from enum import Enum
+from operator import attrgetter, itemgetter
 
-from .ast_parser import CodeStructure, NamingPattern, GuardClause, ErrorHandler, DefensivePattern
+from .ast_parser import (
+    CodeStructure, NamingPattern, GuardClause, ErrorHandler, DefensivePattern,
+    ACTION_RAISE, ACTION_RETURN, HANDLER_SUPPRESS, HANDLER_RERAISE, HANDLER_TRANSFORM,
+    HANDLER_LOG, HANDLER_HANDLE, PATTERN_ASSERTION, PATTERN_NULL_CHECK,
+)
 
 
 class Archetype(Enum):
@@ -54,8 +61,67 @@ class Archetype(Enum):
     MINIMALIST = "minimalist"
     RITUALIST = "ritualist"
 
-
-@dataclass
+    # Members are singletons compared by identity, so the identity hash is
+    # consistent with equality and avoids Enum's Python-level __hash__ on
+    # every score lookup
+    __hash__ = object.__hash__
+
+
+# Naming pattern to archetype mappings
+_NAMING_ARCHETYPES = {
+    # Prefixes
+    'validate_': Archetype.GUARDIAN,
+    'check_': Archetype.SENTINEL,
+    'guard_': Archetype.GATEKEEPER,
+    'ensure_': Archetype.ANXIOUS_CARETAKER,
+    'verify_': Archetype.PERFECTIONIST,
+    'assert_': Archetype.AUTHORITARIAN_GATEKEEPER,
+    'create_': Archetype.BUILDER,
+    'build_': Archetype.ARCHITECT,
+    'make_': Archetype.FACTORY,
+    'get_': Archetype.SERVANT,
+    'fetch_': Archetype.MESSENGER,
+    'handle_': Archetype.HELPER,
+    'process_': Archetype.TRANSFORMER,
+    'transform_': Archetype.ALCHEMIST,
+    'convert_': Archetype.ALCHEMIST,
+    
+    # Suffixes
+    '_handler': Archetype.HELPER,
+    '_manager': Archetype.CONTROLLER,
+    '_controller': Archetype.ORCHESTRATOR,
+    '_factory': Archetype.FACTORY,
+    '_builder': Archetype.BUILDER,
+    '_validator': Archetype.GUARDIAN,
+    '_guard': Archetype.GATEKEEPER,
+    '_service': Archetype.SERVANT,
+    '_helper': Archetype.HELPER,
+    '_util': Archetype.HELPER,
+    '_processor': Archetype.TRANSFORMER,
+}
+
+# Error handling behavior to archetype mappings
+_ERROR_ARCHETYPES = {
+    HANDLER_SUPPRESS: Archetype.SUPPRESSOR,
+    HANDLER_RERAISE: Archetype.MESSENGER,
+    HANDLER_TRANSFORM: Archetype.TRANSFORMER,
+    HANDLER_LOG: Archetype.SENTINEL,
+    HANDLER_HANDLE: Archetype.HELPER,
+}
+
+# Archetype and evidence text for each affix, formatted once rather than
+# per naming pattern
+_PREFIX_RULES = {
+    affix: (archetype, f"Naming pattern with prefix '{affix}'")
+    for affix, archetype in _NAMING_ARCHETYPES.items()
+}
+_SUFFIX_RULES = {
+    affix: (archetype, f"Naming pattern with suffix '{affix}'")
+    for affix, archetype in _NAMING_ARCHETYPES.items()
+}
+
+
+@dataclass(slots=True)
 class ArchetypeMatch:
     """Represents a detected archetype with supporting evidence."""
     archetype: Archetype
@@ -64,7 +130,7 @@ class ArchetypeMatch:
     locations: List[Tuple[str, int]]  # (file_path, line_number)
 
 
-@dataclass 
+@dataclass(slots=True)
 class SymbolicProfile:
     """Complete symbolic profile of a codebase."""
     dominant_archetypes: List[ArchetypeMatch] = field(default_factory=list)
@@ -73,6 +139,60 @@ class SymbolicProfile:
     behavioral_traits: List[str] = field(default_factory=list)
 
 
+@dataclass(slots=True)
+class _ScoreAcc:
+    """Accumulated score and evidence for one archetype during analysis."""
+    # Only the first few entries are ever reported
+    MAX_EVIDENCE = 20
+    MAX_LOCATIONS = 10
+
+    score: float = 0.0
+    evidence: List[str] = field(default_factory=list)
+    evidence_set: Set[str] = field(default_factory=set)  # dedup index for evidence
+    locations: List[Tuple[str, int]] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _Metrics:
+    """Ratios and counts of a CodeStructure shared by several analysis steps."""
+    guard_ratio: float = 0.0  # guard clauses per function
+    defensive_ratio: float = 0.0  # defensive patterns per function
+    avg_nesting: float = 0.0
+    max_nesting: int = 0
+    action_counts: Counter = field(default_factory=Counter)  # per handler action
+    broad_catches: int = 0  # handlers catching Exception or BaseException
+
+    @classmethod
+    def from_structure(cls, structure: CodeStructure) -> '_Metrics':
+        """Compute the ratios for a code structure.
+
+        Args:
+            structure: The parsed code structure to measure.
+
+        Returns:
+            The computed ratios and handler counts; per-function ratios
+            divide by at least 1 and nesting figures are 0 when no depths
+            were recorded.
+        """
+        function_count = max(structure.function_count, 1)
+        metrics = cls(
+            guard_ratio=len(structure.guard_clauses) / function_count,
+            defensive_ratio=len(structure.defensive_patterns) / function_count,
+        )
+        depths = structure.nesting_depths
+        if depths:
+            metrics.avg_nesting = sum(depths) / len(depths)
+            metrics.max_nesting = max(depths)
+        
+        # Count actions and broad catches in one pass
+        action_counts = metrics.action_counts
+        for handler in structure.error_handlers:
+            action_counts[handler.handler_action] += 1
+            if handler.is_broad:
+                metrics.broad_catches += 1
+        return metrics
+
+
 class SymbolicOntology:
     """
     Maps code patterns to symbolic archetypes using deterministic rules.
@@ -84,47 +204,9 @@ class SymbolicOntology:
     - Defensive patterns show relationship with uncertainty
     """
 
-    # Naming pattern to archetype mappings
-    NAMING_ARCHETYPES = {
-        # Prefixes
-        'validate_': Archetype.GUARDIAN,
-        'check_': Archetype.SENTINEL,
-        'guard_': Archetype.GATEKEEPER,
-        'ensure_': Archetype.ANXIOUS_CARETAKER,
-        'verify_': Archetype.PERFECTIONIST,
-        'assert_': Archetype.AUTHORITARIAN_GATEKEEPER,
-        'create_': Archetype.BUILDER,
-        'build_': Archetype.ARCHITECT,
-        'make_': Archetype.FACTORY,
-        'get_': Archetype.SERVANT,
-        'fetch_': Archetype.MESSENGER,
-        'handle_': Archetype.HELPER,
-        'process_': Archetype.TRANSFORMER,
-        'transform_': Archetype.ALCHEMIST,
-        'convert_': Archetype.ALCHEMIST,
-        
-        # Suffixes
-        '_handler': Archetype.HELPER,
-        '_manager': Archetype.CONTROLLER,
-        '_controller': Archetype.ORCHESTRATOR,
-        '_factory': Archetype.FACTORY,
-        '_builder': Archetype.BUILDER,
-        '_validator': Archetype.GUARDIAN,
-        '_guard': Archetype.GATEKEEPER,
-        '_service': Archetype.SERVANT,
-        '_helper': Archetype.HELPER,
-        '_util': Archetype.HELPER,
-        '_processor': Archetype.TRANSFORMER,
-    }
-
-    # Error handling behavior to archetype mappings
-    ERROR_ARCHETYPES = {
-        'suppress': Archetype.SUPPRESSOR,
-        'reraise': Archetype.MESSENGER,
-        'transform': Archetype.TRANSFORMER,
-        'log': Archetype.SENTINEL,
-        'handle': Archetype.HELPER,
-    }
+    # Mapping tables; aliases of the module-level constants
+    NAMING_ARCHETYPES = _NAMING_ARCHETYPES
+    ERROR_ARCHETYPES = _ERROR_ARCHETYPES
 
     # Threshold constants for classification
     GUARD_CLAUSE_ANXIETY_THRESHOLD = 0.3  # Ratio of functions with guards
@@ -132,7 +214,7 @@ class SymbolicOntology:
     ERROR_SUPPRESSION_DENIAL_THRESHOLD = 0.4  # Ratio of suppressed errors
     NESTING_LABYRINTH_THRESHOLD = 4  # Average nesting depth
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the SymbolicOntology with an empty profile."""
         self.profile = SymbolicProfile()
 
@@ -149,52 +231,67 @@ class SymbolicOntology:
         """
         self.profile = SymbolicProfile()
         
-        archetype_scores: Dict[Archetype, Tuple[float, List[str], List[Tuple[str, int]]]] = {}
+        archetype_scores: DefaultDict[Archetype, _ScoreAcc] = defaultdict(_ScoreAcc)
+        metrics = _Metrics.from_structure(structure)
+        
+        # Each phase is skipped when the fields it scores are empty, since
+        # it could not add any score
         
-        # Analyze naming patterns
-        self._analyze_naming_patterns(structure, archetype_scores)
+        # Analyze naming patterns, counting naming themes in the same pass
+        if structure.naming_patterns:
+            theme_counts = self._analyze_naming_patterns(structure, archetype_scores)
+        else:
+            theme_counts = Counter()
         
         # Analyze guard clauses
-        self._analyze_guard_clauses(structure, archetype_scores)
+        if structure.guard_clauses:
+            self._analyze_guard_clauses(structure, archetype_scores, metrics)
         
         # Analyze error handling
-        self._analyze_error_handlers(structure, archetype_scores)
+        if structure.error_handlers:
+            self._analyze_error_handlers(structure, archetype_scores, metrics)
         
         # Analyze defensive patterns
-        self._analyze_defensive_patterns(structure, archetype_scores)
+        if structure.defensive_patterns:
+            self._analyze_defensive_patterns(structure, archetype_scores, metrics)
         
         # Analyze structural complexity
-        self._analyze_structural_complexity(structure, archetype_scores)
-        
-        # Convert scores to matches and sort
-        all_matches = []
-        for archetype, (score, evidence, locations) in archetype_scores.items():
-            if score > 0:
-                normalized_score = min(1.0, score)
-                all_matches.append(ArchetypeMatch(
-                    archetype=archetype,
-                    strength=normalized_score,
-                    evidence=evidence,
-                    locations=locations[:10]  # Limit locations
-                ))
-        
-        all_matches.sort(key=lambda x: x.strength, reverse=True)
+        if structure.nesting_depths or structure.repetition_motifs:
+            self._analyze_structural_complexity(structure, archetype_scores, metrics)
+        
+        # Rank the scored archetypes by normalized strength; only the top 8
+        # are reported, so only those become matches
+        top_scores = heapq.nlargest(
+            8,
+            ((archetype, min(1.0, acc.score), acc)
+             for archetype, acc in archetype_scores.items() if acc.score > 0),
+            key=itemgetter(1)
+        )
+        all_matches = [
+            ArchetypeMatch(
+                archetype=archetype,
+                strength=strength,
+                evidence=acc.evidence,
+                locations=acc.locations
+            )
+            for archetype, strength, acc in top_scores
+        ]
         
         # Split into dominant (top 3) and secondary
         self.profile.dominant_archetypes = all_matches[:3]
         self.profile.secondary_archetypes = all_matches[3:8]
         
         # Extract naming themes
-        self._extract_naming_themes(structure)
+        self._extract_naming_themes(structure, theme_counts)
         
         # Determine behavioral traits
-        self._determine_behavioral_traits(structure)
+        self._determine_behavioral_traits(structure, metrics)
         
         return self.profile
 
     def _add_archetype_score(
         self,
-        scores: Dict[Archetype, Tuple[float, List[str], List[Tuple[str, int]]]],
+        scores: DefaultDict[Archetype, _ScoreAcc],
         archetype: Archetype,
         delta: float,
         evidence: str,
@@ -203,27 +300,29 @@ class SymbolicOntology:
         """Add score to an archetype with supporting evidence.
 
         Args:
-            scores: Dictionary mapping archetypes to their accumulated scores,
-                evidence lists, and source locations.
+            scores: Dictionary mapping archetypes to their score accumulators.
             archetype: The archetype to add score to.
             delta: The score increment to add.
             evidence: Description of the evidence supporting this archetype.
             location: Optional tuple of (file_path, line_number) where the
                 pattern was detected.
+
+        Only the first _ScoreAcc.MAX_EVIDENCE distinct evidence strings and
+        _ScoreAcc.MAX_LOCATIONS locations are kept; the score always grows.
         """
-        if archetype not in scores:
-            scores[archetype] = (0.0, [], [])
-        
-        current_score, current_evidence, current_locations = scores[archetype]
-        new_evidence = current_evidence + [evidence] if evidence not in current_evidence else current_evidence
-        new_locations = current_locations + ([location] if location else [])
-        scores[archetype] = (current_score + delta, new_evidence, new_locations)
+        acc = scores[archetype]
+        acc.score += delta
+        if len(acc.evidence) < acc.MAX_EVIDENCE and evidence not in acc.evidence_set:
+            acc.evidence_set.add(evidence)
+            acc.evidence.append(evidence)
+        if location and len(acc.locations) < acc.MAX_LOCATIONS:
+            acc.locations.append(location)
 
     def _analyze_naming_patterns(
         self, 
         structure: CodeStructure,
-        scores: Dict[Archetype, Tuple[float, List[str], List[Tuple[str, int]]]]
-    ):
+        scores: DefaultDict[Archetype, _ScoreAcc]
+    ) -> Counter:
         """Analyze naming patterns for archetypal significance.
 
         Examines function and variable naming conventions to detect
@@ -233,38 +332,45 @@ class SymbolicOntology:
         Args:
             structure: The parsed code structure containing naming patterns.
             scores: Dictionary to accumulate archetype scores and evidence.
+
+        Returns:
+            Occurrence counts of every prefix and suffix, gathered in the
+            same pass for _extract_naming_themes.
         """
+        # Affixes were already extracted by the parser, so each pattern needs
+        # at most one rule lookup per affix, which also supplies the
+        # preformatted evidence
+        prefix_rule = _PREFIX_RULES.get
+        suffix_rule = _SUFFIX_RULES.get
+        add_score = self._add_archetype_score
+        theme_counts: Counter = Counter()
         for pattern in structure.naming_patterns:
+            prefix = pattern.prefix
+            suffix = pattern.suffix
+            
             # Check prefixes
-            if pattern.prefix and pattern.prefix in self.NAMING_ARCHETYPES:
-                archetype = self.NAMING_ARCHETYPES[pattern.prefix]
-                self._add_archetype_score(
-                    scores, archetype, 0.1,
-                    f"Naming pattern with prefix '{pattern.prefix}'",
-                    (pattern.file_path, pattern.line_number)
-                )
+            if prefix:
+                theme_counts[prefix] += 1
+                rule = prefix_rule(prefix)
+                if rule is not None:
+                    add_score(scores, rule[0], 0.1, rule[1],
+                              (pattern.file_path, pattern.line_number))
             
             # Check suffixes
-            if pattern.suffix and pattern.suffix in self.NAMING_ARCHETYPES:
-                archetype = self.NAMING_ARCHETYPES[pattern.suffix]
-                self._add_archetype_score(
-                    scores, archetype, 0.1,
-                    f"Naming pattern with suffix '{pattern.suffix}'",
-                    (pattern.file_path, pattern.line_number)
-                )
-            
-            # Track naming themes
-            if pattern.prefix:
-                self.profile.naming_themes[pattern.prefix] = \
-                    self.profile.naming_themes.get(pattern.prefix, 0) + 1
-            if pattern.suffix:
-                self.profile.naming_themes[pattern.suffix] = \
-                    self.profile.naming_themes.get(pattern.suffix, 0) + 1
+            if suffix:
+                theme_counts[suffix] += 1
+                rule = suffix_rule(suffix)
+                if rule is not None:
+                    add_score(scores, rule[0], 0.1, rule[1],
+                              (pattern.file_path, pattern.line_number))
+        
+        return theme_counts
 
     def _analyze_guard_clauses(
         self,
         structure: CodeStructure,
-        scores: Dict[Archetype, Tuple[float, List[str], List[Tuple[str, int]]]]
+        scores: DefaultDict[Archetype, _ScoreAcc],
+        metrics: Optional[_Metrics] = None
     ):
         """Analyze guard clauses for boundary-setting patterns.
 
@@ -274,11 +380,15 @@ class SymbolicOntology:
         Args:
             structure: The parsed code structure containing guard clauses.
             scores: Dictionary to accumulate archetype scores and evidence.
+            metrics: Precomputed ratios for the structure; computed here when
+                not given.
         """
         if structure.function_count == 0:
             return
         
-        guard_ratio = len(structure.guard_clauses) / max(structure.function_count, 1)
+        if metrics is None:
+            metrics = _Metrics.from_structure(structure)
+        guard_ratio = metrics.guard_ratio
         
         # High guard clause ratio indicates anxious caretaker
         if guard_ratio > self.GUARD_CLAUSE_ANXIETY_THRESHOLD:
@@ -292,15 +402,16 @@ class SymbolicOntology:
             )
         
         # Analyze specific guard patterns
-        raise_guards = [g for g in structure.guard_clauses if g.action == 'raise']
-        return_guards = [g for g in structure.guard_clauses if g.action == 'return']
+        guard_actions = Counter(map(attrgetter('action'), structure.guard_clauses))
+        raise_guards = guard_actions[ACTION_RAISE]
+        return_guards = guard_actions[ACTION_RETURN]
         
-        if len(raise_guards) > len(return_guards):
+        if raise_guards > return_guards:
             self._add_archetype_score(
                 scores, Archetype.AUTHORITARIAN_GATEKEEPER, 0.2,
                 "Prefers raising exceptions over silent returns"
             )
-        elif len(return_guards) > len(raise_guards):
+        elif return_guards > raise_guards:
             self._add_archetype_score(
                 scores, Archetype.HELPER, 0.2,
                 "Prefers graceful degradation"
@@ -316,7 +427,8 @@ class SymbolicOntology:
     def _analyze_error_handlers(
         self,
         structure: CodeStructure,
-        scores: Dict[Archetype, Tuple[float, List[str], List[Tuple[str, int]]]]
+        scores: DefaultDict[Archetype, _ScoreAcc],
+        metrics: Optional[_Metrics] = None
     ):
         """Analyze error handling for anxiety management patterns.
 
@@ -326,18 +438,21 @@ class SymbolicOntology:
         Args:
             structure: The parsed code structure containing error handlers.
             scores: Dictionary to accumulate archetype scores and evidence.
+            metrics: Precomputed ratios for the structure; computed here when
+                not given.
         """
         if not structure.error_handlers:
             return
         
-        action_counts = {}
-        for handler in structure.error_handlers:
-            action_counts[handler.handler_action] = action_counts.get(handler.handler_action, 0) + 1
+        if metrics is None:
+            metrics = _Metrics.from_structure(structure)
+        action_counts = metrics.action_counts
+        broad_catches = metrics.broad_catches
         
         total_handlers = len(structure.error_handlers)
         
         # Suppression indicates denial
-        suppress_ratio = action_counts.get('suppress', 0) / total_handlers
+        suppress_ratio = action_counts[HANDLER_SUPPRESS] / total_handlers
         if suppress_ratio > self.ERROR_SUPPRESSION_DENIAL_THRESHOLD:
             self._add_archetype_score(
                 scores, Archetype.SUPPRESSOR, 0.4,
@@ -349,9 +464,7 @@ class SymbolicOntology:
             )
         
         # Broad exception catches indicate over-protection
-        broad_catches = [h for h in structure.error_handlers 
-                        if 'Exception' in h.exception_types or 'BaseException' in h.exception_types]
-        if len(broad_catches) > total_handlers * 0.5:
+        if broad_catches > total_handlers * 0.5:
             self._add_archetype_score(
                 scores, Archetype.OVERPROTECTIVE_PARENT, 0.3,
                 "Frequent broad exception catching"
@@ -359,8 +472,8 @@ class SymbolicOntology:
         
         # Map actions to archetypes
         for action, count in action_counts.items():
-            if action in self.ERROR_ARCHETYPES:
-                archetype = self.ERROR_ARCHETYPES[action]
+            archetype = _ERROR_ARCHETYPES.get(action)
+            if archetype is not None:
                 self._add_archetype_score(
                     scores, archetype, count * 0.05,
                     f"Error handling pattern: {action}"
@@ -369,7 +482,8 @@ class SymbolicOntology:
     def _analyze_defensive_patterns(
         self,
         structure: CodeStructure,
-        scores: Dict[Archetype, Tuple[float, List[str], List[Tuple[str, int]]]]
+        scores: DefaultDict[Archetype, _ScoreAcc],
+        metrics: Optional[_Metrics] = None
     ):
         """Analyze defensive patterns for trust and paranoia levels.
 
@@ -379,11 +493,15 @@ class SymbolicOntology:
         Args:
             structure: The parsed code structure containing defensive patterns.
             scores: Dictionary to accumulate archetype scores and evidence.
+            metrics: Precomputed ratios for the structure; computed here when
+                not given.
         """
         if structure.function_count == 0:
             return
         
-        defensive_ratio = len(structure.defensive_patterns) / max(structure.function_count, 1)
+        if metrics is None:
+            metrics = _Metrics.from_structure(structure)
+        defensive_ratio = metrics.defensive_ratio
         
         if defensive_ratio > self.DEFENSIVE_PATTERN_PARANOIA_THRESHOLD:
             self._add_archetype_score(
@@ -396,17 +514,15 @@ class SymbolicOntology:
             )
         
         # Analyze pattern types
-        pattern_types = {}
-        for pattern in structure.defensive_patterns:
-            pattern_types[pattern.pattern_type] = pattern_types.get(pattern.pattern_type, 0) + 1
+        pattern_types = Counter(map(attrgetter('pattern_type'), structure.defensive_patterns))
         
-        if pattern_types.get('assertion', 0) > 5:
+        if pattern_types[PATTERN_ASSERTION] > 5:
             self._add_archetype_score(
                 scores, Archetype.AUTHORITARIAN_GATEKEEPER, 0.2,
                 "Heavy use of assertions"
             )
         
-        if pattern_types.get('null_check', 0) > 10:
+        if pattern_types[PATTERN_NULL_CHECK] > 10:
             self._add_archetype_score(
                 scores, Archetype.SENTINEL, 0.2,
                 "Vigilant null checking"
@@ -415,7 +531,8 @@ class SymbolicOntology:
     def _analyze_structural_complexity(
         self,
         structure: CodeStructure,
-        scores: Dict[Archetype, Tuple[float, List[str], List[Tuple[str, int]]]]
+        scores: DefaultDict[Archetype, _ScoreAcc],
+        metrics: Optional[_Metrics] = None
     ):
         """Analyze structural complexity for maze or simplicity patterns.
 
@@ -425,10 +542,14 @@ class SymbolicOntology:
         Args:
             structure: The parsed code structure with nesting and repetition data.
             scores: Dictionary to accumulate archetype scores and evidence.
+            metrics: Precomputed ratios for the structure; computed here when
+                not given.
         """
         if structure.nesting_depths:
-            avg_nesting = sum(structure.nesting_depths) / len(structure.nesting_depths)
-            max_nesting = max(structure.nesting_depths) if structure.nesting_depths else 0
+            if metrics is None:
+                metrics = _Metrics.from_structure(structure)
+            avg_nesting = metrics.avg_nesting
+            max_nesting = metrics.max_nesting
             
             if avg_nesting > self.NESTING_LABYRINTH_THRESHOLD:
                 self._add_archetype_score(
@@ -457,7 +578,8 @@ class SymbolicOntology:
                     f"Many repeated structural patterns ({len(repeated_patterns)})"
                 )
 
-    def _extract_naming_themes(self, structure: CodeStructure):
+    def _extract_naming_themes(self, structure: CodeStructure,
+                               theme_counts: Optional[Counter] = None):
         """Extract dominant naming themes from patterns.
 
         Aggregates prefixes and suffixes from naming patterns to identify
@@ -465,20 +587,22 @@ class SymbolicOntology:
 
         Args:
             structure: The parsed code structure containing naming patterns.
+            theme_counts: Prefix and suffix counts already gathered from the
+                naming patterns; counted here when not given.
         """
-        theme_counts: Dict[str, int] = {}
-        
-        for pattern in structure.naming_patterns:
-            if pattern.prefix:
-                theme_counts[pattern.prefix] = theme_counts.get(pattern.prefix, 0) + 1
-            if pattern.suffix:
-                theme_counts[pattern.suffix] = theme_counts.get(pattern.suffix, 0) + 1
+        if theme_counts is None:
+            theme_counts = Counter()
+            for pattern in structure.naming_patterns:
+                if pattern.prefix:
+                    theme_counts[pattern.prefix] += 1
+                if pattern.suffix:
+                    theme_counts[pattern.suffix] += 1
         
         # Keep top themes
-        sorted_themes = sorted(theme_counts.items(), key=lambda x: x[1], reverse=True)
-        self.profile.naming_themes = dict(sorted_themes[:10])
+        self.profile.naming_themes = dict(theme_counts.most_common(10))
 
-    def _determine_behavioral_traits(self, structure: CodeStructure):
+    def _determine_behavioral_traits(self, structure: CodeStructure,
+                                     metrics: Optional[_Metrics] = None):
         """Determine high-level behavioral traits from code patterns.
 
         Synthesizes analysis results into descriptive traits like
@@ -486,12 +610,16 @@ class SymbolicOntology:
 
         Args:
             structure: The parsed code structure to analyze for traits.
+            metrics: Precomputed ratios for the structure; computed here when
+                not given.
         """
+        if metrics is None:
+            metrics = _Metrics.from_structure(structure)
         traits = []
         
         # Error handling behavior
         if structure.error_handlers:
-            suppress_count = sum(1 for h in structure.error_handlers if h.handler_action == 'suppress')
+            suppress_count = metrics.action_counts[HANDLER_SUPPRESS]
             if suppress_count > len(structure.error_handlers) * 0.3:
                 traits.append("Error-avoidant")
             elif suppress_count < len(structure.error_handlers) * 0.1:
@@ -499,7 +627,7 @@ class SymbolicOntology:
         
         # Defensive posture
         if structure.function_count > 0:
-            defensive_ratio = len(structure.defensive_patterns) / structure.function_count
+            defensive_ratio = metrics.defensive_ratio
             if defensive_ratio > 0.5:
                 traits.append("Hyper-vigilant")
             elif defensive_ratio < 0.1:
@@ -507,7 +635,7 @@ class SymbolicOntology:
         
         # Guard clause behavior
         if structure.function_count > 0:
-            guard_ratio = len(structure.guard_clauses) / structure.function_count
+            guard_ratio = metrics.guard_ratio
             if guard_ratio > 0.4:
                 traits.append("Boundary-focused")
             elif guard_ratio < 0.1:
@@ -515,7 +643,7 @@ class SymbolicOntology:
         
         # Structural traits
         if structure.nesting_depths:
-            avg_nesting = sum(structure.nesting_depths) / len(structure.nesting_depths)
+            avg_nesting = metrics.avg_nesting
             if avg_nesting > 3:
                 traits.append("Complexity-embracing")
             elif avg_nesting < 1.5:
@@ -524,6 +652,56 @@ class SymbolicOntology:
         self.profile.behavioral_traits = traits
 
 
+# Symbolic descriptions of each archetype
+_ARCHETYPE_DESCRIPTIONS = {
+    Archetype.GUARDIAN: "The Guardian stands at the threshold, ensuring only the worthy may pass. This code expresses a protective instinct, validating and verifying before proceeding.",
+    
+    Archetype.SENTINEL: "The Sentinel watches ever-vigilant, logging and monitoring all that transpires. This code maintains awareness, recording the flow of data and events.",
+    
+    Archetype.GATEKEEPER: "The Gatekeeper controls access with strict conditions. This code establishes clear boundaries, turning away that which does not meet its criteria.",
+    
+    Archetype.AUTHORITARIAN_GATEKEEPER: "The Authoritarian Gatekeeper rules with an iron fist, raising exceptions without mercy. This code tolerates no deviation from its expectations.",
+    
+    Archetype.CONTROLLER: "The Controller seeks to manage and direct all aspects of the system. This code expresses a need for order and coordination.",
+    
+    Archetype.ORCHESTRATOR: "The Orchestrator conducts the symphony of components, ensuring harmony. This code coordinates complex interactions with careful timing.",
+    
+    Archetype.ANXIOUS_CARETAKER: "The Anxious Caretaker worries endlessly, checking and rechecking. This code reveals deep concern about what might go wrong.",
+    
+    Archetype.PERFECTIONIST: "The Perfectionist accepts nothing less than flawless input. This code strives for correctness through exhaustive validation.",
+    
+    Archetype.OVERPROTECTIVE_PARENT: "The Overprotective Parent shields from all harm, catching every exception. This code wraps everything in safety, perhaps too much.",
+    
+    Archetype.BUILDER: "The Builder creates new structures with purpose. This code is generative, bringing new entities into existence.",
+    
+    Archetype.FACTORY: "The Factory produces instances according to established patterns. This code embodies creation through standardized processes.",
+    
+    Archetype.ARCHITECT: "The Architect designs grand structures with vision. This code establishes foundations and frameworks for others to build upon.",
+    
+    Archetype.HELPER: "The Helper serves without ego, providing utility to others. This code exists to support and assist, asking nothing in return.",
+    
+    Archetype.SERVANT: "The Servant responds to requests with diligence. This code fetches and retrieves, mediating between systems.",
+    
+    Archetype.MESSENGER: "The Messenger carries information between realms. This code transmits and propagates, ensuring signals reach their destination.",
+    
+    Archetype.SUPPRESSOR: "The Suppressor silences errors, burying them in darkness. This code hides problems rather than confronting them.",
+    
+    Archetype.DENIER: "The Denier refuses to acknowledge what has occurred. This code pretends exceptions never happened.",
+    
+    Archetype.ABANDONER: "The Abandoner leaves tasks unfinished, paths unexplored. This code starts journeys it does not complete.",
+    
+    Archetype.TRANSFORMER: "The Transformer changes one form into another. This code is alchemical, transmuting data through its processes.",
+    
+    Archetype.ALCHEMIST: "The Alchemist works mysterious conversions. This code transforms the base into something precious.",
+    
+    Archetype.LABYRINTH_DWELLER: "The Labyrinth Dweller thrives in complexity, creating nested passages. This code embraces deep structures that challenge navigation.",
+    
+    Archetype.MINIMALIST: "The Minimalist achieves with economy, using only what is needed. This code expresses elegance through simplicity.",
+    
+    Archetype.RITUALIST: "The Ritualist repeats patterns with devotion. This code follows established ceremonies, finding meaning in repetition.",
+}
+
+
 def get_archetype_description(archetype: Archetype) -> str:
     """Get a symbolic description for an archetype.
 
@@ -534,51 +712,4 @@ def get_archetype_description(archetype: Archetype) -> str:
         A poetic, interpretive description of the archetype's meaning
         and psychological significance in code.
     """
-    descriptions = {
-        Archetype.GUARDIAN: "The Guardian stands at the threshold, ensuring only the worthy may pass. This code expresses a protective instinct, validating and verifying before proceeding.",
-        
-        Archetype.SENTINEL: "The Sentinel watches ever-vigilant, logging and monitoring all that transpires. This code maintains awareness, recording the flow of data and events.",
-        
-        Archetype.GATEKEEPER: "The Gatekeeper controls access with strict conditions. This code establishes clear boundaries, turning away that which does not meet its criteria.",
-        
-        Archetype.AUTHORITARIAN_GATEKEEPER: "The Authoritarian Gatekeeper rules with an iron fist, raising exceptions without mercy. This code tolerates no deviation from its expectations.",
-        
-        Archetype.CONTROLLER: "The Controller seeks to manage and direct all aspects of the system. This code expresses a need for order and coordination.",
-        
-        Archetype.ORCHESTRATOR: "The Orchestrator conducts the symphony of components, ensuring harmony. This code coordinates complex interactions with careful timing.",
-        
-        Archetype.ANXIOUS_CARETAKER: "The Anxious Caretaker worries endlessly, checking and rechecking. This code reveals deep concern about what might go wrong.",
-        
-        Archetype.PERFECTIONIST: "The Perfectionist accepts nothing less than flawless input. This code strives for correctness through exhaustive validation.",
-        
-        Archetype.OVERPROTECTIVE_PARENT: "The Overprotective Parent shields from all harm, catching every exception. This code wraps everything in safety, perhaps too much.",
-        
-        Archetype.BUILDER: "The Builder creates new structures with purpose. This code is generative, bringing new entities into existence.",
-        
-        Archetype.FACTORY: "The Factory produces instances according to established patterns. This code embodies creation through standardized processes.",
-        
-        Archetype.ARCHITECT: "The Architect designs grand structures with vision. This code establishes foundations and frameworks for others to build upon.",
-        
-        Archetype.HELPER: "The Helper serves without ego, providing utility to others. This code exists to support and assist, asking nothing in return.",
-        
-        Archetype.SERVANT: "The Servant responds to requests with diligence. This code fetches and retrieves, mediating between systems.",
-        
-        Archetype.MESSENGER: "The Messenger carries information between realms. This code transmits and propagates, ensuring signals reach their destination.",
-        
-        Archetype.SUPPRESSOR: "The Suppressor silences errors, burying them in darkness. This code hides problems rather than confronting them.",
-        
-        Archetype.DENIER: "The Denier refuses to acknowledge what has occurred. This code pretends exceptions never happened.",
-        
-        Archetype.ABANDONER: "The Abandoner leaves tasks unfinished, paths unexplored. This code starts journeys it does not complete.",
-        
-        Archetype.TRANSFORMER: "The Transformer changes one form into another. This code is alchemical, transmuting data through its processes.",
-        
-        Archetype.ALCHEMIST: "The Alchemist works mysterious conversions. This code transforms the base into something precious.",
-        
-        Archetype.LABYRINTH_DWELLER: "The Labyrinth Dweller thrives in complexity, creating nested passages. This code embraces deep structures that challenge navigation.",
-        
-        Archetype.MINIMALIST: "The Minimalist achieves with economy, using only what is needed. This code expresses elegance through simplicity.",
-        
-        Archetype.RITUALIST: "The Ritualist repeats patterns with devotion. This code follows established ceremonies, finding meaning in repetition.",
-    }
-    return descriptions.get(archetype, "An undefined archetype awaiting interpretation.")
+    return _ARCHETYPE_DESCRIPTIONS.get(archetype, "An undefined archetype awaiting interpretation.")
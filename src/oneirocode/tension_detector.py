@@ -5,14 +5,34 @@ Identifies contradictions and unresolved tensions in code structure.
 These tensions represent the psychic conflicts within the codebase.
 """
 
+import re
 from dataclasses import dataclass, field
 from typing import List, Dict, Set, Tuple, Optional
 from collections import defaultdict
+from operator import attrgetter
 
 from .ast_parser import CodeStructure, NamingPattern, GuardClause, ErrorHandler, DefensivePattern
 
 
-@dataclass
+# Name fragments that mark work in progress, matched case-insensitively in one search
+_WIP_INDICATORS = ('todo', 'fixme', 'hack', 'temp', 'tmp', 'test_', 'debug')
+_WIP_RX = re.compile('|'.join(map(re.escape, _WIP_INDICATORS)), re.IGNORECASE)
+
+_severity = attrgetter('severity')
+
+# Resolution suggestion for each tension type, filled with the tension name
+_RESOLUTION_TEMPLATES = {
+    'contradiction': "The '%s' calls for integration—reconciling opposing impulses into coherent intention.",
+    'abandonment': "The '%s' whispers of unfinished business—commitments waiting to be honored or consciously released.",
+    'over_engineering': "The '%s' suggests learning to trust—releasing some armor, allowing vulnerability.",
+    'under_engineering': "The '%s' invites greater care—building structures to support future growth.",
+}
+
+# Nesting depths beyond this many levels count as very deep
+_DEEP_NESTING = 5
+
+
+@dataclass(slots=True)
 class Tension:
     """Represents a detected tension or contradiction."""
     name: str
@@ -23,7 +43,7 @@ class Tension:
     locations: List[Tuple[str, int]]
 
 
-@dataclass
+@dataclass(slots=True)
 class TensionAnalysis:
     """Complete tension analysis results."""
     tensions: List[Tension] = field(default_factory=list)
@@ -32,6 +52,39 @@ class TensionAnalysis:
     resolution_suggestions: List[str] = field(default_factory=list)
 
 
+@dataclass(slots=True)
+class _TensionSummary:
+    """Aggregates of a CodeStructure shared by the tension detectors."""
+    suppress_handlers: List[ErrorHandler] = field(default_factory=list)
+    broad_count: int = 0  # handlers catching Exception or BaseException
+    wip_patterns: List[NamingPattern] = field(default_factory=list)
+    deep_nesting_count: int = 0  # nesting depths beyond _DEEP_NESTING
+
+    @classmethod
+    def from_structure(cls, structure: CodeStructure) -> '_TensionSummary':
+        """Summarize the error handlers of a code structure.
+
+        Args:
+            structure: The parsed code structure to summarize.
+
+        Returns:
+            The collected summary.
+        """
+        summary = cls()
+        suppress_append = summary.suppress_handlers.append
+        broad_count = 0
+        for handler in structure.error_handlers:
+            if handler.is_suppressing:
+                suppress_append(handler)
+            if handler.is_broad:
+                broad_count += 1
+        summary.broad_count = broad_count
+        search = _WIP_RX.search
+        summary.wip_patterns = [p for p in structure.naming_patterns if search(p.name)]
+        summary.deep_nesting_count = len([d for d in structure.nesting_depths if d > _DEEP_NESTING])
+        return summary
+
+
 class TensionDetector:
     """
     Detects contradictions and unresolved tensions in code.
@@ -41,7 +94,7 @@ class TensionDetector:
     without implementations, guards without purposes.
     """
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the TensionDetector with an empty analysis."""
         self.analysis = TensionAnalysis()
 
@@ -61,32 +114,34 @@ class TensionDetector:
             suggestions.
         """
         self.analysis = TensionAnalysis()
+        summary = _TensionSummary.from_structure(structure)
         
         # Detect various types of tensions
-        contradictions = self._detect_contradictions(structure)
-        abandonments = self._detect_abandonments(structure)
-        over_engineering = self._detect_over_engineering(structure)
+        contradictions = self._detect_contradictions(structure, summary)
+        abandonments = self._detect_abandonments(structure, summary)
+        over_engineering = self._detect_over_engineering(structure, summary)
         under_engineering = self._detect_under_engineering(structure)
         
         # Combine all tensions
         all_tensions = contradictions + abandonments + over_engineering + under_engineering
         
         # Sort by severity
-        all_tensions.sort(key=lambda t: t.severity, reverse=True)
+        all_tensions.sort(key=_severity, reverse=True)
         
         self.analysis.tensions = all_tensions
         
         # Calculate overall tension level
         if all_tensions:
-            self.analysis.overall_tension_level = sum(t.severity for t in all_tensions) / len(all_tensions)
-            self.analysis.primary_conflict = all_tensions[0].name if all_tensions else None
+            self.analysis.overall_tension_level = sum(map(_severity, all_tensions)) / len(all_tensions)
+            self.analysis.primary_conflict = all_tensions[0].name
         
         # Generate resolution suggestions
         self._generate_resolution_suggestions()
         
         return self.analysis
 
-    def _detect_contradictions(self, structure: CodeStructure) -> List[Tension]:
+    def _detect_contradictions(self, structure: CodeStructure,
+                               summary: Optional[_TensionSummary] = None) -> List[Tension]:
         """Detect contradictory patterns in code.
 
         Identifies tensions where the code exhibits opposing behaviors, such as
@@ -95,17 +150,21 @@ class TensionDetector:
 
         Args:
             structure: The parsed code structure to analyze for contradictions.
+            summary: Precomputed aggregates for the structure; computed here
+                when not given.
 
         Returns:
             A list of Tension objects representing detected contradictions,
             each with symbolic interpretation and severity score.
         """
+        if summary is None:
+            summary = _TensionSummary.from_structure(structure)
         tensions = []
         
         # Contradiction: Heavy validation but also heavy error suppression
         if structure.guard_clauses and structure.error_handlers:
             guard_count = len(structure.guard_clauses)
-            suppress_count = sum(1 for h in structure.error_handlers if h.handler_action == 'suppress')
+            suppress_count = len(summary.suppress_handlers)
             
             if guard_count > 5 and suppress_count > 3:
                 # Both guarding heavily AND suppressing errors
@@ -122,15 +181,14 @@ class TensionDetector:
         # Contradiction: Defensive patterns but broad exception catching
         if structure.defensive_patterns and structure.error_handlers:
             defensive_count = len(structure.defensive_patterns)
-            broad_catches = [h for h in structure.error_handlers 
-                           if 'Exception' in h.exception_types or 'BaseException' in h.exception_types]
+            broad_count = summary.broad_count
             
-            if defensive_count > 10 and len(broad_catches) > 3:
-                severity = min(1.0, (defensive_count + len(broad_catches)) / 25)
+            if defensive_count > 10 and broad_count > 3:
+                severity = min(1.0, (defensive_count + broad_count) / 25)
                 tensions.append(Tension(
                     name="The Precise Imprecision",
                     tension_type='contradiction',
-                    description=f"Detailed defensive checks ({defensive_count}) coexist with broad exception catches ({len(broad_catches)}).",
+                    description=f"Detailed defensive checks ({defensive_count}) coexist with broad exception catches ({broad_count}).",
                     symbolic_interpretation="The code is meticulous about input validation yet cavalier about error handling. It's like carefully checking IDs at the door but not noticing when the building catches fire. This reveals split consciousness—detail-oriented in one realm, negligent in another.",
                     severity=severity,
                     locations=[(p.file_path, p.line_number) for p in structure.defensive_patterns[:3]]
@@ -153,7 +211,8 @@ class TensionDetector:
         
         return tensions
 
-    def _detect_abandonments(self, structure: CodeStructure) -> List[Tension]:
+    def _detect_abandonments(self, structure: CodeStructure,
+                             summary: Optional[_TensionSummary] = None) -> List[Tension]:
         """Detect patterns suggesting abandoned or incomplete work.
 
         Identifies work-in-progress indicators in naming conventions (TODO, FIXME,
@@ -161,21 +220,19 @@ class TensionDetector:
 
         Args:
             structure: The parsed code structure to analyze for abandonment patterns.
+            summary: Precomputed aggregates for the structure; computed here
+                when not given.
 
         Returns:
             A list of Tension objects representing detected abandonments,
             each with symbolic interpretation and severity score.
         """
+        if summary is None:
+            summary = _TensionSummary.from_structure(structure)
         tensions = []
         
         # Look for naming patterns that suggest work in progress
-        wip_indicators = ['todo', 'fixme', 'hack', 'temp', 'tmp', 'test_', 'debug']
-        wip_patterns = []
-        
-        for pattern in structure.naming_patterns:
-            name_lower = pattern.name.lower()
-            if any(indicator in name_lower for indicator in wip_indicators):
-                wip_patterns.append(pattern)
+        wip_patterns = summary.wip_patterns
         
         if len(wip_patterns) >= 3:
             tensions.append(Tension(
@@ -188,7 +245,7 @@ class TensionDetector:
             ))
         
         # Check for empty or near-empty error handlers (pass statements)
-        empty_handlers = [h for h in structure.error_handlers if h.handler_action == 'suppress']
+        empty_handlers = summary.suppress_handlers
         
         if len(empty_handlers) >= 3:
             tensions.append(Tension(
@@ -202,7 +259,8 @@ class TensionDetector:
         
         return tensions
 
-    def _detect_over_engineering(self, structure: CodeStructure) -> List[Tension]:
+    def _detect_over_engineering(self, structure: CodeStructure,
+                                 summary: Optional[_TensionSummary] = None) -> List[Tension]:
         """Detect patterns suggesting over-engineering.
 
         Identifies excessive defensive patterns, overwhelming error handling,
@@ -210,11 +268,15 @@ class TensionDetector:
 
         Args:
             structure: The parsed code structure to analyze for over-engineering.
+            summary: Precomputed aggregates for the structure; computed here
+                when not given.
 
         Returns:
             A list of Tension objects representing detected over-engineering
             patterns, each with symbolic interpretation and severity score.
         """
+        if summary is None:
+            summary = _TensionSummary.from_structure(structure)
         tensions = []
         
         # Check for excessive defensive patterns relative to code size
@@ -247,14 +309,14 @@ class TensionDetector:
         
         # Check for excessive nesting depth
         if structure.nesting_depths:
-            deep_nesting = [d for d in structure.nesting_depths if d > 5]
-            if len(deep_nesting) > 3:
+            deep_nesting_count = summary.deep_nesting_count
+            if deep_nesting_count > 3:
                 tensions.append(Tension(
                     name="The Endless Descent",
                     tension_type='over_engineering',
-                    description=f"Found {len(deep_nesting)} instances of very deep nesting (>5 levels).",
+                    description=f"Found {deep_nesting_count} instances of very deep nesting (>5 levels).",
                     symbolic_interpretation="The code burrows ever deeper, creating labyrinths of logic. Each condition spawns another, each loop contains more loops. This is the architecture of a mind that cannot simplify—that adds rather than abstracts.",
-                    severity=min(1.0, len(deep_nesting) / 10),
+                    severity=min(1.0, deep_nesting_count / 10),
                     locations=[]
                 ))
         
@@ -310,7 +372,7 @@ class TensionDetector:
         
         return tensions
 
-    def _generate_resolution_suggestions(self):
+    def _generate_resolution_suggestions(self) -> None:
         """Generate symbolic suggestions for resolving tensions.
 
         Creates human-readable suggestions for addressing each detected tension
@@ -318,22 +380,10 @@ class TensionDetector:
         """
         suggestions = []
         
-        for tension in self.analysis.tensions:
-            if tension.tension_type == 'contradiction':
-                suggestions.append(
-                    f"The '{tension.name}' calls for integration—reconciling opposing impulses into coherent intention."
-                )
-            elif tension.tension_type == 'abandonment':
-                suggestions.append(
-                    f"The '{tension.name}' whispers of unfinished business—commitments waiting to be honored or consciously released."
-                )
-            elif tension.tension_type == 'over_engineering':
-                suggestions.append(
-                    f"The '{tension.name}' suggests learning to trust—releasing some armor, allowing vulnerability."
-                )
-            elif tension.tension_type == 'under_engineering':
-                suggestions.append(
-                    f"The '{tension.name}' invites greater care—building structures to support future growth."
-                )
+        # Every known tension type yields one suggestion, so only the top 5 are visited
+        for tension in self.analysis.tensions[:5]:
+            template = _RESOLUTION_TEMPLATES.get(tension.tension_type)
+            if template is not None:
+                suggestions.append(template % tension.name)
         
-        self.analysis.resolution_suggestions = suggestions[:5]  # Top 5 suggestions
+        self.analysis.resolution_suggestions = suggestions
@@ -0,0 +1,22 @@
+"""
+Shared fixtures for the Oneirocode test suite.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def tiny_py_repo(tmp_path_factory):
+    """Provide a read-only repository holding a single one-function file.
+
+    Created once per test session; tests must not write into it.
+
+    Args:
+        tmp_path_factory: Pytest fixture for creating temporary directories.
+
+    Returns:
+        Path to the repository root.
+    """
+    repo = tmp_path_factory.mktemp("tiny_repo")
+    (repo / "test.py").write_text("def hello(): pass")
+    return repo
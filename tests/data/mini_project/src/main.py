@@ -0,0 +1,36 @@
+"""Main module of the CLI integration fixture project."""
+
+
+def validate_config(config):
+    """Validate configuration."""
+    if config is None:
+        raise ValueError("Config required")
+    if not isinstance(config, dict):
+        raise TypeError("Config must be dict")
+    return config
+
+
+def handle_request(request):
+    """Handle a validated request."""
+    return request
+
+
+def process_request(request):
+    """Process incoming request."""
+    try:
+        validated = validate_config(request)
+        return handle_request(validated)
+    except Exception:
+        pass  # Suppress for now
+
+
+class RequestHandler:
+    """Handles requests."""
+
+    def handle(self, request):
+        if request is None:
+            return None
+        return self._process(request)
+
+    def _process(self, request):
+        return request
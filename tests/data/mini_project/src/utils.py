@@ -0,0 +1,20 @@
+"""Utility module of the CLI integration fixture project."""
+
+
+def get_config():
+    """Get configuration."""
+    return {}
+
+
+def get_logger():
+    """Get logger instance."""
+    return None
+
+
+def create_session():
+    """Create new session."""
+    return {}
+
+
+MAX_RETRIES = 3
+DEFAULT_TIMEOUT = 30
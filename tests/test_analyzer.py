@@ -13,6 +13,23 @@ from src.oneirocode.analyzer import (
 from src.oneirocode.narrative_synthesizer import InterpretationReport
 
 
+@pytest.fixture(scope="module")
+def trivial_analyzer(tiny_py_repo):
+    """Provide an analyzer that has analyzed a one-function repository.
+
+    The analysis runs once per module; tests only read its results.
+
+    Args:
+        tiny_py_repo: Shared read-only repository with a single file.
+
+    Returns:
+        The OneirocodeAnalyzer after analyzing the repository.
+    """
+    analyzer = OneirocodeAnalyzer()
+    analyzer.analyze(str(tiny_py_repo))
+    return analyzer
+
+
 class TestOneirocodeAnalyzer:
     """Tests for OneirocodeAnalyzer class."""
 
@@ -71,23 +88,16 @@ class DataHandler:
             assert report.word_count > 0
             assert "Oneirocode" in report.content
 
-    def test_analyze_stores_results(self):
+    def test_analyze_stores_results(self, trivial_analyzer):
         """Test that analyze stores results in analyzer attributes.
 
         Verifies that structure, profile, motifs, and tensions are populated
         after analysis completes.
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_file = Path(tmpdir) / "test.py"
-            test_file.write_text("def hello(): pass")
-            
-            analyzer = OneirocodeAnalyzer()
-            analyzer.analyze(tmpdir)
-            
-            assert analyzer.structure is not None
-            assert analyzer.profile is not None
-            assert analyzer.motifs is not None
-            assert analyzer.tensions is not None
+        assert trivial_analyzer.structure is not None
+        assert trivial_analyzer.profile is not None
+        assert trivial_analyzer.motifs is not None
+        assert trivial_analyzer.tensions is not None
 
     def test_analyze_nonexistent_path(self):
         """Test that analyzing a nonexistent path raises FileNotFoundError.
@@ -113,38 +123,24 @@ class DataHandler:
             
             assert "No Python files found" in str(exc_info.value)
 
-    def test_get_structure(self):
+    def test_get_structure(self, trivial_analyzer):
         """Test that get_structure returns parsed code structure.
 
         Verifies that after analysis, get_structure returns a valid structure
         object with correct function count.
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_file = Path(tmpdir) / "test.py"
-            test_file.write_text("def hello(): pass")
-            
-            analyzer = OneirocodeAnalyzer()
-            analyzer.analyze(tmpdir)
-            
-            structure = analyzer.get_structure()
-            assert structure is not None
-            assert structure.function_count == 1
+        structure = trivial_analyzer.get_structure()
+        assert structure is not None
+        assert structure.function_count == 1
 
-    def test_get_profile(self):
+    def test_get_profile(self, trivial_analyzer):
         """Test that get_profile returns symbolic profile.
 
         Verifies that after analysis, get_profile returns a valid profile
         object based on the analyzed code.
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_file = Path(tmpdir) / "test.py"
-            test_file.write_text("def validate_user(): pass")
-            
-            analyzer = OneirocodeAnalyzer()
-            analyzer.analyze(tmpdir)
-            
-            profile = analyzer.get_profile()
-            assert profile is not None
+        profile = trivial_analyzer.get_profile()
+        assert profile is not None
 
     def test_get_motifs(self):
         """Test that get_motifs returns detected recurring patterns.
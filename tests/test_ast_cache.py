@@ -0,0 +1,278 @@
+"""
+Tests for AST Cache module.
+"""
+
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+
+from src.oneirocode import ast_cache
+from src.oneirocode.ast_cache import cache_key, load_cached, store_cached
+from src.oneirocode.ast_parser import ASTParser, ParseResult
+
+
+class TestCacheKey:
+    """Tests for cache_key function."""
+
+    def test_key_is_stable(self):
+        """Test that identical inputs produce identical keys.
+
+        Verifies that the key depends only on the path and content bytes.
+        """
+        assert cache_key("a.py", b"x = 1") == cache_key("a.py", b"x = 1")
+
+    def test_key_changes_with_content(self):
+        """Test that editing a file invalidates its cache entry.
+
+        Verifies that different content at the same path yields a new key.
+        """
+        assert cache_key("a.py", b"x = 1") != cache_key("a.py", b"x = 2")
+
+    def test_key_changes_with_path(self):
+        """Test that identical content at different paths is cached separately.
+
+        Verifies that patterns recording their file path are never shared
+        between files that happen to have the same content.
+        """
+        assert cache_key("a.py", b"") != cache_key("b.py", b"")
+
+
+class TestCacheStorage:
+    """Tests for load_cached and store_cached functions."""
+
+    def test_round_trip(self):
+        """Test that a stored parse result can be loaded back.
+
+        Verifies that the loaded result equals the stored one.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = ParseResult(function_count=3, structure_signatures=["args:0|body:Pass|ret:False"])
+            store_cached(Path(tmpdir), "k", result)
+
+            assert load_cached(Path(tmpdir), "k") == result
+
+    def test_miss_returns_none(self):
+        """Test that a missing entry is reported as None."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            assert load_cached(Path(tmpdir), "missing") is None
+
+    def test_corrupt_entry_returns_none(self):
+        """Test that a corrupt entry is treated as a miss.
+
+        Verifies that garbage cache files, and real entries with flipped
+        bytes, do not raise whichever error unpickling them provokes, and
+        load as either a miss or a parse result.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "bad.pkl").write_bytes(b"not a pickle")
+
+            assert load_cached(Path(tmpdir), "bad") is None
+
+            result = ParseResult(function_count=3, structure_signatures=["args:0|body:Pass|ret:False"])
+            store_cached(Path(tmpdir), "k", result)
+            entry = Path(tmpdir) / "k.pkl"
+            data = entry.read_bytes()
+
+            assert load_cached(Path(tmpdir), "k") == result
+
+            for i in range(len(data)):
+                damaged = bytearray(data)
+                damaged[i] ^= 0xFF
+                entry.write_bytes(bytes(damaged))
+
+                loaded = load_cached(Path(tmpdir), "k")
+                assert loaded is None or isinstance(loaded, ParseResult)
+
+
+class TestParserCache:
+    """Tests for ASTParser cache integration."""
+
+    def test_cached_parse_matches_fresh_parse(self):
+        """Test that parsing through the cache yields the same patterns.
+
+        Parses a file twice with a cache directory and verifies the second
+        result is served from disk and matches the first.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "test.py"
+            test_file.write_text('''
+def validate(x):
+    if x is None:
+        raise ValueError()
+    return x
+''')
+            cache_dir = Path(tmpdir) / "cache"
+
+            first = ASTParser(cache_dir=cache_dir).parse_file(test_file)
+            assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+            second = ASTParser(cache_dir=cache_dir).parse_file(test_file)
+            assert second == first
+            assert second.function_count == 1
+            assert len(second.guard_clauses) == 1
+
+    def test_modified_file_is_reparsed(self):
+        """Test that a changed file does not reuse a stale entry.
+
+        Verifies that editing a file produces fresh patterns.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "test.py"
+            cache_dir = Path(tmpdir) / "cache"
+            parser = ASTParser(cache_dir=cache_dir)
+
+            test_file.write_text("def a(): pass")
+            assert parser.parse_file(test_file).function_count == 1
+
+            test_file.write_text("def a(): pass\ndef b(): pass")
+            assert parser.parse_file(test_file).function_count == 2
+
+    def test_repository_with_cache(self):
+        """Test that repository parsing gives identical totals when cached.
+
+        Verifies that a warm cache does not change the aggregated structure.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "a.py").write_text("def get_a(): return 1")
+            (Path(tmpdir) / "b.py").write_text("class BHandler: pass")
+            cache_dir = Path(tmpdir) / "cache"
+
+            cold = ASTParser(cache_dir=cache_dir).parse_repository(tmpdir)
+            warm = ASTParser(cache_dir=cache_dir).parse_repository(tmpdir)
+
+            assert warm == cold
+
+    def test_unchanged_stat_skips_hashing(self, monkeypatch):
+        """Test that a file with unchanged mtime and size is not rehashed.
+
+        Verifies that the second parse by the same parser is served from
+        the stat index, and that a size change falls back to hashing.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "test.py"
+            _write_settled(test_file, "def a(): pass")
+            parser = ASTParser(cache_dir=Path(tmpdir) / "cache")
+            first = parser.parse_file(test_file)
+
+            calls = _count_cache_keys(monkeypatch)
+
+            assert parser.parse_file(test_file) == first
+            assert calls == []
+
+            _write_settled(test_file, "def a(): pass\ndef b(): pass")
+            assert parser.parse_file(test_file).function_count == 2
+            assert len(calls) == 1
+
+    def test_stat_index_persists_across_runs(self, monkeypatch):
+        """Test that a later run reuses the stat index of an earlier one.
+
+        Verifies that a fresh parser over the same cache directory serves
+        unchanged files without reading or hashing them.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Path(tmpdir) / "repo"
+            repo.mkdir()
+            _write_settled(repo / "a.py", "def get_a(): return 1")
+            _write_settled(repo / "b.py", "class BHandler: pass")
+            cache_dir = Path(tmpdir) / "cache"
+
+            cold = ASTParser(cache_dir=cache_dir).parse_repository(str(repo))
+            calls = _count_cache_keys(monkeypatch)
+            warm = ASTParser(cache_dir=cache_dir).parse_repository(str(repo))
+
+            assert warm == cold
+            assert calls == []
+
+    def test_recently_modified_file_is_not_indexed(self, monkeypatch):
+        """Test that files modified moments ago are always rehashed.
+
+        Verifies that a file whose mtime is within the filesystem's
+        timestamp granularity of now is looked up by content hash, since
+        a same-size edit could otherwise go unnoticed.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "test.py"
+            test_file.write_text("def a(): pass")
+            parser = ASTParser(cache_dir=Path(tmpdir) / "cache")
+            first = parser.parse_file(test_file)
+
+            calls = _count_cache_keys(monkeypatch)
+
+            assert parser.parse_file(test_file) == first
+            assert len(calls) == 1
+
+    def test_relative_paths_from_different_repos_do_not_collide(self, monkeypatch):
+        """Test that same-named files in two repositories are told apart.
+
+        Verifies that repositories parsed through the same relative path
+        and sharing a cache directory never serve each other's results,
+        even when their files have identical sizes and mtimes.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir) / "cache"
+            for name, function in (("r1", "get_a"), ("r2", "get_b")):
+                repo = Path(tmpdir) / name
+                repo.mkdir()
+                _write_settled(repo / "m.py", f"def {function}(): return 1")
+                os.utime(repo / "m.py", ns=(10**18, 10**18))
+
+            monkeypatch.chdir(Path(tmpdir) / "r1")
+            ASTParser(cache_dir=cache_dir).parse_repository(".")
+            monkeypatch.chdir(Path(tmpdir) / "r2")
+            structure = ASTParser(cache_dir=cache_dir).parse_repository(".")
+
+            assert [p.name for p in structure.naming_patterns] == ["get_b"]
+
+    def test_index_keeps_most_recent_entries(self, monkeypatch):
+        """Test that the stat index stays within its size limit.
+
+        Verifies that entries recorded by the latest run survive and the
+        oldest ones are dropped once the limit is exceeded.
+        """
+        monkeypatch.setattr(ast_cache, "_INDEX_LIMIT", 2)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir) / "cache"
+            ast_cache.store_index(cache_dir, {"old.py": ((1, 2, 3), "k"), "new.py": ((1, 2, 3), "k")})
+            test_file = Path(tmpdir) / "test.py"
+            _write_settled(test_file, "def a(): pass")
+
+            parser = ASTParser(cache_dir=cache_dir)
+            parser.parse_file(test_file)
+            parser.save_index()
+
+            assert list(ast_cache.load_index(cache_dir)) == ["new.py", str(test_file.resolve())]
+
+    def test_index_from_other_format_is_ignored(self):
+        """Test that an index written under a different salt is discarded.
+
+        Verifies that its keys, which name entries of another cache
+        format, are never used.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir)
+            index = {"a.py": ((1, 2), "k")}
+            ast_cache.store_index(cache_dir, index)
+            assert ast_cache.load_index(cache_dir) == index
+
+            (cache_dir / "stat-index.pkl").write_bytes(
+                pickle.dumps((b"other", index))
+            )
+            assert ast_cache.load_index(cache_dir) == {}
+
+
+def _write_settled(path, text):
+    """Write a file and backdate its mtime past the racy window."""
+    path.write_text(text)
+    settled = time.time() - 3600
+    os.utime(path, (settled, settled))
+
+
+def _count_cache_keys(monkeypatch):
+    """Record every cache_key call made from here on."""
+    calls = []
+    real_cache_key = ast_cache.cache_key
+    monkeypatch.setattr(ast_cache, "cache_key",
+                        lambda *args: calls.append(args) or real_cache_key(*args))
+    return calls
@@ -3,11 +3,17 @@ Tests for AST Parser module.
 """
 
 import ast
+import dataclasses
+import pickle
 import pytest
 import tempfile
+import time
 import os
+from concurrent.futures import Future
 from pathlib import Path
 
+from src.oneirocode import ast_parser
+
 from src.oneirocode.ast_parser import (
     ASTParser,
     ASTVisitor,
@@ -15,10 +21,41 @@ from src.oneirocode.ast_parser import (
     NamingPattern,
     GuardClause,
     ErrorHandler,
-    DefensivePattern
+    DefensivePattern,
+    NAMING_PREFIXES,
+    NAMING_SUFFIXES
 )
 
 
+@pytest.fixture
+def inline_pool(monkeypatch):
+    """Replace the process pool with an inline executor.
+
+    Returns:
+        List receiving each batch of files submitted to the pool.
+    """
+    submitted = []
+
+    class InlineExecutor:
+        def __init__(self, max_workers):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def submit(self, fn, batch):
+            submitted.append(batch)
+            future = Future()
+            future.set_result(fn(batch))
+            return future
+
+    monkeypatch.setattr(ast_parser, "ProcessPoolExecutor", InlineExecutor)
+    return submitted
+
+
 class TestNamingPattern:
     """Tests for NamingPattern dataclass."""
 
@@ -56,6 +93,43 @@ class TestNamingPattern:
         assert pattern.prefix is None
         assert pattern.suffix is None
 
+    def test_naming_pattern_is_immutable(self):
+        """Test that NamingPattern instances are frozen and slotted.
+
+        Verifies that attributes cannot be reassigned, that no per-instance
+        __dict__ is allocated, and that instances survive pickling.
+        """
+        pattern = NamingPattern("get_data", "function", "test.py", 1, prefix="get_")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            pattern.name = "other"
+        assert not hasattr(pattern, "__dict__")
+        assert pickle.loads(pickle.dumps(pattern)) == pattern
+
+    def test_error_handler_broad_flag(self):
+        """Test that ErrorHandler derives is_broad from its exception types.
+
+        Verifies that catching Exception or BaseException marks a handler
+        as broad, that narrower catches do not, and that the flag survives
+        pickling.
+        """
+        broad = ErrorHandler("test.py", 1, ["ValueError", "Exception"], "log", "func")
+        narrow = ErrorHandler("test.py", 2, ["ValueError"], "log", "func")
+        
+        assert broad.is_broad
+        assert not narrow.is_broad
+        assert ErrorHandler("test.py", 3, ["BaseException"], "suppress", "func").is_broad
+        assert pickle.loads(pickle.dumps(broad)).is_broad
+
+    def test_error_handler_suppressing_flag(self):
+        """Test that ErrorHandler derives is_suppressing from its action."""
+        suppressing = ErrorHandler("test.py", 1, ["ValueError"], "suppress", "func")
+        logging_handler = ErrorHandler("test.py", 2, ["ValueError"], "log", "func")
+        
+        assert suppressing.is_suppressing
+        assert not logging_handler.is_suppressing
+        assert pickle.loads(pickle.dumps(suppressing)).is_suppressing
+
 
 class TestASTVisitor:
     """Tests for ASTVisitor class."""
@@ -86,6 +160,40 @@ def process_request():
         assert "get_data" in names
         assert "process_request" in names
 
+    def test_nested_statements_visited_in_source_order(self):
+        """Test that definitions nested in compound statements are found.
+
+        Verifies that functions and classes inside try handlers, with
+        blocks, loops, else branches and match cases are all recorded, in
+        source order, while expression subtrees such as lambdas are skipped.
+        """
+        code = '''
+try:
+    def in_try(): pass
+except ValueError:
+    def in_handler(): pass
+finally:
+    def in_finally(): pass
+with open("f") as f:
+    class InWith: pass
+for i in range(3):
+    pass
+else:
+    def in_for_else(): pass
+match command:
+    case "go":
+        def in_case(): pass
+handler = lambda: None
+'''
+        tree = ast.parse(code)
+        visitor = ASTVisitor("test.py")
+        visitor.visit(tree)
+        
+        names = [p.name for p in visitor.naming_patterns]
+        assert names == ["in_try", "in_handler", "in_finally", "InWith", "in_for_else", "in_case"]
+        assert visitor.function_count == 5
+        assert visitor.class_count == 1
+
     def test_extract_prefix(self):
         """Test extraction of naming prefixes from function names.
 
@@ -137,6 +245,53 @@ class Request_factory:
         assert "_manager" in suffixes
         assert "_factory" in suffixes
 
+    def test_extract_prefix_suffix_edges(self):
+        """Test prefix/suffix extraction for partial and absent matches.
+
+        Verifies that affixes must appear at the start or end of the name
+        and that unmatched names yield None.
+        """
+        visitor = ASTVisitor("test.py")
+
+        assert visitor._extract_prefix_suffix("_get_value") == ("_", None)
+        assert visitor._extract_prefix_suffix("target_handler") == (None, "_handler")
+        assert visitor._extract_prefix_suffix("handler_x") == (None, None)
+        assert visitor._extract_prefix_suffix("build_error") == ("build_", "_error")
+        assert visitor._extract_prefix_suffix("plain") == (None, None)
+        assert visitor._extract_prefix_suffix("__init__") == ("_", None)
+
+    def test_affixes_have_a_single_boundary_underscore(self):
+        """Test the invariant that affix lookup by underscore position relies on.
+
+        Verifies that each prefix contains exactly one underscore, at its
+        end, and each suffix exactly one, at its start.
+        """
+        for prefix in NAMING_PREFIXES:
+            assert prefix.find('_') == len(prefix) - 1
+        for suffix in NAMING_SUFFIXES:
+            assert suffix.rfind('_') == 0
+
+    def test_records_share_strings(self):
+        """Test that records from one file share path and affix strings.
+
+        Verifies that repeated values are stored once rather than copied
+        into every record.
+        """
+        code = '''
+def get_a():
+    pass
+
+def get_b():
+    pass
+'''
+        tree = ast.parse(code)
+        visitor = ASTVisitor("pkg/" + "module.py")
+        visitor.visit(tree)
+
+        first, second = visitor.naming_patterns
+        assert first.file_path is second.file_path
+        assert first.prefix is second.prefix
+
     def test_detect_guard_clause_return(self):
         """Test detection of guard clauses with early return.
 
@@ -263,6 +418,24 @@ def process(data):
         null_checks = [p for p in visitor.defensive_patterns if p.pattern_type == "null_check"]
         assert len(null_checks) == 1
 
+    def test_chained_null_check_recorded_once(self):
+        """Test that a chained comparison yields a single null check.
+
+        Verifies that one if statement is recorded once even when several
+        of its comparisons are against None.
+        """
+        code = '''
+def process(a, b):
+    if a is None is not b:
+        return
+'''
+        tree = ast.parse(code)
+        visitor = ASTVisitor("test.py")
+        visitor.visit(tree)
+
+        null_checks = [p for p in visitor.defensive_patterns if p.pattern_type == "null_check"]
+        assert len(null_checks) == 1
+
     def test_detect_defensive_type_check(self):
         """Test detection of defensive type check patterns.
 
@@ -321,6 +494,116 @@ API_KEY = "secret"
         assert "DEFAULT_TIMEOUT" in constant_names
         assert "API_KEY" in constant_names
 
+    def test_constants_recorded_once_per_definition(self):
+        """Test that constants are recorded at definitions, not references.
+
+        Verifies that reading a constant does not add patterns and that
+        tuple-unpacked and annotated constants are detected.
+        """
+        code = '''
+MAX_SIZE = 100
+LOW, HIGH = 0, 10
+TIMEOUT: int = 30
+
+def check(x):
+    return x < MAX_SIZE and LOW < x < HIGH
+'''
+        tree = ast.parse(code)
+        visitor = ASTVisitor("test.py")
+        visitor.visit(tree)
+
+        constant_names = [p.name for p in visitor.naming_patterns if p.category == "constant"]
+        assert constant_names == ["MAX_SIZE", "LOW", "HIGH", "TIMEOUT"]
+
+    def test_nesting_depth(self):
+        """Test nesting depth measurement of function bodies.
+
+        Verifies that depth counts enclosing blocks (including the function
+        itself) rather than sibling blocks, and that flat functions are 0.
+        """
+        code = '''
+def flat():
+    return 1
+
+def siblings(x):
+    if x:
+        pass
+    if x:
+        pass
+    if x:
+        pass
+
+def nested(items):
+    for item in items:
+        if item:
+            while item:
+                item -= 1
+'''
+        tree = ast.parse(code)
+        visitor = ASTVisitor("test.py")
+        visitor.visit(tree)
+
+        assert visitor.max_nesting_depths == [0, 1, 3]
+
+    def test_structure_signature_return(self):
+        """Test the return flag of structure signatures.
+
+        Verifies that a return inside a nested function is attributed to
+        the nested function only, not to the enclosing one.
+        """
+        code = '''
+def outer():
+    def inner():
+        return 1
+    inner()
+'''
+        tree = ast.parse(code)
+        visitor = ASTVisitor("test.py")
+        visitor.visit(tree)
+
+        outer_sig, inner_sig = visitor.structure_signatures
+        assert outer_sig.endswith("ret:False")
+        assert inner_sig.endswith("ret:True")
+
+    def test_unparse_is_memoized(self):
+        """Test that an if condition is unparsed once per node.
+
+        Verifies that the guard clause and the null check recorded for the
+        same if statement share one rendered condition string.
+        """
+        code = '''
+def check(x):
+    if x is None:
+        return None
+'''
+        tree = ast.parse(code)
+        visitor = ASTVisitor("test.py")
+        visitor.visit(tree)
+
+        guard, = visitor.guard_clauses
+        null_check, = visitor.defensive_patterns
+        assert guard.condition == "x is None"
+        assert guard.condition is null_check.context
+
+    def test_one_guard_clause_per_if(self):
+        """Test that an if with several exits is one guard clause.
+
+        Verifies that only the first return or raise in the body counts.
+        """
+        code = '''
+def check(x):
+    if not x:
+        log(x)
+        raise ValueError()
+        return None
+'''
+        tree = ast.parse(code)
+        visitor = ASTVisitor("test.py")
+        visitor.visit(tree)
+
+        assert len(visitor.guard_clauses) == 1
+        assert visitor.guard_clauses[0].action == "raise"
+
 
 class TestASTParser:
     """Tests for ASTParser class."""
@@ -349,22 +632,72 @@ def validate_input(x):
             assert visitor.function_count == 1
             assert len(visitor.guard_clauses) == 1
 
+    def test_parse_source(self):
+        """Test parsing source bytes that are already in memory.
+
+        Verifies that patterns are extracted and attributed to the given
+        path without touching the filesystem, and that invalid source
+        yields None.
+        """
+        parser = ASTParser()
+        result = parser.parse_source(b"def check_input(x):\n    assert x\n", "mem.py")
+        
+        assert result is not None
+        assert result.function_count == 1
+        assert result.naming_patterns[0].file_path == "mem.py"
+        assert len(result.defensive_patterns) == 1
+        assert parser.parse_source(b"def broken(:\n", "mem.py") is None
+
+    def test_parse_source_annotation_only_constant(self):
+        """Test that a value-less annotated constant is not skipped.
+
+        Verifies that a module holding only an annotation such as
+        MAX_SIZE: int still yields its constant naming pattern.
+        """
+        result = ASTParser().parse_source(b"MAX_SIZE: int\n", "mem.py")
+
+        assert result is not None
+        assert [p.name for p in result.naming_patterns] == ["MAX_SIZE"]
+
     def test_parse_invalid_file(self):
-        """Test parsing an invalid Python file.
+        """Test parsing invalid Python source.
 
         Verifies that ASTParser returns None when attempting to parse
-        a file with syntax errors instead of raising an exception.
+        source with syntax errors instead of raising an exception.
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create invalid Python file
-            test_file = Path(tmpdir) / "invalid.py"
-            test_file.write_text("def broken(")
-            
-            parser = ASTParser()
-            visitor = parser.parse_file(test_file)
-            
-            # Should return None for unparseable files
-            assert visitor is None
+        parser = ASTParser()
+        visitor = parser.parse_source(b"def broken(", "invalid.py")
+        
+        # Should return None for unparseable source
+        assert visitor is None
+
+    def test_parse_file_encodings(self):
+        """Test that source encoding is determined by the parser.
+
+        Verifies that source with a coding declaration is parsed, while
+        invalid UTF-8 without a declaration is skipped.
+        """
+        parser = ASTParser()
+        latin = b"# -*- coding: latin-1 -*-\ndef caf\xe9(): pass\n"
+        invalid = b"def f():\n    return '\xff'\n"
+
+        assert parser.parse_source(latin, "latin.py").function_count == 1
+        assert parser.parse_source(invalid, "invalid.py") is None
+
+    def test_parse_import_only_file(self):
+        """Test that sources without structural keywords skip full parsing.
+
+        Verifies that an import-only module still yields an empty result
+        with its line count, so repository totals are unaffected.
+        """
+        source = b'"""Package."""\nfrom .core import run\n'
+
+        result = ASTParser().parse_source(source, "__init__.py")
+
+        assert result is not None
+        assert result.function_count == 0
+        assert result.naming_patterns == []
+        assert result.line_count == 2
 
     def test_parse_repository(self):
         """Test parsing an entire repository.
@@ -432,6 +765,129 @@ def get_config():
             assert structure.file_count == 1
             assert structure.function_count == 1
 
+    def test_iter_repository(self):
+        """Test streaming per-file results from a repository.
+
+        Verifies that every file is reported once, with None for files
+        that fail to parse, and that a missing path raises immediately.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "good.py").write_text("def ok(): pass")
+            (Path(tmpdir) / "bad.py").write_text("def broken(:")
+
+            results = {path.name: result for path, result in ASTParser().iter_repository(tmpdir)}
+
+            assert results["good.py"].function_count == 1
+            assert results["bad.py"] is None
+
+        with pytest.raises(FileNotFoundError):
+            ASTParser().iter_repository("/nonexistent/path")
+
+    def test_excluded_names_only_apply_below_root(self):
+        """Test that exclusion is based on directories inside the repository.
+
+        Verifies that a repository which itself lives under a directory
+        named like an excluded one (e.g. 'build') is still parsed, while
+        nested excluded directories are pruned.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Path(tmpdir) / "build" / "project"
+            (repo / "pkg" / "node_modules" / "dep").mkdir(parents=True)
+            (repo / "pkg" / "node_modules" / "dep" / "skipped.py").write_text("def skipped(): pass")
+            (repo / "pkg" / "kept.py").write_text("def kept(): pass")
+
+            structure = ASTParser().parse_repository(str(repo))
+
+            assert structure.file_count == 1
+            assert structure.function_count == 1
+
+    def test_total_lines(self):
+        """Test that line totals match a readlines() count of each file.
+
+        Verifies that files with and without a trailing newline are both
+        counted correctly from the bytes read for parsing.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "a.py").write_text("x = 1\ny = 2\n")
+            (Path(tmpdir) / "b.py").write_text("x = 1\ny = 2")
+            (Path(tmpdir) / "c.py").write_text("")
+
+            structure = ASTParser().parse_repository(tmpdir)
+
+            assert structure.total_lines == 4
+
+    def test_parallel_matches_serial(self):
+        """Test that parallel parsing aggregates the same structure as serial.
+
+        Creates more files than the parallel threshold and verifies that a
+        multi-worker parse produces exactly the serial result, in order.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(ASTParser.PARALLEL_THRESHOLD + 8):
+                (Path(tmpdir) / f"module{i}.py").write_text(
+                    f"def get_item{i}(x):\n    if x is None:\n        return None\n    return x\n"
+                )
+
+            serial = ASTParser(max_workers=1).parse_repository(tmpdir)
+            parallel = ASTParser(max_workers=2).parse_repository(tmpdir)
+
+            assert parallel == serial
+            assert parallel.function_count == ASTParser.PARALLEL_THRESHOLD + 8
+            assert parallel.total_lines == 4 * (ASTParser.PARALLEL_THRESHOLD + 8)
+
+    def test_parallel_submissions_are_bounded(self, inline_pool):
+        """Test that large repositories are not submitted to the pool at once.
+
+        Replaces the process pool with an inline executor and verifies that
+        no more than PARALLEL_PREFETCH batches per worker are submitted
+        ahead of the consumer, while every file is still reported in order.
+        """
+        submitted = inline_pool
+        count = ASTParser.PARALLEL_THRESHOLD + 8
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(count):
+                (Path(tmpdir) / f"module{i}.py").write_text(f"def f{i}(): pass\n")
+
+            parser = ASTParser(max_workers=2)
+            parser.PARALLEL_CHUNKSIZE = 1
+            results = parser.iter_repository(tmpdir)
+
+            first = next(results)
+            assert len(submitted) == 2 * ASTParser.PARALLEL_PREFETCH
+
+            paths = [first[0]] + [path for path, _ in results]
+            assert paths == [path for batch in submitted for path in batch]
+            assert len(paths) == count
+
+    def test_parallel_parse_skips_indexed_files(self, inline_pool):
+        """Test that indexed files are never sent to worker processes.
+
+        Verifies that a repeat parse of a large repository resolves every
+        unchanged file through the persisted stat index in the dispatching
+        process, submitting only the file that changed.
+        """
+        count = ASTParser.PARALLEL_THRESHOLD + 8
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Path(tmpdir) / "repo"
+            repo.mkdir()
+            settled = time.time() - 3600
+            for i in range(count):
+                path = repo / f"module{i}.py"
+                path.write_text(f"def get_item{i}(x):\n    return x\n")
+                os.utime(path, (settled, settled))
+            cache_dir = Path(tmpdir) / "cache"
+
+            cold = ASTParser(cache_dir=cache_dir, max_workers=2).parse_repository(str(repo))
+            (repo / "module0.py").write_text("def get_item0(x):\n    return x\n\n")
+            inline_pool.clear()
+            warm = ASTParser(cache_dir=cache_dir, max_workers=2).parse_repository(str(repo))
+
+            assert inline_pool == [[repo / "module0.py"]]
+            assert warm.function_count == cold.function_count
+            assert warm.total_lines == cold.total_lines + 1
+
     def test_nonexistent_repository(self):
         """Test parsing a nonexistent repository path.
 
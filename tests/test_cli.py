@@ -3,6 +3,8 @@ Tests for CLI module.
 """
 
 import pytest
+import re
+import subprocess
 import sys
 import tempfile
 from pathlib import Path
@@ -12,6 +14,10 @@ from src.oneirocode.cli import main, create_parser, run_analyze
 from src.oneirocode import __version__
 
 
+# Checked-in fixture repositories
+DATA_DIR = Path(__file__).parent / "data"
+
+
 class TestCreateParser:
     """Tests for create_parser function."""
 
@@ -72,6 +78,39 @@ class TestCreateParser:
         args = parser.parse_args(['analyze', '/test/path', '--llm'])
         assert args.llm is True
 
+    def test_parser_analyze_cache_options(self):
+        """Test that the parser supports the cache options.
+
+        Verifies that caching is off by default, that '--cache' enables the
+        default location, and that '--cache-dir' always takes a path.
+        """
+        parser = create_parser()
+        
+        args = parser.parse_args(['analyze', '/test/path'])
+        assert args.cache is False
+        assert args.cache_dir is None
+        
+        assert parser.parse_args(['analyze', '/test/path', '--cache']).cache is True
+        
+        args = parser.parse_args(['analyze', '/test/path', '--cache-dir', '/tmp/c'])
+        assert args.cache_dir == '/tmp/c'
+
+    def test_parser_cache_options_before_repo_path(self):
+        """Test that cache options do not swallow the repository path.
+
+        Verifies that '--cache' and '--cache-dir DIR' may precede the
+        positional repository path.
+        """
+        parser = create_parser()
+        
+        args = parser.parse_args(['analyze', '--cache', '/test/path'])
+        assert args.cache is True
+        assert args.repo_path == '/test/path'
+        
+        args = parser.parse_args(['analyze', '--cache-dir', '/tmp/c', '/test/path'])
+        assert args.cache_dir == '/tmp/c'
+        assert args.repo_path == '/test/path'
+
 
 class TestMain:
     """Tests for main function."""
@@ -86,9 +125,12 @@ class TestMain:
         
         assert result == 0
 
-    def test_version_flag(self):
+    def test_version_flag(self, capsys):
         """Test that the version flag displays version and exits cleanly.
 
+        Args:
+            capsys: Pytest fixture for capturing stdout/stderr.
+
         Verifies that '--version' causes a SystemExit with code 0
         after displaying version information.
         """
@@ -96,6 +138,30 @@ class TestMain:
             main(['--version'])
         
         assert exc_info.value.code == 0
+        assert __version__ in capsys.readouterr().out
+
+    def test_version_string(self):
+        """Test that the package version is a semantic version string."""
+        assert re.fullmatch(r"\d+\.\d+\.\d+", __version__)
+
+    def test_import_does_not_load_analysis_components(self):
+        """Test that importing the CLI defers loading the analysis modules.
+
+        Runs a fresh interpreter so modules imported by other tests do not
+        mask eager imports.
+        """
+        repo_root = Path(__file__).resolve().parent.parent
+        code = (
+            "import sys, src.oneirocode.cli; "
+            "print(any(m.startswith('src.oneirocode.') and m.endswith("
+            "('ast_parser', 'symbolic_ontology', 'motif_detector', "
+            "'tension_detector', 'narrative_synthesizer')) for m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=repo_root, capture_output=True, text=True
+        )
+        
+        assert result.stdout.strip() == "False"
 
     def test_invalid_repo_path(self):
         """Test that analyzing a nonexistent path returns an error code.
@@ -143,26 +209,25 @@ def process_data(data):
             captured = capsys.readouterr()
             assert "Oneirocode Dream Interpretation" in captured.out
 
-    def test_analyze_with_output_file(self):
+    def test_analyze_with_output_file(self, tiny_py_repo, tmp_path):
         """Test that analysis results can be written to an output file.
 
-        Creates a temporary directory with a test file and verifies that
-        the analysis output is correctly written to the specified file.
+        Args:
+            tiny_py_repo: Shared read-only repository with a single file.
+            tmp_path: Pytest fixture providing a per-test output directory.
+
+        Verifies that the analysis output is correctly written to the
+        specified file.
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create test file
-            test_file = Path(tmpdir) / "test.py"
-            test_file.write_text("def hello(): pass")
-            
-            output_file = Path(tmpdir) / "output.md"
-            
-            result = main(['analyze', tmpdir, '-o', str(output_file), '--quiet'])
-            
-            assert result == 0
-            assert output_file.exists()
-            
-            content = output_file.read_text()
-            assert "Oneirocode Dream Interpretation" in content
+        output_file = tmp_path / "output.md"
+        
+        result = main(['analyze', str(tiny_py_repo), '-o', str(output_file), '--quiet'])
+        
+        assert result == 0
+        assert output_file.exists()
+        
+        content = output_file.read_text()
+        assert "Oneirocode Dream Interpretation" in content
 
     def test_analyze_nonexistent_path(self):
         """Test that analyzing a nonexistent path returns an error.
@@ -191,120 +256,60 @@ def process_data(data):
     def test_analyze_no_python_files(self):
         """Test that analyzing a directory with no Python files returns an error.
 
-        Creates a temporary directory with only non-Python files and verifies
+        Analyzes a checked-in directory holding only a text file and verifies
         that the CLI returns exit code 1.
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create non-Python file
-            test_file = Path(tmpdir) / "readme.txt"
-            test_file.write_text("Hello World")
-            
-            result = main(['analyze', tmpdir, '--quiet'])
-            
-            assert result == 1
+        result = main(['analyze', str(DATA_DIR / "no_python"), '--quiet'])
+        
+        assert result == 1
 
-    def test_analyze_progress_messages(self, capsys):
+    def test_analyze_progress_messages(self, capsys, tiny_py_repo):
         """Test that progress messages are displayed during analysis.
 
         Args:
             capsys: Pytest fixture for capturing stdout/stderr.
+            tiny_py_repo: Shared read-only repository with a single file.
 
         Verifies that progress messages are written to stderr during
         the analysis process.
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_file = Path(tmpdir) / "test.py"
-            test_file.write_text("def hello(): pass")
-            
-            result = main(['analyze', tmpdir])
-            
-            assert result == 0
-            
-            captured = capsys.readouterr()
-            # Progress messages go to stderr
-            assert "Parsing codebase" in captured.err
-            assert "Interpretation complete" in captured.err
+        result = main(['analyze', str(tiny_py_repo)])
+        
+        assert result == 0
+        
+        captured = capsys.readouterr()
+        # Progress messages go to stderr
+        assert "Parsing codebase" in captured.err
+        assert "Interpretation complete" in captured.err
 
 
 class TestCLIIntegration:
     """Integration tests for CLI."""
 
-    def test_full_analysis_workflow(self):
+    def test_full_analysis_workflow(self, tmp_path):
         """Test a complete analysis workflow with a realistic mini-project.
 
-        Creates a temporary project structure with multiple Python modules
+        Args:
+            tmp_path: Pytest fixture providing a per-test output directory.
+
+        Analyzes the checked-in mini-project with multiple Python modules
         and verifies that the full analysis produces expected output sections
         including archetypes, motifs, and psychological profile.
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a realistic mini-project
-            src_dir = Path(tmpdir) / "src"
-            src_dir.mkdir()
-            
-            # Main module
-            main_file = src_dir / "main.py"
-            main_file.write_text('''
-def validate_config(config):
-    """Validate configuration."""
-    if config is None:
-        raise ValueError("Config required")
-    if not isinstance(config, dict):
-        raise TypeError("Config must be dict")
-    return config
-
-def process_request(request):
-    """Process incoming request."""
-    try:
-        validated = validate_config(request)
-        return handle_request(validated)
-    except Exception as e:
-        pass  # Suppress for now
-
-class RequestHandler:
-    """Handles requests."""
-    
-    def handle(self, request):
-        if request is None:
-            return None
-        return self._process(request)
-    
-    def _process(self, request):
-        return request
-''')
-            
-            # Utils module
-            utils_file = src_dir / "utils.py"
-            utils_file.write_text('''
-def get_config():
-    """Get configuration."""
-    return {}
-
-def get_logger():
-    """Get logger instance."""
-    return None
-
-def create_session():
-    """Create new session."""
-    return {}
-
-MAX_RETRIES = 3
-DEFAULT_TIMEOUT = 30
-''')
-            
-            output_file = Path(tmpdir) / "interpretation.md"
-            
-            result = main(['analyze', tmpdir, '-o', str(output_file), '--quiet'])
-            
-            assert result == 0
-            assert output_file.exists()
-            
-            content = output_file.read_text()
-            
-            # Check for expected content
-            assert "Oneirocode Dream Interpretation" in content
-            assert "Dominant Archetypes" in content
-            assert "Recurring Motifs" in content
-            assert "Psychological Profile" in content
+        output_file = tmp_path / "interpretation.md"
+        
+        result = main(['analyze', str(DATA_DIR / "mini_project"), '-o', str(output_file), '--quiet'])
+        
+        assert result == 0
+        assert output_file.exists()
+        
+        content = output_file.read_text()
+        
+        # Check for expected content
+        assert "Oneirocode Dream Interpretation" in content
+        assert "Dominant Archetypes" in content
+        assert "Recurring Motifs" in content
+        assert "Psychological Profile" in content
 
     def test_self_analysis(self, capsys):
         """Test analyzing the oneirocode source itself.
@@ -18,6 +18,23 @@ from src.oneirocode.ast_parser import (
 )
 
 
+# NamingPattern is frozen, so these can be shared by every test that
+# wraps them in a fresh CodeStructure.
+_GET_PREFIX_PATTERNS = (
+    NamingPattern("get_user", "function", "test.py", 1, prefix="get_"),
+    NamingPattern("get_config", "function", "test.py", 10, prefix="get_"),
+    NamingPattern("get_data", "function", "test.py", 20, prefix="get_"),
+    NamingPattern("get_settings", "function", "test.py", 30, prefix="get_"),
+)
+
+_HANDLER_SUFFIX_PATTERNS = (
+    NamingPattern("UserHandler", "class", "test.py", 1, suffix="_handler"),
+    NamingPattern("DataHandler", "class", "test.py", 10, suffix="_handler"),
+    NamingPattern("RequestHandler", "class", "test.py", 20, suffix="_handler"),
+    NamingPattern("EventHandler", "class", "test.py", 30, suffix="_handler"),
+)
+
+
 class TestMotif:
     """Tests for Motif dataclass."""
 
@@ -43,6 +60,16 @@ class TestMotif:
         assert motif.intensity == 0.5
         assert len(motif.examples) == 2
 
+    def test_motif_has_no_instance_dict(self):
+        """Test that Motif and MotifAnalysis use slots.
+
+        Verifies that no per-instance __dict__ is allocated.
+        """
+        motif = Motif("The Rhythm of Structure", "rhythmic", 1, "", [], 0.6)
+        
+        assert not hasattr(motif, "__dict__")
+        assert not hasattr(MotifAnalysis(), "__dict__")
+
 
 class TestMotifDetector:
     """Tests for MotifDetector class."""
@@ -61,6 +88,21 @@ class TestMotifDetector:
         assert isinstance(analysis, MotifAnalysis)
         assert analysis.motifs == []
 
+    def test_detect_classes_only_structure(self):
+        """Test that a structure without patterns keeps its rhythm signature.
+
+        Verifies that the empty-structure shortcut still reports the
+        organization rhythm derived from the class count.
+        """
+        detector = MotifDetector()
+        
+        analysis = detector.detect(CodeStructure(class_count=2))
+        
+        assert analysis.motifs == []
+        assert analysis.rhythm_signature == "class-heavy"
+        assert analysis.dominant_pattern is None
+        assert analysis.pattern_diversity == 0.0
+
     def test_detect_naming_motifs_prefix(self):
         """Test detection of naming motifs based on function prefixes.
 
@@ -69,12 +111,7 @@ class TestMotifDetector:
         """
         detector = MotifDetector()
         structure = CodeStructure(
-            naming_patterns=[
-                NamingPattern("get_user", "function", "test.py", 1, prefix="get_"),
-                NamingPattern("get_config", "function", "test.py", 10, prefix="get_"),
-                NamingPattern("get_data", "function", "test.py", 20, prefix="get_"),
-                NamingPattern("get_settings", "function", "test.py", 30, prefix="get_"),
-            ],
+            naming_patterns=list(_GET_PREFIX_PATTERNS),
             function_count=4
         )
         
@@ -96,12 +133,7 @@ class TestMotifDetector:
         """
         detector = MotifDetector()
         structure = CodeStructure(
-            naming_patterns=[
-                NamingPattern("UserHandler", "class", "test.py", 1, suffix="_handler"),
-                NamingPattern("DataHandler", "class", "test.py", 10, suffix="_handler"),
-                NamingPattern("RequestHandler", "class", "test.py", 20, suffix="_handler"),
-                NamingPattern("EventHandler", "class", "test.py", 30, suffix="_handler"),
-            ],
+            naming_patterns=list(_HANDLER_SUFFIX_PATTERNS),
             function_count=0,
             class_count=4
         )
@@ -259,11 +291,7 @@ class TestMotifDetector:
         """
         detector = MotifDetector()
         structure = CodeStructure(
-            naming_patterns=[
-                NamingPattern("get_data", "function", "test.py", 1, prefix="get_"),
-                NamingPattern("get_user", "function", "test.py", 10, prefix="get_"),
-                NamingPattern("get_config", "function", "test.py", 20, prefix="get_"),
-            ],
+            naming_patterns=list(_GET_PREFIX_PATTERNS[:3]),
             guard_clauses=[
                 GuardClause("test.py", 1, "x is None", "return", "func1"),
                 GuardClause("test.py", 10, "not valid", "raise", "func2"),
@@ -308,3 +336,72 @@ class TestMotifDetector:
         
         # Should have a dominant pattern
         assert analysis.dominant_pattern is not None
+
+    def test_behavioral_examples_follow_dominant_action(self):
+        """Test that behavioral motif examples come from the dominant action.
+
+        Verifies that examples are the first five handlers taking the
+        dominant action, in source order, skipping other actions.
+        """
+        detector = MotifDetector()
+        structure = CodeStructure(
+            error_handlers=[
+                ErrorHandler("test.py", i, ["Exception"], "suppress" if i % 3 else "log", f"func{i}")
+                for i in range(12)
+            ],
+            function_count=10
+        )
+        
+        analysis = detector.detect(structure)
+        
+        silencing = [m for m in analysis.motifs if m.name == "The Silencing"]
+        assert len(silencing) == 1
+        assert silencing[0].occurrences == 8
+        assert silencing[0].examples == [("test.py", i) for i in (1, 2, 4, 5, 7)]
+
+    def test_repeated_detect_sees_replaced_patterns(self):
+        """Test that detecting a structure again reflects in-place edits.
+
+        Verifies that replacing a pattern without changing any list length
+        still changes the analysis of the same structure object.
+        """
+        detector = MotifDetector()
+        structure = CodeStructure(
+            naming_patterns=[
+                NamingPattern(f"get_{i}", "function", "test.py", i, prefix="get_")
+                for i in range(4)
+            ],
+            function_count=4
+        )
+        
+        first = detector.detect(structure)
+        retrieval = [m for m in first.motifs if m.name == "The Retrieval Pattern"]
+        assert retrieval[0].occurrences == 4
+        
+        structure.naming_patterns[0] = NamingPattern("load_0", "function", "test.py", 0)
+        second = detector.detect(structure)
+        retrieval = [m for m in second.motifs if m.name == "The Retrieval Pattern"]
+        assert retrieval[0].occurrences == 3
+
+    def test_top_k_keeps_strongest_motifs(self):
+        """Test that top_k truncates the ranked motif list.
+
+        Verifies that the kept motifs are the head of the full ranking and
+        that diversity and the dominant pattern are unaffected.
+        """
+        structure = CodeStructure(
+            naming_patterns=[
+                NamingPattern(f"get_{i}", "function", "test.py", i, prefix="get_")
+                for i in range(20)
+            ],
+            guard_clauses=[GuardClause("test.py", i, "x is None", "return", f"get_{i}") for i in range(10)],
+            function_count=20,
+            total_lines=200
+        )
+        full = MotifDetector().detect(structure)
+        top = MotifDetector().detect(structure, top_k=2)
+        
+        assert len(full.motifs) > 2
+        assert top.motifs == full.motifs[:2]
+        assert top.dominant_pattern == full.dominant_pattern
+        assert top.pattern_diversity == full.pattern_diversity
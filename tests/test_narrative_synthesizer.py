@@ -18,6 +18,107 @@ from src.oneirocode.motif_detector import MotifAnalysis, Motif
 from src.oneirocode.tension_detector import TensionAnalysis, Tension
 
 
+@pytest.fixture(scope="module")
+def synthesized_reports():
+    """Synthesize one report per distinct input set, shared by the module.
+
+    Returns:
+        Dictionary mapping an input-set name to its InterpretationReport.
+    """
+    synthesizer = NarrativeSynthesizer()
+    inputs = {
+        "header": dict(
+            structure=CodeStructure(
+                file_count=10,
+                total_lines=1000,
+                function_count=50,
+                class_count=5
+            ),
+        ),
+        "archetypes": dict(
+            profile=SymbolicProfile(
+                dominant_archetypes=[
+                    ArchetypeMatch(
+                        archetype=Archetype.GUARDIAN,
+                        strength=0.8,
+                        evidence=["High validation ratio"],
+                        locations=[("test.py", 10)]
+                    )
+                ]
+            ),
+        ),
+        "motifs": dict(
+            motifs=MotifAnalysis(
+                motifs=[
+                    Motif(
+                        name="The Retrieval Pattern",
+                        pattern_type="naming",
+                        occurrences=10,
+                        symbolic_meaning="Reaching out to acquire resources.",
+                        examples=[("test.py", 1)],
+                        intensity=0.7
+                    )
+                ],
+                rhythm_signature="function-heavy-short-form"
+            ),
+        ),
+        "tensions": dict(
+            tensions=TensionAnalysis(
+                tensions=[
+                    Tension(
+                        name="The Guardian Who Closes Their Eyes",
+                        tension_type="contradiction",
+                        description="Guards vigilantly but suppresses errors.",
+                        symbolic_interpretation="A profound contradiction...",
+                        severity=0.7,
+                        locations=[("test.py", 10)]
+                    )
+                ],
+                overall_tension_level=0.7
+            ),
+        ),
+        "psychological_profile": dict(
+            structure=CodeStructure(
+                function_count=10,
+                nesting_depths=[2, 2, 3, 2, 2]
+            ),
+            profile=SymbolicProfile(
+                behavioral_traits=["Boundary-focused", "Error-confronting"]
+            ),
+        ),
+        "default": dict(),
+        "resolution_suggestions": dict(
+            tensions=TensionAnalysis(
+                tensions=[
+                    Tension(
+                        name="Test Tension",
+                        tension_type="contradiction",
+                        description="Test description",
+                        symbolic_interpretation="Test interpretation",
+                        severity=0.5,
+                        locations=[]
+                    )
+                ],
+                resolution_suggestions=[
+                    "The 'Test Tension' calls for integration."
+                ]
+            ),
+        ),
+    }
+
+    reports = {}
+    for key, overrides in inputs.items():
+        kwargs = dict(
+            structure=CodeStructure(function_count=10),
+            profile=SymbolicProfile(),
+            motifs=MotifAnalysis(),
+            tensions=TensionAnalysis(),
+        )
+        kwargs.update(overrides)
+        reports[key] = synthesizer.synthesize(repo_path="/test/repo", **kwargs)
+    return reports
+
+
 class TestInterpretationReport:
     """Tests for InterpretationReport dataclass."""
 
@@ -66,239 +167,25 @@ class TestNarrativeSynthesizer:
         assert report.title == "Dream Interpretation: /test/repo"
         assert report.word_count > 0
 
-    def test_report_contains_header(self):
-        """Test that the report contains a header section with code metrics.
-
-        Verifies that the generated report includes the Oneirocode title
-        and displays file count and line count metrics.
+    @pytest.mark.parametrize("key,needles", [
+        ("header", ["Oneirocode Dream Interpretation", "Files Analyzed", "10", "1,000"]),
+        ("archetypes", ["Dominant Archetypes", "Guardian", "80%"]),
+        ("motifs", ["Recurring Motifs", "Retrieval Pattern"]),
+        ("tensions", ["Unresolved Tensions", "Guardian Who Closes Their Eyes", "contradiction"]),
+        ("psychological_profile", ["Psychological Profile"]),
+        ("default", ["Closing Reflection", "dreamer"]),
+        ("resolution_suggestions", ["Paths Forward"]),
+    ])
+    def test_report_contains_section(self, synthesized_reports, key, needles):
+        """Test that each report section is rendered from its input.
+
+        Verifies that the report synthesized from each input set contains
+        the expected section heading and the values drawn from that input.
         """
-        synthesizer = NarrativeSynthesizer()
-        
-        structure = CodeStructure(
-            file_count=10,
-            total_lines=1000,
-            function_count=50,
-            class_count=5
-        )
-        profile = SymbolicProfile()
-        motifs = MotifAnalysis()
-        tensions = TensionAnalysis()
-        
-        report = synthesizer.synthesize(
-            repo_path="/test/repo",
-            structure=structure,
-            profile=profile,
-            motifs=motifs,
-            tensions=tensions
-        )
-        
-        # Should contain header with metrics
-        assert "Oneirocode Dream Interpretation" in report.content
-        assert "Files Analyzed" in report.content
-        assert "10" in report.content
-        assert "1,000" in report.content
-
-    def test_report_contains_archetypes(self):
-        """Test that the report includes archetype information.
+        content = synthesized_reports[key].content
 
-        Verifies that when a symbolic profile contains dominant archetypes,
-        the report displays them with their names and strength percentages.
-        """
-        synthesizer = NarrativeSynthesizer()
-        
-        structure = CodeStructure(function_count=10)
-        profile = SymbolicProfile(
-            dominant_archetypes=[
-                ArchetypeMatch(
-                    archetype=Archetype.GUARDIAN,
-                    strength=0.8,
-                    evidence=["High validation ratio"],
-                    locations=[("test.py", 10)]
-                )
-            ]
-        )
-        motifs = MotifAnalysis()
-        tensions = TensionAnalysis()
-        
-        report = synthesizer.synthesize(
-            repo_path="/test/repo",
-            structure=structure,
-            profile=profile,
-            motifs=motifs,
-            tensions=tensions
-        )
-        
-        # Should contain archetype section
-        assert "Dominant Archetypes" in report.content
-        assert "Guardian" in report.content
-        assert "80%" in report.content
-
-    def test_report_contains_motifs(self):
-        """Test that the report includes recurring motif information.
-
-        Verifies that when motif analysis contains detected motifs,
-        the report displays them in a dedicated section.
-        """
-        synthesizer = NarrativeSynthesizer()
-        
-        structure = CodeStructure(function_count=10)
-        profile = SymbolicProfile()
-        motifs = MotifAnalysis(
-            motifs=[
-                Motif(
-                    name="The Retrieval Pattern",
-                    pattern_type="naming",
-                    occurrences=10,
-                    symbolic_meaning="Reaching out to acquire resources.",
-                    examples=[("test.py", 1)],
-                    intensity=0.7
-                )
-            ],
-            rhythm_signature="function-heavy-short-form"
-        )
-        tensions = TensionAnalysis()
-        
-        report = synthesizer.synthesize(
-            repo_path="/test/repo",
-            structure=structure,
-            profile=profile,
-            motifs=motifs,
-            tensions=tensions
-        )
-        
-        # Should contain motif section
-        assert "Recurring Motifs" in report.content
-        assert "Retrieval Pattern" in report.content
-
-    def test_report_contains_tensions(self):
-        """Test that the report includes unresolved tension information.
-
-        Verifies that when tension analysis contains detected tensions,
-        the report displays them with their names and types.
-        """
-        synthesizer = NarrativeSynthesizer()
-        
-        structure = CodeStructure(function_count=10)
-        profile = SymbolicProfile()
-        motifs = MotifAnalysis()
-        tensions = TensionAnalysis(
-            tensions=[
-                Tension(
-                    name="The Guardian Who Closes Their Eyes",
-                    tension_type="contradiction",
-                    description="Guards vigilantly but suppresses errors.",
-                    symbolic_interpretation="A profound contradiction...",
-                    severity=0.7,
-                    locations=[("test.py", 10)]
-                )
-            ],
-            overall_tension_level=0.7
-        )
-        
-        report = synthesizer.synthesize(
-            repo_path="/test/repo",
-            structure=structure,
-            profile=profile,
-            motifs=motifs,
-            tensions=tensions
-        )
-        
-        # Should contain tension section
-        assert "Unresolved Tensions" in report.content
-        assert "Guardian Who Closes Their Eyes" in report.content
-        assert "contradiction" in report.content.lower()
-
-    def test_report_contains_psychological_profile(self):
-        """Test that the report includes a psychological profile section.
-
-        Verifies that when behavioral traits are present in the symbolic
-        profile, the report includes a psychological profile section.
-        """
-        synthesizer = NarrativeSynthesizer()
-        
-        structure = CodeStructure(
-            function_count=10,
-            nesting_depths=[2, 2, 3, 2, 2]
-        )
-        profile = SymbolicProfile(
-            behavioral_traits=["Boundary-focused", "Error-confronting"]
-        )
-        motifs = MotifAnalysis()
-        tensions = TensionAnalysis()
-        
-        report = synthesizer.synthesize(
-            repo_path="/test/repo",
-            structure=structure,
-            profile=profile,
-            motifs=motifs,
-            tensions=tensions
-        )
-        
-        # Should contain psychological profile section
-        assert "Psychological Profile" in report.content
-
-    def test_report_contains_closing(self):
-        """Test that the report includes a closing reflection section.
-
-        Verifies that the generated report ends with a closing reflection
-        that references the dreamer metaphor.
-        """
-        synthesizer = NarrativeSynthesizer()
-        
-        structure = CodeStructure(function_count=10)
-        profile = SymbolicProfile()
-        motifs = MotifAnalysis()
-        tensions = TensionAnalysis()
-        
-        report = synthesizer.synthesize(
-            repo_path="/test/repo",
-            structure=structure,
-            profile=profile,
-            motifs=motifs,
-            tensions=tensions
-        )
-        
-        # Should contain closing section
-        assert "Closing Reflection" in report.content
-        assert "dreamer" in report.content.lower()
-
-    def test_report_contains_resolution_suggestions(self):
-        """Test that the report includes resolution suggestions for tensions.
-
-        Verifies that when tension analysis includes resolution suggestions,
-        the report displays them in a 'Paths Forward' section.
-        """
-        synthesizer = NarrativeSynthesizer()
-        
-        structure = CodeStructure(function_count=10)
-        profile = SymbolicProfile()
-        motifs = MotifAnalysis()
-        tensions = TensionAnalysis(
-            tensions=[
-                Tension(
-                    name="Test Tension",
-                    tension_type="contradiction",
-                    description="Test description",
-                    symbolic_interpretation="Test interpretation",
-                    severity=0.5,
-                    locations=[]
-                )
-            ],
-            resolution_suggestions=[
-                "The 'Test Tension' calls for integration."
-            ]
-        )
-        
-        report = synthesizer.synthesize(
-            repo_path="/test/repo",
-            structure=structure,
-            profile=profile,
-            motifs=motifs,
-            tensions=tensions
-        )
-        
-        # Should contain resolution suggestions
-        assert "Paths Forward" in report.content
+        for needle in needles:
+            assert needle in content
 
     def test_strength_bar_creation(self):
         """Test the strength bar visual representation helper method.
@@ -312,31 +199,17 @@ class TestNarrativeSynthesizer:
         bar_half = synthesizer._create_strength_bar(0.5)
         bar_empty = synthesizer._create_strength_bar(0.0)
         
-        assert "█" in bar_full
-        assert "░" in bar_empty
-        assert bar_half.count("█") == 5
-        assert bar_half.count("░") == 5
+        assert bar_full == "[" + "█" * 10 + "]"
+        assert bar_half == "[" + "█" * 5 + "░" * 5 + "]"
+        assert bar_empty == "[" + "░" * 10 + "]"
 
-    def test_word_count_accuracy(self):
+    def test_word_count_accuracy(self, synthesized_reports):
         """Test that the report word count is accurate.
 
         Verifies that the word_count field in the report matches the actual
         number of words in the content and exceeds a minimum threshold.
         """
-        synthesizer = NarrativeSynthesizer()
-        
-        structure = CodeStructure(function_count=10)
-        profile = SymbolicProfile()
-        motifs = MotifAnalysis()
-        tensions = TensionAnalysis()
-        
-        report = synthesizer.synthesize(
-            repo_path="/test/repo",
-            structure=structure,
-            profile=profile,
-            motifs=motifs,
-            tensions=tensions
-        )
+        report = synthesized_reports["default"]
         
         # Word count should be reasonable
         assert report.word_count > 100
@@ -2,6 +2,8 @@
 Tests for Symbolic Ontology module.
 """
 
+from itertools import chain
+
 import pytest
 
 from src.oneirocode.symbolic_ontology import (
@@ -20,6 +22,120 @@ from src.oneirocode.ast_parser import (
 )
 
 
+# Pattern records are frozen, so each test wraps these shared tuples in a
+# fresh CodeStructure rather than rebuilding them.
+_VALIDATE_PATTERNS = (
+    NamingPattern("validate_user", "function", "test.py", 1, prefix="validate_"),
+    NamingPattern("validate_input", "function", "test.py", 5, prefix="validate_"),
+    NamingPattern("validate_data", "function", "test.py", 10, prefix="validate_"),
+)
+
+_BUILDER_PATTERNS = (
+    NamingPattern("create_user", "function", "test.py", 1, prefix="create_"),
+    NamingPattern("build_config", "function", "test.py", 5, prefix="build_"),
+    NamingPattern("make_request", "function", "test.py", 10, prefix="make_"),
+)
+
+_HANDLER_PATTERNS = (
+    NamingPattern("UserHandler", "class", "test.py", 1, suffix="_handler"),
+    NamingPattern("DataHandler", "class", "test.py", 10, suffix="_handler"),
+    NamingPattern("RequestHandler", "class", "test.py", 20, suffix="_handler"),
+)
+
+_GUARD_CLAUSES = (
+    GuardClause("test.py", 1, "x is None", "return", "func1"),
+    GuardClause("test.py", 10, "not valid", "raise", "func2"),
+    GuardClause("test.py", 20, "len(x) == 0", "return", "func3"),
+    GuardClause("test.py", 30, "error", "raise", "func4"),
+    GuardClause("test.py", 40, "invalid", "return", "func5"),
+)
+
+_SUPPRESS_HANDLERS = (
+    ErrorHandler("test.py", 1, ["Exception"], "suppress", "func1"),
+    ErrorHandler("test.py", 10, ["Exception"], "suppress", "func2"),
+    ErrorHandler("test.py", 20, ["Exception"], "suppress", "func3"),
+    ErrorHandler("test.py", 30, ["Exception"], "suppress", "func4"),
+    ErrorHandler("test.py", 40, ["Exception"], "suppress", "func5"),
+)
+
+_DEFENSIVE_PATTERNS = (
+    DefensivePattern("test.py", 1, "null_check", "x is None"),
+    DefensivePattern("test.py", 5, "type_check", "isinstance(x, str)"),
+    DefensivePattern("test.py", 10, "null_check", "y is None"),
+    DefensivePattern("test.py", 15, "assertion", "assert x"),
+    DefensivePattern("test.py", 20, "null_check", "z is None"),
+    DefensivePattern("test.py", 25, "type_check", "isinstance(y, int)"),
+)
+
+
+# Each case builds a structure that should surface at least one of the
+# expected archetypes among the dominant or secondary matches.
+_ARCHETYPE_CASES = [
+    pytest.param(
+        lambda: CodeStructure(
+            naming_patterns=list(_BUILDER_PATTERNS),
+            function_count=3
+        ),
+        {Archetype.BUILDER, Archetype.FACTORY},
+        id="builder_prefixes",
+    ),
+    pytest.param(
+        lambda: CodeStructure(
+            naming_patterns=list(_HANDLER_PATTERNS),
+            function_count=0,
+            class_count=3
+        ),
+        {Archetype.HELPER},
+        id="handler_suffixes",
+    ),
+    pytest.param(
+        lambda: CodeStructure(
+            guard_clauses=list(_GUARD_CLAUSES),
+            function_count=10  # 50% guard ratio
+        ),
+        {Archetype.ANXIOUS_CARETAKER, Archetype.GATEKEEPER},
+        id="high_guard_ratio",
+    ),
+    pytest.param(
+        lambda: CodeStructure(
+            error_handlers=list(_SUPPRESS_HANDLERS),
+            function_count=10
+        ),
+        {Archetype.SUPPRESSOR, Archetype.DENIER},
+        id="error_suppression",
+    ),
+    pytest.param(
+        lambda: CodeStructure(
+            nesting_depths=[5, 6, 7, 5, 6],  # Average > 4
+            function_count=5
+        ),
+        {Archetype.LABYRINTH_DWELLER},
+        id="deep_nesting",
+    ),
+    pytest.param(
+        lambda: CodeStructure(
+            nesting_depths=[1, 1, 2, 1, 1, 2, 1, 1, 1, 1, 1, 1],  # Average < 2
+            function_count=12
+        ),
+        {Archetype.MINIMALIST},
+        id="flat_structure",
+    ),
+]
+
+
+def _archetype_set(profile):
+    """Collect the dominant and secondary archetypes of a profile.
+
+    Args:
+        profile: The SymbolicProfile to inspect.
+
+    Returns:
+        Set of Archetype members matched at either level.
+    """
+    return ({a.archetype for a in profile.dominant_archetypes}
+            | {a.archetype for a in profile.secondary_archetypes})
+
+
 class TestArchetype:
     """Tests for Archetype enum."""
 
@@ -72,148 +188,73 @@ class TestSymbolicOntology:
         """
         ontology = SymbolicOntology()
         structure = CodeStructure(
-            naming_patterns=[
-                NamingPattern("validate_user", "function", "test.py", 1, prefix="validate_"),
-                NamingPattern("validate_input", "function", "test.py", 5, prefix="validate_"),
-                NamingPattern("validate_data", "function", "test.py", 10, prefix="validate_"),
-            ],
+            naming_patterns=list(_VALIDATE_PATTERNS),
             function_count=3
         )
         
         profile = ontology.analyze(structure)
         
         # Guardian should be detected due to validate_ prefix
-        archetype_names = [a.archetype for a in profile.dominant_archetypes]
-        assert Archetype.GUARDIAN in archetype_names
-
-    def test_analyze_naming_patterns_builder(self):
-        """Test that create/build/make prefixed functions detect Builder archetype.
-
-        Creates a CodeStructure with construction-related function names and
-        verifies that Builder or Factory archetype is identified.
-        """
-        ontology = SymbolicOntology()
-        structure = CodeStructure(
-            naming_patterns=[
-                NamingPattern("create_user", "function", "test.py", 1, prefix="create_"),
-                NamingPattern("build_config", "function", "test.py", 5, prefix="build_"),
-                NamingPattern("make_request", "function", "test.py", 10, prefix="make_"),
-            ],
-            function_count=3
-        )
-        
-        profile = ontology.analyze(structure)
-        
-        # Builder/Factory archetypes should be detected
-        archetype_names = [a.archetype for a in profile.dominant_archetypes + profile.secondary_archetypes]
-        assert Archetype.BUILDER in archetype_names or Archetype.FACTORY in archetype_names
+        assert any(a.archetype is Archetype.GUARDIAN for a in profile.dominant_archetypes)
 
-    def test_analyze_suffix_patterns(self):
-        """Test that _handler suffixed classes detect the Helper archetype.
+    def test_repeated_evidence_is_recorded_once(self):
+        """Test that identical evidence accumulates score but not duplicates.
 
-        Creates a CodeStructure with handler classes and verifies that
-        the Helper archetype is identified based on suffix patterns.
+        Verifies that each matching pattern adds to the strength and its
+        location, while the evidence text appears only once.
         """
         ontology = SymbolicOntology()
         structure = CodeStructure(
             naming_patterns=[
-                NamingPattern("UserHandler", "class", "test.py", 1, suffix="_handler"),
-                NamingPattern("DataHandler", "class", "test.py", 10, suffix="_handler"),
-                NamingPattern("RequestHandler", "class", "test.py", 20, suffix="_handler"),
+                NamingPattern(f"validate_{i}", "function", "test.py", i, prefix="validate_")
+                for i in range(4)
             ],
-            function_count=0,
-            class_count=3
+            function_count=4
         )
         
         profile = ontology.analyze(structure)
         
-        # Helper archetype should be detected due to _handler suffix
-        archetype_names = [a.archetype for a in profile.dominant_archetypes + profile.secondary_archetypes]
-        assert Archetype.HELPER in archetype_names
+        guardian = next(a for a in profile.dominant_archetypes if a.archetype is Archetype.GUARDIAN)
+        assert guardian.strength == pytest.approx(0.4)
+        assert guardian.evidence == ["Naming pattern with prefix 'validate_'"]
+        assert guardian.locations == [("test.py", i) for i in range(4)]
 
-    def test_analyze_guard_clauses_high_ratio(self):
-        """Test that high guard clause ratio detects Anxious Caretaker archetype.
+    def test_evidence_and_locations_are_capped(self):
+        """Test that large codebases keep bounded evidence per archetype.
 
-        Creates a CodeStructure with 50% guard clause ratio and verifies that
-        either Anxious Caretaker or Gatekeeper archetype is identified.
+        Verifies that strength reflects every guard clause while only the
+        first distinct evidence strings and locations are retained.
         """
         ontology = SymbolicOntology()
         structure = CodeStructure(
             guard_clauses=[
-                GuardClause("test.py", 1, "x is None", "return", "func1"),
-                GuardClause("test.py", 10, "not valid", "raise", "func2"),
-                GuardClause("test.py", 20, "len(x) == 0", "return", "func3"),
-                GuardClause("test.py", 30, "error", "raise", "func4"),
-                GuardClause("test.py", 40, "invalid", "return", "func5"),
+                GuardClause("test.py", i, "x is None", "return", f"func{i}")
+                for i in range(50)
             ],
-            function_count=10  # 50% guard ratio
+            function_count=50
         )
         
         profile = ontology.analyze(structure)
         
-        # Anxious caretaker or gatekeeper should be detected
-        archetype_names = [a.archetype for a in profile.dominant_archetypes + profile.secondary_archetypes]
-        assert Archetype.ANXIOUS_CARETAKER in archetype_names or Archetype.GATEKEEPER in archetype_names
-
-    def test_analyze_error_suppression(self):
-        """Test that error suppression patterns detect the Suppressor archetype.
-
-        Creates a CodeStructure with multiple suppressed error handlers and
-        verifies that Suppressor or Denier archetype is identified.
+        matches = chain(profile.dominant_archetypes, profile.secondary_archetypes)
+        guardian = next(a for a in matches if a.archetype is Archetype.GUARDIAN)
+        assert guardian.strength == 1.0
+        assert guardian.evidence == [f"Guard clause in func{i}" for i in range(20)]
+        assert guardian.locations == [("test.py", i) for i in range(10)]
+
+    @pytest.mark.parametrize("make_structure,expected", _ARCHETYPE_CASES)
+    def test_analyze_detects_archetype(self, make_structure, expected):
+        """Test that characteristic structures surface their archetypes.
+
+        Builds a CodeStructure dominated by one kind of pattern and verifies
+        that at least one of the expected archetypes is among the dominant
+        or secondary archetypes.
         """
         ontology = SymbolicOntology()
-        structure = CodeStructure(
-            error_handlers=[
-                ErrorHandler("test.py", 1, ["Exception"], "suppress", "func1"),
-                ErrorHandler("test.py", 10, ["Exception"], "suppress", "func2"),
-                ErrorHandler("test.py", 20, ["Exception"], "suppress", "func3"),
-                ErrorHandler("test.py", 30, ["Exception"], "suppress", "func4"),
-                ErrorHandler("test.py", 40, ["Exception"], "suppress", "func5"),
-            ],
-            function_count=10
-        )
-        
-        profile = ontology.analyze(structure)
-        
-        # Suppressor archetype should be detected
-        archetype_names = [a.archetype for a in profile.dominant_archetypes + profile.secondary_archetypes]
-        assert Archetype.SUPPRESSOR in archetype_names or Archetype.DENIER in archetype_names
-
-    def test_analyze_deep_nesting(self):
-        """Test that deep nesting patterns detect the Labyrinth Dweller archetype.
-
-        Creates a CodeStructure with average nesting depth greater than 4 and
-        verifies that Labyrinth Dweller archetype is identified.
-        """
-        ontology = SymbolicOntology()
-        structure = CodeStructure(
-            nesting_depths=[5, 6, 7, 5, 6],  # Average > 4
-            function_count=5
-        )
-        
-        profile = ontology.analyze(structure)
-        
-        # Labyrinth dweller should be detected
-        archetype_names = [a.archetype for a in profile.dominant_archetypes + profile.secondary_archetypes]
-        assert Archetype.LABYRINTH_DWELLER in archetype_names
-
-    def test_analyze_flat_structure(self):
-        """Test that flat code structure detects the Minimalist archetype.
-
-        Creates a CodeStructure with average nesting depth less than 2 and
-        verifies that Minimalist archetype is identified.
-        """
-        ontology = SymbolicOntology()
-        structure = CodeStructure(
-            nesting_depths=[1, 1, 2, 1, 1, 2, 1, 1, 1, 1, 1, 1],  # Average < 2
-            function_count=12
-        )
         
-        profile = ontology.analyze(structure)
+        profile = ontology.analyze(make_structure())
         
-        # Minimalist should be detected
-        archetype_names = [a.archetype for a in profile.dominant_archetypes + profile.secondary_archetypes]
-        assert Archetype.MINIMALIST in archetype_names
+        assert _archetype_set(profile) & expected
 
     def test_behavioral_traits_error_avoidant(self):
         """Test that error suppression patterns produce Error-avoidant trait.
@@ -245,14 +286,7 @@ class TestSymbolicOntology:
         """
         ontology = SymbolicOntology()
         structure = CodeStructure(
-            defensive_patterns=[
-                DefensivePattern("test.py", 1, "null_check", "x is None"),
-                DefensivePattern("test.py", 5, "type_check", "isinstance(x, str)"),
-                DefensivePattern("test.py", 10, "null_check", "y is None"),
-                DefensivePattern("test.py", 15, "assertion", "assert x"),
-                DefensivePattern("test.py", 20, "null_check", "z is None"),
-                DefensivePattern("test.py", 25, "type_check", "isinstance(y, int)"),
-            ],
+            defensive_patterns=list(_DEFENSIVE_PATTERNS),
             function_count=10
         )
         
@@ -261,6 +295,26 @@ class TestSymbolicOntology:
         # Should have hyper-vigilant trait
         assert "Hyper-vigilant" in profile.behavioral_traits
 
+    def test_repeated_analyze_sees_replaced_patterns(self):
+        """Test that analyzing a structure again reflects in-place edits.
+
+        Verifies that replacing a guard clause without changing any list
+        length still changes the profile of the same structure object.
+        """
+        ontology = SymbolicOntology()
+        structure = CodeStructure(
+            guard_clauses=[GuardClause("test.py", 1, "x is None", "raise", "func")],
+            function_count=1
+        )
+        
+        ontology.analyze(structure)
+        structure.guard_clauses[0] = GuardClause("test.py", 9, "y is None", "raise", "other")
+        profile = ontology.analyze(structure)
+        
+        matches = chain(profile.dominant_archetypes, profile.secondary_archetypes)
+        guardian = next(a for a in matches if a.archetype is Archetype.GUARDIAN)
+        assert guardian.locations == [("test.py", 9)]
+
 
 class TestArchetypeMatch:
     """Tests for ArchetypeMatch dataclass."""
@@ -278,41 +332,37 @@ class TestArchetypeMatch:
             locations=[("test.py", 10)]
         )
         
-        assert match.archetype == Archetype.GUARDIAN
+        assert match.archetype is Archetype.GUARDIAN
         assert match.strength == 0.8
         assert len(match.evidence) == 1
         assert len(match.locations) == 1
 
+    def test_profile_types_have_no_instance_dict(self):
+        """Test that ArchetypeMatch and SymbolicProfile use slots.
 
-class TestGetArchetypeDescription:
-    """Tests for get_archetype_description function."""
-
-    def test_guardian_description(self):
-        """Test that Guardian archetype has appropriate description keywords.
-
-        Verifies the description contains 'Guardian' and mentions protective
-        or threshold-related concepts.
+        Verifies that no per-instance __dict__ is allocated.
         """
-        desc = get_archetype_description(Archetype.GUARDIAN)
-        assert "Guardian" in desc
-        assert "protective" in desc.lower() or "threshold" in desc.lower()
+        match = ArchetypeMatch(Archetype.GUARDIAN, 0.8, [], [])
+        
+        assert not hasattr(match, "__dict__")
+        assert not hasattr(SymbolicProfile(), "__dict__")
 
-    def test_suppressor_description(self):
-        """Test that Suppressor archetype has appropriate description keywords.
 
-        Verifies the description contains 'Suppressor' and mentions error
-        or silence-related concepts.
-        """
-        desc = get_archetype_description(Archetype.SUPPRESSOR)
-        assert "Suppressor" in desc
-        assert "error" in desc.lower() or "silence" in desc.lower()
+class TestGetArchetypeDescription:
+    """Tests for get_archetype_description function."""
 
-    def test_builder_description(self):
-        """Test that Builder archetype has appropriate description keywords.
+    @pytest.mark.parametrize("archetype,name,keywords", [
+        (Archetype.GUARDIAN, "Guardian", ("protective", "threshold")),
+        (Archetype.SUPPRESSOR, "Suppressor", ("error", "silence")),
+        (Archetype.BUILDER, "Builder", ("create", "structure")),
+    ])
+    def test_description_keywords(self, archetype, name, keywords):
+        """Test that archetype descriptions carry their name and themes.
 
-        Verifies the description contains 'Builder' and mentions creation
-        or structure-related concepts.
+        Verifies the description contains the archetype's name and mentions
+        at least one of the concepts associated with it.
         """
-        desc = get_archetype_description(Archetype.BUILDER)
-        assert "Builder" in desc
-        assert "create" in desc.lower() or "structure" in desc.lower()
+        desc = get_archetype_description(archetype)
+        low = desc.lower()
+        assert name in desc
+        assert any(keyword in low for keyword in keywords)